@@ -0,0 +1,70 @@
+# ======================================================================================================================
+# Name:                 Fitting Benchmark Module 'benchmark_fitting.py'
+# Description:          1. This module compares 'batched_fit' with fitting one column at a time with 'curve_fit'.
+#                       2. The data are tanh magnetization curves with noise, one column per J, so the fitted
+#                          parameters can be checked against 'curve_fit'.
+#                       3. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_fitting' from the project
+#                          root.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+#                       3. scipy ("https://scipy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to build synthetic magnetization curves ---------------------------------------------------
+def synthetic_magnetization(n_columns, n_h=101, noise=0.005, seed=0):
+    # Returns h and the (columns, h) array of tanh curves whose step moves and sharpens from column to column.
+    from Function_Tools.PostProcessing_Module.fitting_module import tanh_model
+    rng = np.random.default_rng(seed)
+    h_values = np.linspace(0, 6, n_h)
+    b = np.linspace(1, 4, n_columns)
+    param = np.stack([np.full(n_columns, 0.25), b, b * np.linspace(1, 5, n_columns), np.full(n_columns, 0.25)], axis=1)
+    msz = tanh_model(h_values[None, :], *[param[:, k, None] for k in range(4)])
+    return h_values, msz + noise * rng.normal(size=msz.shape)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to time both fitters ----------------------------------------------------------------------
+def benchmark_fitting(column_counts=(10, 100, 300), write_to_file=True):
+    from scipy.optimize import curve_fit
+    from Function_Tools.PostProcessing_Module.fitting_module import batched_fit, tanh_model, tanh_guess
+    rows = []
+    for n_columns in column_counts:
+        h_values, msz = synthetic_magnetization(n_columns=n_columns)
+        start = time.perf_counter()
+        param_ref = np.array([curve_fit(tanh_model, h_values, msz[c], p0=tanh_guess(h_values, msz[c:c + 1])[0])[0]
+                              for c in range(n_columns)])
+        time_loop = time.perf_counter() - start
+        start = time.perf_counter()
+        param, param_cov, info = batched_fit(tanh_model, h_values, msz, p0=tanh_guess)
+        time_batched = time.perf_counter() - start
+        rows.append({'columns': n_columns, 'curve_fit_s': time_loop, 'batched_s': time_batched,
+                     'speedup': time_loop / time_batched, 'converged': int(info['converged'].sum()),
+                     'max_rel_param_diff': np.max(np.abs(param - param_ref) / np.abs(param_ref))})
+    benchmark_df = pd.DataFrame(rows)
+    print(benchmark_df.to_string(index=False))
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "fitting.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_fitting()
+# ======================================================================================================================
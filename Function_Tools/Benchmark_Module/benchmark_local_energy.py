@@ -0,0 +1,94 @@
+# ======================================================================================================================
+# Name:                 Local Energy Benchmark Module 'benchmark_local_energy.py'
+# Description:          1. This module measures the local energy throughput of the Hamiltonian of 'hamiltonian.py' as a
+#                          'LocalOperator' and as a 'DiagonalOperator', on square lattices up to a few thousand sites.
+#                       2. The local energies are computed the way NetKet computes them for an expectation value:
+#                          kernel arguments from the samples (connected elements for 'LocalOperator') and the kernel.
+#                       3. The model is a one parameter per site product state, so the time is dominated by the
+#                          operator and not by the network.
+#                       4. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_local_energy' from the project
+#                          root.
+# Library Dependencies: 1. netket ("https://netket.readthedocs.io/")
+#                       2. jax ("https://jax.readthedocs.io/")
+#                       3. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to time the local energies of one operator ------------------------------------------------
+def time_local_energy(vstate, op, repeats=5):
+    # Returns the best time of 'repeats' evaluations on the cached samples and the local energies.
+    import jax
+    from netket.vqs import get_local_kernel, get_local_kernel_arguments
+    kernel = jax.jit(get_local_kernel(vstate, op), static_argnums=0)
+    samples = vstate.samples.reshape(-1, vstate.hilbert.size)
+
+    def logpsi(pars, x):
+        return vstate._apply_fun({'params': pars, **vstate.model_state}, x)
+
+    times = []
+    for repeat in range(repeats + 1):
+        start = time.perf_counter()
+        samples_, arguments = get_local_kernel_arguments(vstate, op)
+        local_energy = kernel(logpsi, vstate.parameters, samples, arguments).block_until_ready()
+        times.append(time.perf_counter() - start)
+    # The first evaluation includes the compilation.
+    return min(times[1:]), np.asarray(local_energy)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to compare both operators on growing lattices ---------------------------------------------
+def benchmark_local_energy(lengths=(4, 8, 16, 32, 64), n_samples=1024, J=-1.0, h=0.5, write_to_file=True):
+    import netket as nk
+    import flax.linen as nn
+    import jax.numpy as jnp
+    from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+
+    class ProductState(nn.Module):
+        @nn.compact
+        def __call__(self, x):
+            weights = self.param('weights', nn.initializers.normal(0.1), (x.shape[-1],))
+            return jnp.sum(x * weights, axis=-1)
+
+    rows = []
+    for length in lengths:
+        graph = nk.graph.Hypercube(length=length, n_dim=2, pbc=True)
+        hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+        vstate = nk.vqs.MCState(nk.sampler.MetropolisLocal(hilbert), ProductState(), n_samples=n_samples, seed=0)
+        vstate.samples
+        local_energies = {}
+        for operator in ["local", "diagonal"]:
+            start = time.perf_counter()
+            op = ParametricHamiltonian(hilbert=hilbert, graph=graph, operator=operator)(J=J, h=h)
+            build_time = time.perf_counter() - start
+            elapsed, local_energies[operator] = time_local_energy(vstate, op)
+            rows.append({'sites': graph.n_nodes, 'operator': operator, 'build_s': build_time, 'time_s': elapsed,
+                         'samples_per_s': n_samples / elapsed})
+        rows[-1]['max_abs_diff'] = np.max(np.abs(local_energies["local"] - local_energies["diagonal"]))
+    benchmark_df = pd.DataFrame(rows)
+    benchmark_df['speedup'] = benchmark_df['samples_per_s'] / np.repeat(benchmark_df['samples_per_s'].values[::2], 2)
+    print(benchmark_df.to_string(index=False))
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "local_energy.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_local_energy()
+# ======================================================================================================================
@@ -0,0 +1,102 @@
+# ======================================================================================================================
+# Name:                 Observable Benchmark Module 'benchmark_observables.py'
+# Description:          1. This module measures the time the observables add to a VMC iteration.
+#                       2. "all, local": every observable on every iteration as 'LocalOperator', like 'run(obs=...)'.
+#                       3. "all, diagonal": the same with MSZ as 'DiagonalOperator', computed from the samples.
+#                       4. "schedule": MSZ (diagonal) on every iteration, the others only in the averaging window of the
+#                          last 'n_values' iterations (see observable_schedule.py).
+#                       5. The overhead is the time per iteration above a run without observables.
+#                       6. A second table times one expectation value of every observable as 'LocalOperator' and, for
+#                          the diagonal MSZ, as 'DiagonalOperator'.
+#                       7. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_observables' from the project
+#                          root.
+# Library Dependencies: 1. netket ("https://netket.readthedocs.io/")
+#                       2. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to time the observables of a VMC run ------------------------------------------------------
+def benchmark_observables(length=4, n_iter=100, n_values=20, n_samples=512, J=-1.0, h=0.5, repeats=50,
+                          write_to_file=True):
+    import netket as nk
+    from netket.optimizer import SR
+    from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+    from Function_Tools.Netket_module.neural_network import neural_network
+    from Function_Tools.Netket_module.optimizer import optimizer
+    from Function_Tools.Observables.observables import ParametricObservables
+    from Function_Tools.Observables.observable_schedule import ObservableSchedule
+    graph = nk.graph.Hypercube(length=length, n_dim=2, pbc=True)
+    hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+    ha = ParametricHamiltonian(hilbert=hilbert, graph=graph, operator="diagonal")(J=J, h=h)
+    model = neural_network(graph=graph)
+    obs_local = ParametricObservables(hilbert=hilbert, graph=graph, operator="local")(J=J)
+    obs_diagonal = ParametricObservables(hilbert=hilbert, graph=graph, operator="diagonal")(J=J)
+    schedule = {'MSX': "window", 'MSY': "window", 'MSZ': 1, 'chi_corrZ': "window"}
+    cases = [('none', {}, None), ('all, local', obs_local, None), ('all, diagonal', obs_diagonal, None),
+             ('schedule', obs_diagonal, schedule)]
+    rows = []
+    for case, obs, case_schedule in cases:
+        vstate = nk.vqs.MCState(nk.sampler.MetropolisLocal(hilbert), model, n_samples=n_samples, seed=0,
+                                sampler_seed=0)
+        gs = nk.driver.VMC(hamiltonian=ha, optimizer=optimizer(), variational_state=vstate,
+                           preconditioner=SR(diag_shift=0.01))
+        callback = ObservableSchedule(obs=obs, schedule=case_schedule or {}, window_start=n_iter - n_values)
+        # A short run first, so the compilation is not timed.
+        gs.run(n_iter=2, out=None, obs={}, callback=ObservableSchedule(obs=obs, schedule={}, window_start=0),
+               show_progress=False)
+        start = time.perf_counter()
+        gs.run(n_iter=n_iter, out=None, obs={}, callback=callback, show_progress=False)
+        elapsed = time.perf_counter() - start
+        rows.append({'case': case, 'evaluations': sum(callback.n_evaluated.values()), 'time_s': elapsed,
+                     'per_iteration_ms': 1e3 * elapsed / n_iter})
+    benchmark_df = pd.DataFrame(rows)
+    benchmark_df['overhead_ms'] = benchmark_df['per_iteration_ms'] - benchmark_df['per_iteration_ms'].iloc[0]
+    benchmark_df['overhead_reduction'] = benchmark_df['overhead_ms'].iloc[1] / benchmark_df['overhead_ms']
+    benchmark_df.loc[0, 'overhead_reduction'] = np.nan
+    print(f"{graph.n_nodes} sites, {n_samples} samples, {n_iter} iterations, n_values = {n_values}")
+    print(benchmark_df.to_string(index=False))
+
+    # ----- Timing single expectation values ---------------------------------------------------------------------------
+    rows, timed = [], set()
+    for obs in [obs_local, obs_diagonal]:
+        for name, op in obs.items():
+            # Only MSZ differs between the two observable sets.
+            if (name, type(op).__name__) in timed:
+                continue
+            timed.add((name, type(op).__name__))
+            vstate.expect(op)
+            start = time.perf_counter()
+            for repeat in range(repeats):
+                vstate.expect(op).mean.block_until_ready()
+            expect_time = (time.perf_counter() - start) / repeats
+            rows.append({'observable': name, 'operator': type(op).__name__, 'expect_ms': 1e3 * expect_time})
+    expect_df = pd.DataFrame(rows)
+    print(expect_df.to_string(index=False))
+    # ------------------------------------------------------------------------------------------------------------------
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "observables.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False) + "\n\n")
+            benchmark_file.write(expect_df.to_string(header=True, index=False))
+    return benchmark_df, expect_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_observables()
+# ======================================================================================================================
@@ -0,0 +1,130 @@
+# ======================================================================================================================
+# Name:                 Plotting Benchmark Module 'benchmark_plotting.py'
+# Description:          1. This module measures the total plotting time of a sweep with the old and the new plot code.
+#                       2. "pyplot": 'parsed_data_plot' for every point and 'plot_J_based_parsed_data', as before.
+#                       3. The other cases render the same plots with 'plot_renderer.py', in one or several processes,
+#                          bundled into multi-page PDFs or as PNG files.
+#                       4. The last cases refresh the plots with the plot cache: once without changes and once after one
+#                          J column of the sweep changed.
+#                       5. The sweep is synthetic (random traces), so no simulation is needed.
+#                       6. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_plotting' from the project
+#                          root.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+#                       3. matplotlib ("https://matplotlib.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+import os
+import shutil
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to build a synthetic sweep ----------------------------------------------------------------
+def synthetic_sweep(n_J, n_h, n_iter, fields, seed=0):
+    # Returns [(j, h, parsed_data)] and the J parsed DataFrames {field: DataFrame} of the sweep.
+    rng = np.random.default_rng(seed)
+    J_values, h_values = np.linspace(-1, -2, n_J), np.linspace(0, 6, n_h)
+    points = []
+    for j in J_values:
+        for h in h_values:
+            parsed_data = pd.DataFrame({'iters': np.arange(n_iter)})
+            for item in fields:
+                parsed_data[item] = np.cumsum(rng.normal(size=n_iter)) / np.sqrt(n_iter)
+            points.append((j, h, parsed_data))
+    J_parsed = {}
+    for k, item in enumerate(fields):
+        columns = {'#h': h_values}
+        for j_index, j in enumerate(J_values):
+            columns['j=' + str(j)] = [np.mean(points[j_index * n_h + h_index][2][item][-20:]) for h_index in range(n_h)]
+        J_parsed[item] = pd.DataFrame(columns)
+    return points, J_parsed
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to time the plotting of a synthetic sweep -------------------------------------------------
+def benchmark_plotting(n_J=3, n_h=20, n_iter=300, n_workers=None, write_to_file=True):
+    # The default grid of parameters.py is n_J = 3, n_h = 101. 'n_workers' defaults to the number of CPUs.
+    import matplotlib
+    matplotlib.use('Agg')
+    import parameters
+    from Function_Tools.FileWriting_GraphPloting_Module.graph_module import parsed_data_plot, plot_J_based_parsed_data
+    from Function_Tools.FileWriting_GraphPloting_Module.plot_renderer import trace_jobs, J_parsed_jobs, render_jobs
+    if n_workers is None:
+        n_workers = os.cpu_count()
+    fields = ['Energy', 'MSX', 'MSY', 'MSZ', 'chi_corrZ']
+    points, J_parsed = synthetic_sweep(n_J=n_J, n_h=n_h, n_iter=n_iter, fields=fields)
+    path = os.path.join(parameters.path_results, "benchmarks/plotting/")
+    input_path = os.path.join(path, 'J_parsed_files/')
+    os.makedirs(input_path, exist_ok=True)
+    for item, df in J_parsed.items():
+        with open(os.path.join(input_path, item + '.txt'), 'w') as J_parsed_file:
+            J_parsed_file.write(df.to_string(header=True, index=False))
+    cases = [('pyplot', 'none', 'pdf', 1), ('renderer', 'none', 'pdf', 1), ('renderer', 'none', 'pdf', n_workers),
+             ('renderer', 'J', 'pdf', n_workers), ('renderer', 'observable', 'pdf', n_workers),
+             ('renderer', 'none', 'png', n_workers)]
+    rows = []
+    for code, bundle, plot_format, workers in cases:
+        out_path = os.path.join(path, 'plots/')
+        shutil.rmtree(out_path, ignore_errors=True)
+        # The plot paths are read from the parameters module when the jobs are built, so they are redirected here.
+        parameters.parsed_data_plot_path = os.path.join(out_path, 'parsed_data_plots/')
+        parameters.plot_format = plot_format
+        start = time.perf_counter()
+        if code == 'pyplot':
+            for j, h, parsed_data in points:
+                parsed_data_plot(parsed_data=parsed_data, show_plot=False, save_plot=True, var1=j, var2=h)
+            plot_J_based_parsed_data(input_file_path=input_path, out_file_path=os.path.join(out_path, 'J_parsed/'))
+        else:
+            jobs = trace_jobs(points=points, bundle=bundle)
+            jobs += J_parsed_jobs(input_file_path=input_path, out_file_path=os.path.join(out_path, 'J_parsed/'))
+            render_jobs(jobs, n_workers=workers, use_cache=False)
+        elapsed = time.perf_counter() - start
+        n_files = sum(len(files) for directory, subdirectories, files in os.walk(out_path))
+        rows.append({'code': code, 'bundle': bundle, 'format': plot_format, 'workers': workers, 'files': n_files,
+                     'time_s': elapsed})
+
+    # ----- Refreshing the plots with the plot cache -------------------------------------------------------------------
+    out_path = os.path.join(path, 'plots/')
+    shutil.rmtree(out_path, ignore_errors=True)
+    parameters.parsed_data_plot_path = os.path.join(out_path, 'parsed_data_plots/')
+    parameters.plot_format = 'pdf'
+    # For these cases 'files' is the number of rendered files.
+    for case in ['cache (first run)', 'cache (unchanged)', 'cache (one J changed)']:
+        if case == 'cache (one J changed)':
+            # A re-run of the last J column: its traces and its J parsed column change.
+            for j, h, parsed_data in points[-n_h:]:
+                parsed_data['Energy'] += 1e-3
+            for item, df in J_parsed.items():
+                df[df.columns[-1]] += 1e-3
+                with open(os.path.join(input_path, item + '.txt'), 'w') as J_parsed_file:
+                    J_parsed_file.write(df.to_string(header=True, index=False))
+        start = time.perf_counter()
+        jobs = trace_jobs(points=points, bundle='none')
+        jobs += J_parsed_jobs(input_file_path=input_path, out_file_path=os.path.join(out_path, 'J_parsed/'))
+        n_changed = len(render_jobs(jobs, n_workers=n_workers, use_cache=True, remove_orphans=True))
+        elapsed = time.perf_counter() - start
+        rows.append({'code': case, 'bundle': 'none', 'format': 'pdf', 'workers': n_workers, 'files': n_changed,
+                     'time_s': elapsed})
+    # ------------------------------------------------------------------------------------------------------------------
+    benchmark_df = pd.DataFrame(rows)
+    benchmark_df['speedup'] = benchmark_df['time_s'].iloc[0] / benchmark_df['time_s']
+    print(f"{n_J} x {n_h} points, {n_iter} iterations, {len(fields)} fields, {os.cpu_count()} CPUs")
+    print(benchmark_df.to_string(index=False))
+    if write_to_file is True:
+        with open(os.path.join(path, "plotting.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_plotting()
+# ======================================================================================================================
@@ -0,0 +1,100 @@
+# ======================================================================================================================
+# Name:                 Network Precision Benchmark Module 'benchmark_precision.py'
+# Description:          1. This module compares the network dtypes of 'neural_network.py' (float32, float64, complex64,
+#                          complex128) for the DenseFFNN and DenseFFNN_sym models. The G-CNN can be added with
+#                          'network_types', its SR iterations take tens of seconds on a CPU even on a 4x4 lattice.
+#                       2. Every case is a VMC run with SR at one (J, h) point on a periodic square lattice. The time
+#                          per iteration excludes the compilation, the energy is the mean of the last 'n_values'
+#                          iterations.
+#                       3. The exact ground state energy of the diagonal Hamiltonian of 'hamiltonian.py' on an even
+#                          periodic square lattice is the lowest of the two Neel and the two fully polarized states, so
+#                          it is known on lattices too large for exact diagonalization.
+#                       4. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_precision' from the project
+#                          root.
+# Library Dependencies: 1. netket ("https://netket.readthedocs.io/")
+#                       2. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to return the exact ground state energy on an even periodic square lattice ----------------
+def ground_energy(graph, hilbert, ha):
+    # Lowest diagonal element of the two Neel and the two fully polarized states.
+    up, down = hilbert.local_states[-1], hilbert.local_states[0]
+    sublattice = np.round(np.sum(graph.positions, axis=1)).astype(int) % 2 == 0
+    states = np.array([np.full(graph.n_nodes, up), np.full(graph.n_nodes, down),
+                       np.where(sublattice, up, down), np.where(sublattice, down, up)], dtype=np.float64)
+    return float(np.min(ha.diagonal(states)))
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to compare the network dtypes -------------------------------------------------------------
+def benchmark_precision(lengths=(4, 6), network_types=('DenseFFNN', 'DenseFFNN_sym'),
+                        network_dtypes=('float32', 'float64', 'complex64', 'complex128'), n_iter=150, n_values=20,
+                        n_samples=512, J=-1.0, h=1.0, write_to_file=True):
+    import jax
+    import netket as nk
+    from netket.optimizer import SR
+    from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+    from Function_Tools.Netket_module.neural_network import neural_network
+    from Function_Tools.Netket_module.optimizer import optimizer
+    rows = []
+    for length in lengths:
+        graph = nk.graph.Hypercube(length=length, n_dim=2, pbc=True)
+        hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+        ha = ParametricHamiltonian(hilbert=hilbert, graph=graph, operator="diagonal")(J=J, h=h)
+        exact_energy = ground_energy(graph=graph, hilbert=hilbert, ha=ha)
+        for network_type in network_types:
+            for network_dtype in network_dtypes:
+                model = neural_network(graph=graph, network_type=network_type, network_dtype=network_dtype)
+                vstate = nk.vqs.MCState(nk.sampler.MetropolisLocal(hilbert), model, n_samples=n_samples, seed=0,
+                                        sampler_seed=0)
+                gs = nk.driver.VMC(hamiltonian=ha, optimizer=optimizer(), variational_state=vstate,
+                                   preconditioner=SR(diag_shift=0.01))
+                # The first iterations compile and are not timed.
+                gs.advance(2)
+                jax.block_until_ready(vstate.parameters)
+                energies = []
+                start = time.perf_counter()
+                for step in range(n_iter):
+                    gs.advance(1)
+                    energies.append(float(np.real(gs._loss_stats.mean)))
+                elapsed = time.perf_counter() - start
+                energy = float(np.mean(energies[-n_values:]))
+                parameter_bytes = sum(leaf.nbytes for leaf in jax.tree_util.tree_leaves(vstate.parameters))
+                rows.append({'sites': graph.n_nodes, 'network': network_type, 'dtype': network_dtype,
+                             'parameters': vstate.n_parameters, 'parameter_bytes': parameter_bytes,
+                             'iteration_ms': 1e3 * elapsed / n_iter, 'energy': energy, 'exact_energy': exact_energy,
+                             'rel_error': (energy - exact_energy) / abs(exact_energy)})
+                print(rows[-1])
+    benchmark_df = pd.DataFrame(rows)
+    # Speedup over complex128 of the same lattice and network.
+    reference = benchmark_df[benchmark_df['dtype'] == 'complex128'].set_index(['sites', 'network'])['iteration_ms']
+    benchmark_df['speedup'] = [reference.get((sites, network), np.nan) / iteration_ms for sites, network, iteration_ms
+                               in zip(benchmark_df['sites'], benchmark_df['network'], benchmark_df['iteration_ms'])]
+    print(f"J = {J}, h = {h}, {n_samples} samples, {n_iter} iterations, energy of the last {n_values}")
+    print(benchmark_df.to_string(index=False))
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "precision.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_precision()
+# ======================================================================================================================
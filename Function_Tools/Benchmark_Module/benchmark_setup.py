@@ -0,0 +1,56 @@
+# ======================================================================================================================
+# Name:                 Per Point Setup Benchmark Module 'benchmark_setup.py'
+# Description:          1. This module measures the per point overhead of a sweep before and after 'SimulationContext'.
+#                       2. "before": every point builds a fresh context, as 'hmex' used to do for every (J, h).
+#                       3. "after": every point reuses one context, as the sweep does now.
+#                       4. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_setup' from the project root.
+# Library Dependencies: 1. pandas ("https://pandas.pydata.org/")
+#                       2. time ("https://docs.python.org/3/library/time.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to measure the per point overhead with and without a shared context -----------------------
+def benchmark_setup(n_points=5, n_iter=1, J=-1.0, h_values=None, write_to_file=True):
+    # With n_iter = 1 the wall time of a point is almost entirely setup, JIT compilation and the first iteration.
+    from HMEX import SimulationContext
+    if h_values is None:
+        h_values = [0.06 * i for i in range(n_points)]
+    rows = []
+    for mode in ['before', 'after']:
+        context = SimulationContext()
+        for h in h_values:
+            start = time.perf_counter()
+            if mode == 'before':
+                context = SimulationContext()
+            log, obs_list, vstate, run_info = context.run(J=J, h=h, n_iter=n_iter)
+            rows.append({'mode': mode, 'h': h, 'setup_time_s': run_info['setup_time'],
+                         'point_time_s': time.perf_counter() - start})
+    benchmark_df = pd.DataFrame(rows)
+    # The first point of each mode pays the one-off compilation, so the summary uses the remaining points.
+    summary_df = benchmark_df.groupby('mode', sort=False).apply(lambda df: df.iloc[1:].mean(numeric_only=True))
+    print(summary_df[['setup_time_s', 'point_time_s']])
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "setup_overhead.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_setup()
+# ======================================================================================================================
@@ -0,0 +1,76 @@
+# ======================================================================================================================
+# Name:                 Startup Benchmark Module 'benchmark_startup.py'
+# Description:          1. This module measures the startup time of the command line interface of 'main.py'.
+#                       2. Every case runs in a fresh interpreter, so the import costs are measured as a user sees them.
+#                       3. A case fails if it is slower than the time budget or imports a heavy library (jax, netket,
+#                          matplotlib, scipy) it does not need.
+#                       4. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_startup' from the project
+#                          root.
+# Library Dependencies: 1. pandas ("https://pandas.pydata.org/")
+#                       2. subprocess ("https://docs.python.org/3/library/subprocess.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import pandas as pd
+import os
+import subprocess
+import sys
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# Heavy libraries that are reported per case. The cases with a time budget must not import any of them, the
+# simulation needs them all.
+heavy_modules = ['jax', 'netket', 'matplotlib', 'scipy']
+startup_cases = {
+    'main --help': ("sys.argv = ['main.py', '--help']\nimport main\n"
+                    "try:\n    main.main()\nexcept SystemExit:\n    pass", True),
+    'postprocess imports': ("import main\n"
+                            "from Function_Tools.PostProcessing_Module import PostProcessing", True),
+    'fit imports': ("import main\n"
+                    "from Function_Tools.PostProcessing_Module import fitting_module\n"
+                    "from Function_Tools.FileWriting_GraphPloting_Module import graph_module", True),
+    'simulate imports': ("import main\n"
+                         "import HMEX", False),
+}
+
+
+# ------ Defining a function to time the startup cases -----------------------------------------------------------------
+def benchmark_startup(budget_s=1.0, repeats=3, write_to_file=True):
+    # 'budget_s' applies to the cases without jax and netket. 'time_s' is the best of 'repeats' runs.
+    rows = []
+    for case, (code, budgeted) in startup_cases.items():
+        report = "\nprint('heavy_imports:' + ','.join(m for m in %r if m in sys.modules))" % heavy_modules
+        times = []
+        for repeat in range(repeats):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, '-c', 'import sys\n' + code + report], capture_output=True,
+                                    text=True, check=True).stdout
+            times.append(time.perf_counter() - start)
+        loaded = output.split('heavy_imports:')[-1].strip()
+        within_budget = None
+        if budgeted:
+            within_budget = min(times) <= budget_s and loaded == ''
+        rows.append({'case': case, 'time_s': min(times), 'heavy_imports': loaded.replace(',', ' ') or '-',
+                     'within_budget': within_budget})
+    benchmark_df = pd.DataFrame(rows)
+    print(benchmark_df.to_string(index=False))
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "startup.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    benchmark_startup()
+# ======================================================================================================================
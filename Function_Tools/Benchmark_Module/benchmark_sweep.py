@@ -0,0 +1,53 @@
+# ======================================================================================================================
+# Name:                 Sweep Scaling Benchmark Module 'benchmark_sweep.py'
+# Description:          1. This module measures the throughput of the sweep executor against the number of workers.
+#                       2. Run it as 'python -m Function_Tools.Benchmark_Module.benchmark_sweep' from the project root.
+# Library Dependencies: 1. pandas ("https://pandas.pydata.org/")
+#                       2. time ("https://docs.python.org/3/library/time.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import pandas as pd
+import os
+import time
+# ======================================================================================================================
+
+# ====== Benchmark Functions ===========================================================================================
+# ------ Defining a function to measure points per hour for different worker counts ------------------------------------
+def benchmark_sweep(worker_counts=(1, 2, 4, 8), n_points=16, write_to_file=True):
+    from Function_Tools.Sweep_Module.sweep_executor import parameter_grid, sweep_executor
+    J_ex_list, h_ex_list = parameter_grid()
+    # Only the first J value and the first 'n_points' h values are used, so every worker count runs the same points.
+    J_ex_list = J_ex_list[:1]
+    h_ex_list = h_ex_list[:n_points]
+    benchmark_df = pd.DataFrame()
+    wall_times = []
+    for n_workers in worker_counts:
+        start = time.perf_counter()
+        sweep_executor(J_ex_list=J_ex_list, h_ex_list=h_ex_list, n_workers=n_workers, show_progress_bar=False)
+        wall_times.append(time.perf_counter() - start)
+        print(f"workers = {n_workers:3d}: {len(h_ex_list) * 3600 / wall_times[-1]:10.1f} points/hour")
+    benchmark_df['workers'] = list(worker_counts)
+    benchmark_df['wall_time_s'] = wall_times
+    benchmark_df['points_per_hour'] = [len(h_ex_list) * 3600 / wall_time for wall_time in wall_times]
+    benchmark_df['speedup'] = wall_times[0] / benchmark_df['wall_time_s']
+    benchmark_df['efficiency'] = benchmark_df['speedup'] * worker_counts[0] / benchmark_df['workers']
+    if write_to_file is True:
+        from parameters import path_results
+        path = os.path.join(path_results, "benchmarks/")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "sweep_scaling.txt"), 'w') as benchmark_file:
+            benchmark_file.write(benchmark_df.to_string(header=True, index=False))
+    return benchmark_df
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Benchmark =========================================================================================
+if __name__ == "__main__":
+    print(benchmark_sweep())
+# ======================================================================================================================
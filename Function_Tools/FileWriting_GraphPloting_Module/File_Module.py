@@ -6,7 +6,7 @@
 #                        3. os ('https://docs.python.org/3/library/os.html')
 # Author:                Avishek Singh
 # Date:                  20.05.2022
-# Latest Update:         25.05.2022
+# Latest Update:         18.10.2026
 # Version:               1.0.0
 # ======================================================================================================================
 
@@ -19,45 +19,58 @@ import os
 # ====== File Handling Module Functions ================================================================================
 # ------ Parse Logger Data ---------------------------------------------------------------------------------------------
 def parse_logger_data(logger_object, obs_list, write_to_file=False, j=None, h=None):
-    data = logger_object.data
-    parsed_data_keys = ['iters', 'Energy']
-    parsed_data_keys.extend(obs_list)
-    parsed_data_df = pd.DataFrame()
-    for item in parsed_data_keys:
-        if item == 'iters':
-            parsed_data_df[item] = np.real(data['Energy'][item])
-        else:
-            parsed_data_df[item] = np.real(data[item]['Mean'])
+    if hasattr(logger_object, 'parsed_data'):
+        # 'StreamingLog' (see streaming_log.py) keeps the parsed rows itself.
+        parsed_data_df = logger_object.parsed_data()
+    else:
+        data = logger_object.data
+        parsed_data_keys = ['iters', 'Energy']
+        parsed_data_keys.extend(obs_list)
+        parsed_data_df = pd.DataFrame()
+        for item in parsed_data_keys:
+            if item == 'iters':
+                parsed_data_df[item] = np.real(data['Energy'][item])
+            else:
+                parsed_data_df[item] = np.real(data[item]['Mean'])
     if write_to_file is True:
-        from parameters import simulation_file_path
-        isExists = os.path.exists(simulation_file_path)
-        if not isExists:
-            os.makedirs(simulation_file_path)
-        if j is not None and h is not None:
-            writeFile = 'data_(J=' + str(j) + ',h=' + str(h) + ').txt'
-        elif j is None and h is None:
-            writeFile = 'data.txt'
-        elif j is not None and h is None:
-            writeFile = 'data_(J=' + str(j) + ').txt'
-        elif j is None and h is not None:
-            writeFile = 'data_(h=' + str(h) + ').txt'
-        else:
-            print('Warning: J and h values not recognized for writing to file. Writing to file as "data.txt".')
-            print("If you have loop over J and h values. Please Check the values of J and h.")
-            writeFile = 'data.txt'
-        writePath = os.path.join(simulation_file_path, writeFile)
-        with open(writePath, 'w') as energy_file:
-            dfAsString = parsed_data_df.to_string(header=True, index=False)
-            energy_file.write(dfAsString)
+        write_parsed_data(parsed_data_df=parsed_data_df, j=j, h=h)
     return parsed_data_df
 # ----------------------------------------------------------------------------------------------------------------------
 
+# ------ Write Parsed Data to file -------------------------------------------------------------------------------------
+def write_parsed_data(parsed_data_df, j=None, h=None):
+    from parameters import simulation_file_path
+    isExists = os.path.exists(simulation_file_path)
+    if not isExists:
+        os.makedirs(simulation_file_path)
+    if j is not None and h is not None:
+        writeFile = 'data_(J=' + str(j) + ',h=' + str(h) + ').txt'
+    elif j is None and h is None:
+        writeFile = 'data.txt'
+    elif j is not None and h is None:
+        writeFile = 'data_(J=' + str(j) + ').txt'
+    elif j is None and h is not None:
+        writeFile = 'data_(h=' + str(h) + ').txt'
+    else:
+        print('Warning: J and h values not recognized for writing to file. Writing to file as "data.txt".')
+        print("If you have loop over J and h values. Please Check the values of J and h.")
+        writeFile = 'data.txt'
+    writePath = os.path.join(simulation_file_path, writeFile)
+    with open(writePath, 'w') as energy_file:
+        dfAsString = parsed_data_df.to_string(header=True, index=False)
+        energy_file.write(dfAsString)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
 # ------ Combine Parsed Data -------------------------------------------------------------------------------------------
 def combine_parsed_data(parsed_data, df_dict, var, var_list):
+    # Points may run different numbers of iterations (e.g. warm started points), so the rows are always the full
+    # iteration range and shorter traces are padded with NaN.
+    from parameters import iterations
     for key, df in df_dict.items():
         if var == var_list[0]:
-            df['#iters'] = parsed_data['iters']
-        df['h=' + str(var)] = parsed_data[key]
+            df['#iters'] = np.arange(iterations)
+        df['h=' + str(var)] = pd.Series(np.asarray(parsed_data[key]), index=np.asarray(parsed_data['iters']))
     return df_dict
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -90,5 +103,18 @@ def write_parsed_data_jh(df_dict):
             energy_file.write(dfAsString)
     return None
 # ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Write per point sweep information to file ---------------------------------------------------------------------
+def write_point_info(point_info_df):
+    from parameters import point_info_path
+    isExists = os.path.exists(point_info_path)
+    if not isExists:
+        os.makedirs(point_info_path)
+    writePath = os.path.join(point_info_path, 'point_info.txt')
+    with open(writePath, 'w') as info_file:
+        dfAsString = point_info_df.to_string(header=True, index=False)
+        info_file.write(dfAsString)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
 
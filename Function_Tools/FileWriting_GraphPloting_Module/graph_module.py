@@ -4,12 +4,11 @@
 # Library Dependencies:  1. Matplotlib ('https://matplotlib.org/')
 # Author:                Avishek Singh
 # Date:                  25.05.2022
-# Latest Update:         25.05.2022
+# Latest Update:         18.10.2026
 # Version:               1.0.0
 # ======================================================================================================================
 
 # ====== Importing Required Libraries ==================================================================================
-import matplotlib.pyplot as plt
 import os
 import pandas as pd
 # ======================================================================================================================
@@ -29,6 +28,7 @@ def basic_plot(x, y, x_label, y_label, title):
     :param save_name: save name
     :return: None
     """
+    import matplotlib.pyplot as plt
     # Plotting the graph
     plt.plot(x, y)
     plt.xlabel(x_label)
@@ -65,6 +65,7 @@ def parsed_data_plot(parsed_data, show_plot=False, save_plot=True, var1=None, va
 
 # ------ J based parsed data plot function -----------------------------------------------------------------------------
 def plot_J_based_parsed_data(input_file_path, out_file_path, show_plot=False, save_plot=True):
+    import matplotlib.pyplot as plt
     if not os.path.exists(out_file_path):
         os.makedirs(out_file_path)
     if os.path.exists(input_file_path):
@@ -103,8 +104,12 @@ def plot_J_based_parsed_data(input_file_path, out_file_path, show_plot=False, sa
         raise FileNotFoundError('Input file path does not exist')
     return None
 # ----------------------------------------------------------------------------------------------------------------------
-from parameters import source_path, J_parsed_file_path, path_plots, J_parsed_plot_path
-inp_path = os.path.join(source_path, J_parsed_file_path)
-out_path = os.path.join(source_path, J_parsed_plot_path)
-plot_J_based_parsed_data(input_file_path=inp_path, out_file_path=out_path, show_plot=False, save_plot=True)
+# ======================================================================================================================
+
+# ====== Plotting the J Based Parsed Data ==============================================================================
+if __name__ == "__main__":
+    from parameters import source_path, J_parsed_file_path, J_parsed_plot_path
+    inp_path = os.path.join(source_path, J_parsed_file_path)
+    out_path = os.path.join(source_path, J_parsed_plot_path)
+    plot_J_based_parsed_data(input_file_path=inp_path, out_file_path=out_path, show_plot=False, save_plot=True)
 # ======================================================================================================================
@@ -0,0 +1,162 @@
+# ======================================================================================================================
+# Name:                 Output Pipeline Module 'output_pipeline.py'
+# Description:          1. This module writes the per point results (result cube, data files) and plots in the
+#                          background.
+#                       2. Results go through a bounded queue to a writer process (or thread), so the sweep does not
+#                          wait for 'to_string' dumps and PDF rendering. A full queue blocks the sender (back-pressure).
+#                       3. 'flush()' waits until everything queued is on disk. The pipeline is closed at exit.
+#                       4. The writer answers every point on a result queue. While waiting, the pipeline polls that the
+#                          writer is alive, so a writer that died raises an error instead of blocking the sweep forever.
+# Library Dependencies: 1. multiprocessing ("https://docs.python.org/3/library/multiprocessing.html")
+#                       2. threading ("https://docs.python.org/3/library/threading.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import atexit
+import multiprocessing as mp
+import queue
+import threading
+import traceback
+# ======================================================================================================================
+
+# ====== Output Worker =================================================================================================
+# ------ Defining a function to write and plot one point ---------------------------------------------------------------
+def write_point_output(parsed_data, j, h, cube_point=None):
+    # 'cube_point' = (cube path, j_index, h_index) writes the point into the result cube of the sweep.
+    from Function_Tools.FileWriting_GraphPloting_Module.plot_renderer import render_point_plots
+    from parameters import text_output, plot_bundle
+    if cube_point is not None:
+        from Function_Tools.FileWriting_GraphPloting_Module.result_cube import ResultCube
+        cube_path, j_index, h_index = cube_point
+        ResultCube(cube_path, mode="r+").write_point(j_index=j_index, h_index=h_index, parsed_data=parsed_data)
+    if text_output == "all":
+        from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_parsed_data
+        write_parsed_data(parsed_data_df=parsed_data, j=j, h=h)
+    elif text_output != "summary":
+        raise ValueError("Text output not recognized")
+    if plot_bundle == "none":
+        # Bundled plots need every point, so they are rendered from the result cube after the sweep.
+        render_point_plots(parsed_data=parsed_data, j=j, h=h)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the loop of the writer process or thread -------------------------------------------------------------
+def output_worker(task_queue, result_queue):
+    # Every point is answered on the result queue: None once it is written, else the traceback of its error.
+    while True:
+        item = task_queue.get()
+        if item is None:
+            break
+        try:
+            write_point_output(*item)
+            result_queue.put(None)
+        except Exception:
+            result_queue.put(traceback.format_exc())
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Output Pipeline ===============================================================================================
+# ------ Defining a class that hands the point output to a background writer -------------------------------------------
+class OutputPipeline:
+    """
+    Background writer for the per point data files and plots.
+    :param backend: "process" (a spawned writer process, no GIL contention with the sweep), "thread" or "sync" (write
+                    in the calling process, as before)
+    :param max_queue_size: number of points that may wait in the queue before 'submit' blocks
+    :param poll_interval: seconds between two checks that the writer is still alive while waiting for it
+    """
+    def __init__(self, backend="process", max_queue_size=16, poll_interval=1.0):
+        self.backend = backend
+        self.poll_interval = poll_interval
+        if backend == "process":
+            context = mp.get_context("spawn")
+            self._queue = context.Queue(maxsize=max_queue_size)
+            self._results = context.Queue()
+            self._worker = context.Process(target=output_worker, args=(self._queue, self._results), daemon=True)
+        elif backend == "thread":
+            self._queue = queue.Queue(maxsize=max_queue_size)
+            self._results = queue.Queue()
+            self._worker = threading.Thread(target=output_worker, args=(self._queue, self._results), daemon=True)
+        elif backend == "sync":
+            self._worker = None
+        else:
+            raise ValueError("Output backend not recognized")
+        if self._worker is not None:
+            self._worker.start()
+        self._pending = 0
+        self.closed = False
+
+    def _check_worker(self):
+        if not self._worker.is_alive():
+            exitcode = getattr(self._worker, 'exitcode', None)
+            raise RuntimeError(f"The output writer stopped (exit code {exitcode}) with {self._pending} points not "
+                               f"written.")
+        return None
+
+    def submit(self, parsed_data, j, h, cube_point=None):
+        if self.closed:
+            raise RuntimeError("The output pipeline is closed.")
+        if self._worker is None:
+            write_point_output(parsed_data, j, h, cube_point)
+        else:
+            # A full queue blocks until the writer takes a point, as long as the writer is alive.
+            while True:
+                try:
+                    self._queue.put((parsed_data, j, h, cube_point), timeout=self.poll_interval)
+                    break
+                except queue.Full:
+                    self._check_worker()
+            self._pending += 1
+        return None
+
+    def flush(self):
+        # Waits until every submitted point is written and raises the first error of the writer.
+        if self._worker is not None:
+            errors = []
+            while self._pending > 0:
+                try:
+                    result = self._results.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    self._check_worker()
+                    continue
+                self._pending -= 1
+                if result is not None:
+                    errors.append(result)
+            if len(errors) > 0:
+                raise RuntimeError(f"{len(errors)} point outputs failed. First error:\n{errors[0]}")
+        return None
+
+    def close(self):
+        if self.closed:
+            return None
+        self.closed = True
+        if self._worker is not None:
+            try:
+                self.flush()
+            finally:
+                # After the flush the queue is empty, a writer that died is not waited for.
+                if self._worker.is_alive():
+                    self._queue.put(None)
+                    self._worker.join()
+        return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the output pipeline of this process ---------------------------------------------
+_pipeline = None
+
+
+def output_pipeline():
+    # One pipeline per process, started on first use and closed (flushed) at exit.
+    global _pipeline
+    if _pipeline is None or _pipeline.closed:
+        from parameters import output_backend, output_queue_size
+        _pipeline = OutputPipeline(backend=output_backend, max_queue_size=output_queue_size)
+        atexit.register(_pipeline.close)
+    return _pipeline
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,303 @@
+# ======================================================================================================================
+# Name:                 Plot Renderer Module 'plot_renderer.py'
+# Description:          1. This module renders the trace plots and the J parsed plots without the pyplot state machine.
+#                       2. Every process draws on one reused Agg figure, and the lines of a page are updated in place.
+#                          A job is one output file holding one or more pages. The jobs are spread over a process pool.
+#                       3. The traces of one J, or of one observable, can be bundled into a single multi-page PDF
+#                          (parameters.plot_bundle). PNG output is available for long traces, and inside PDFs traces
+#                          longer than 'plot_rasterize_above' points are rasterized.
+#                       4. The output names of 'parsed_data_plot' and 'plot_J_based_parsed_data' are kept.
+#                       5. A '.plot_manifest' in every plot directory records a hash of the data and options of each
+#                          file. Only files whose hash changed are rendered again, and a full refresh removes the files
+#                          of the renderer that are no longer produced (e.g. after changing 'plot_bundle').
+# Library Dependencies: 1. matplotlib ("https://matplotlib.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+#                       3. concurrent.futures ("https://docs.python.org/3/library/concurrent.futures.html")
+#                       4. hashlib ("https://docs.python.org/3/library/hashlib.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import hashlib
+import json
+import multiprocessing as mp
+import numpy as np
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+# ======================================================================================================================
+
+# ====== Rendering Functions ===========================================================================================
+# ------ Defining a function to return the figure of this process ------------------------------------------------------
+_figure = {}
+
+
+def reusable_figure():
+    # One Agg figure per process, reused for every page instead of being created and destroyed.
+    if 'figure' not in _figure:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        _figure['figure'] = (figure, figure.add_subplot())
+    return _figure['figure']
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to draw one page --------------------------------------------------------------------------
+def draw_page(page, rasterize_above):
+    # 'page' = {'lines': [(x, y, label)], 'x_label', 'y_label', 'title'}. A label of None adds no legend entry.
+    # The lines of the previous page are updated in place: clearing the axes would also rebuild every tick.
+    figure, axes = reusable_figure()
+    lines = axes.get_lines()
+    for line in lines[len(page['lines']):]:
+        line.remove()
+    for k, (x, y, label) in enumerate(page['lines']):
+        if k < len(lines):
+            line = lines[k]
+            line.set_data(x, y)
+            line.set_label(label if label is not None else '_nolegend_')
+        else:
+            line, = axes.plot(x, y, color='C' + str(k % 10), label=label)
+        line.set_rasterized(len(x) > rasterize_above)
+    axes.relim()
+    axes.autoscale_view()
+    axes.set_xlabel(page['x_label'])
+    axes.set_ylabel(page['y_label'])
+    axes.set_title(page['title'] if page.get('title') is not None else '')
+    if axes.get_legend() is not None:
+        axes.get_legend().remove()
+    if any(label is not None for x, y, label in page['lines']):
+        axes.legend()
+    return figure
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to render one output file -----------------------------------------------------------------
+def render_job(job):
+    # 'job' = {'path', 'pages', 'format', 'dpi', 'rasterize_above'}. Several pages go into one multi-page PDF.
+    if len(job['pages']) > 1:
+        if job['format'] != 'pdf':
+            raise ValueError("Multi-page plots need plot_format = 'pdf'.")
+        from matplotlib.backends.backend_pdf import PdfPages
+        with PdfPages(job['path']) as pdf:
+            for page in job['pages']:
+                pdf.savefig(draw_page(page, job['rasterize_above']))
+    else:
+        figure = draw_page(job['pages'][0], job['rasterize_above'])
+        figure.savefig(job['path'], format=job['format'], dpi=job['dpi'])
+    return job['path']
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to render a list of jobs ------------------------------------------------------------------
+def render_jobs(jobs, n_workers=None, use_cache=None, remove_orphans=False):
+    # Returns the paths of the rendered files. With the plot cache only changed files are rendered. 'remove_orphans'
+    # is for complete job lists: files recorded in the manifest of a job directory but not in 'jobs' are deleted.
+    if n_workers is None:
+        from parameters import plot_workers as n_workers
+    if use_cache is None:
+        from parameters import plot_cache as use_cache
+    pending, digests = jobs, {}
+    if use_cache:
+        digests = {job['path']: job_hash(job) for job in jobs}
+        pending = [job for job in jobs
+                   if not directory_cache(os.path.dirname(job['path'])).is_current(job['path'], digests[job['path']])]
+    if n_workers <= 1 or len(pending) <= 1:
+        rendered = [render_job(job) for job in pending]
+    else:
+        # Large chunks keep the pickling overhead low, and several chunks per worker keep the workers evenly loaded.
+        chunksize = max(1, len(pending) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp.get_context("spawn")) as pool:
+            rendered = list(pool.map(render_job, pending, chunksize=chunksize))
+    if use_cache:
+        for path in rendered:
+            directory_cache(os.path.dirname(path)).record(path, digests[path])
+        if remove_orphans:
+            for directory in set(os.path.dirname(job['path']) for job in jobs):
+                directory_cache(directory).remove_orphans(digests.keys())
+    return rendered
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Plot Cache ====================================================================================================
+# Bumped when the drawing code changes, so every plot of an older renderer is rendered again.
+renderer_version = '1'
+
+
+# ------ Defining a function to hash the data and options of a job -----------------------------------------------------
+def job_hash(job):
+    digest = hashlib.sha256(renderer_version.encode())
+    digest.update(json.dumps([job['format'], job['dpi'], job['rasterize_above']]).encode())
+    for page in job['pages']:
+        labels = [label for x, y, label in page['lines']]
+        digest.update(json.dumps([page['x_label'], page['y_label'], page.get('title'), labels]).encode())
+        for x, y, label in page['lines']:
+            digest.update(np.ascontiguousarray(x, dtype=np.float64).tobytes())
+            digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()[:32]
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a class for the manifest of one plot directory -------------------------------------------------------
+class PlotCache:
+    """
+    Manifest of the files the renderer wrote to one directory. Every render appends a 'hash file name' line, the last
+    line of a file wins. 'remove_orphans' rewrites the manifest with only the current files.
+    :param directory: plot directory
+    """
+    def __init__(self, directory):
+        self.path = os.path.join(directory, '.plot_manifest')
+        self.entries = {}
+        self._size = None
+        self.refresh()
+
+    def refresh(self):
+        # Another process (e.g. the output pipeline) may have appended to the manifest since it was read.
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size != self._size:
+            self.entries = {}
+            if size > 0:
+                with open(self.path, 'r') as manifest_file:
+                    for line in manifest_file:
+                        digest, name = line.rstrip('\n').split(' ', 1)
+                        self.entries[name] = digest
+            self._size = size
+        return None
+
+    def is_current(self, path, digest):
+        self.refresh()
+        return self.entries.get(os.path.basename(path)) == digest and os.path.exists(path)
+
+    def record(self, path, digest):
+        self.refresh()
+        with open(self.path, 'a') as manifest_file:
+            manifest_file.write(digest + ' ' + os.path.basename(path) + '\n')
+        self.entries[os.path.basename(path)] = digest
+        self._size = os.path.getsize(self.path)
+        return None
+
+    def remove_orphans(self, current_paths):
+        # Only files recorded in the manifest are removed, never other files in the directory.
+        from Function_Tools.Sweep_Module.results_store import write_atomic
+        self.refresh()
+        current = set(os.path.basename(path) for path in current_paths)
+        for name in [name for name in self.entries if name not in current]:
+            orphan = os.path.join(os.path.dirname(self.path), name)
+            if os.path.exists(orphan):
+                os.remove(orphan)
+            del self.entries[name]
+        write_atomic(self.path, ''.join(digest + ' ' + name + '\n' for name, digest in self.entries.items()))
+        self._size = os.path.getsize(self.path)
+        return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the manifest of a plot directory ------------------------------------------------
+_caches = {}
+
+
+def directory_cache(directory):
+    # One manifest object per plot directory and process.
+    directory = os.path.abspath(directory)
+    if directory not in _caches:
+        _caches[directory] = PlotCache(directory)
+    return _caches[directory]
+# ----------------------------------------------------------------------------------------------------------------------
+# ====== Job Functions =================================================================================================
+# ------ Defining a function to build a job from the plot parameters ---------------------------------------------------
+def plot_job(path, pages):
+    from parameters import plot_format, plot_dpi, plot_rasterize_above
+    return {'path': path + '.' + plot_format, 'pages': pages, 'format': plot_format, 'dpi': plot_dpi,
+            'rasterize_above': plot_rasterize_above}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to build the trace pages of one point -----------------------------------------------------
+def trace_pages(parsed_data, j=None, h=None):
+    # {field: page} of every column of 'parsed_data' against 'iters'.
+    pages = {}
+    for key, value in parsed_data.items():
+        if key != 'iters':
+            title = key + ' Vs Iterations'
+            if j is not None and h is not None:
+                title = title + ' (J=' + str(j) + ', h=' + str(h) + ')'
+            pages[key] = {'lines': [(parsed_data['iters'].values, value.values, None)], 'x_label': 'Iterations',
+                          'y_label': key, 'title': title}
+    return pages
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to build the jobs of the trace plots of a sweep -------------------------------------------
+def trace_jobs(points, bundle):
+    # 'points' = [(j, h, parsed_data)]. bundle "none": one file per field and point, named like 'parsed_data_plot'.
+    # "J": one multi-page file per J. "observable": one multi-page file per field.
+    from parameters import parsed_data_plot_path
+    if not os.path.exists(parsed_data_plot_path):
+        os.makedirs(parsed_data_plot_path)
+    bundles = {}
+    for j, h, parsed_data in points:
+        for key, page in trace_pages(parsed_data, j=j, h=h).items():
+            if bundle == "none":
+                page = dict(page, title=key + ' Vs Iterations')
+                bundles[key + '(J=' + str(j) + ', h=' + str(h) + ')'] = [page]
+            elif bundle == "J":
+                bundles.setdefault('traces_(J=' + str(j) + ')', []).append(page)
+            elif bundle == "observable":
+                bundles.setdefault(key + '_traces', []).append(page)
+            else:
+                raise ValueError("Plot bundle not recognized")
+    return [plot_job(os.path.join(parsed_data_plot_path, name), pages) for name, pages in bundles.items()]
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to build the jobs of the J parsed plots ---------------------------------------------------
+def J_parsed_jobs(input_file_path, out_file_path):
+    # One file per column and one with all columns of every J parsed file, like 'plot_J_based_parsed_data'.
+    if not os.path.exists(input_file_path):
+        raise FileNotFoundError('Input file path does not exist')
+    if not os.path.exists(out_file_path):
+        os.makedirs(out_file_path)
+    jobs = []
+    for file in sorted(os.listdir(input_file_path)):
+        if file.endswith('.txt'):
+            filename = file.split('.')[0]
+            df = pd.read_fwf(os.path.join(input_file_path, file))
+            lines = []
+            for cols in df.columns:
+                if cols != '#h':
+                    page = {'lines': [(df['#h'].values, df[cols].values, None)], 'x_label': 'h',
+                            'y_label': filename, 'title': filename + '_(' + cols + ')' + ' Vs h'}
+                    jobs.append(plot_job(os.path.join(out_file_path, filename + '_(' + cols + ')'), [page]))
+                    lines.append((df['#h'].values, df[cols].values, cols))
+            jobs.append(plot_job(os.path.join(out_file_path, filename), [{'lines': lines, 'x_label': 'h',
+                                                                          'y_label': filename, 'title': None}]))
+    return jobs
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Plotting Functions ============================================================================================
+# ------ Defining a function to plot the traces of one point -----------------------------------------------------------
+def render_point_plots(parsed_data, j, h):
+    # Used while the sweep runs. Bundled traces are rendered from the result cube after the sweep instead.
+    return render_jobs(trace_jobs(points=[(j, h, parsed_data)], bundle="none"), n_workers=1)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to plot the traces of a sweep from its result cube ----------------------------------------
+def render_trace_plots(cube_path=None, bundle=None, n_workers=None):
+    from Function_Tools.FileWriting_GraphPloting_Module.result_cube import ResultCube
+    if cube_path is None:
+        from parameters import cube_path
+    if bundle is None:
+        from parameters import plot_bundle as bundle
+    cube = ResultCube(cube_path)
+    points = [(j, h, cube.point(j_index, h_index)) for j_index, j in enumerate(cube.J) for h_index, h in
+              enumerate(cube.h) if cube.lengths[j_index, h_index] > 0]
+    return render_jobs(trace_jobs(points=points, bundle=bundle), n_workers=n_workers, remove_orphans=True)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to plot the J parsed files ----------------------------------------------------------------
+def render_J_parsed_plots(input_file_path=None, out_file_path=None, n_workers=None):
+    if input_file_path is None or out_file_path is None:
+        from parameters import source_path, J_parsed_file_path, J_parsed_plot_path
+        input_file_path = os.path.join(source_path, J_parsed_file_path)
+        out_file_path = os.path.join(source_path, J_parsed_plot_path)
+    return render_jobs(J_parsed_jobs(input_file_path=input_file_path, out_file_path=out_file_path),
+                       n_workers=n_workers, remove_orphans=True)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,88 @@
+# ======================================================================================================================
+# Name:                 Result Accumulator Module 'result_accumulator.py'
+# Description:          1. This module collects the results of a sweep in preallocated numpy arrays.
+#                       2. The traces of all points are one (J, h, iteration, field) array and the averages over the
+#                          last 'n_values' iterations one (J, h, field) array. Points are filled in place.
+#                       3. The errors of the averages (see estimators.py) are a second (J, h, field) array.
+#                       4. DataFrames are only built at export time, in one go per file, in the layouts of
+#                          'combine_parsed_data' ('<field>_(J=..).txt') and of the J-parsed files ('<field>.txt').
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+# ======================================================================================================================
+
+# ====== Result Accumulator ============================================================================================
+# ------ Defining a class that holds the traces and averages of all points of a sweep ----------------------------------
+class ResultAccumulator:
+    """
+    Preallocated arrays for the results of a sweep. Unfilled entries are NaN.
+    :param J_values: J values of the grid, also used for the 'j=..' column names
+    :param h_values: h values of the grid, also used for the 'h=..' column names
+    :param n_iter: maximum number of iterations of a point
+    :param fields: names of the recorded quantities, 'Energy' and the observables
+    :param n_values: number of last iterations averaged per point
+    """
+    def __init__(self, J_values, h_values, n_iter, fields, n_values):
+        self.J_values = list(J_values)
+        self.h_values = list(h_values)
+        self.n_iter = n_iter
+        self.fields = list(fields)
+        self.n_values = n_values
+        shape = (len(self.J_values), len(self.h_values))
+        self.traces = np.full(shape + (n_iter, len(self.fields)), np.nan)
+        self.lengths = np.zeros(shape, dtype=int)
+        self.means = np.full(shape + (len(self.fields),), np.nan)
+        self.errors = np.full(shape + (len(self.fields),), np.nan)
+
+    def add_point(self, j_index, h_index, parsed_data, average=True, info=None):
+        # 'parsed_data' as returned by 'parse_logger_data'. With 'average=False' the mean of the point stays NaN. The
+        # errors are read from the '<field>_error' entries of the point information 'info'. Iterations where the
+        # observable schedule skipped an observable (NaN) are left out of its mean.
+        iters = np.asarray(parsed_data['iters'], dtype=int)
+        values = np.asarray(parsed_data[self.fields], dtype=np.float64)
+        self.traces[j_index, h_index, iters] = values
+        self.lengths[j_index, h_index] = len(iters)
+        if average:
+            self.means[j_index, h_index] = np.nanmean(values[-self.n_values:], axis=0)
+            if info is not None:
+                self.errors[j_index, h_index] = [info.get(item + '_error', np.nan) for item in self.fields]
+        return None
+
+    def point_frame(self, j_index, h_index):
+        # Parsed data of one point, laid out like 'parse_logger_data'.
+        n_recorded = self.lengths[j_index, h_index]
+        parsed_data_df = pd.DataFrame(self.traces[j_index, h_index, :n_recorded], columns=self.fields)
+        parsed_data_df.insert(0, 'iters', np.arange(n_recorded))
+        return parsed_data_df
+
+    def combined_frames(self, j_index):
+        # {field: DataFrame} of all h values at one J, with shorter traces padded with NaN.
+        df_dict = {}
+        for k, item in enumerate(self.fields):
+            columns = {'#iters': np.arange(self.n_iter)}
+            for h_index, h in enumerate(self.h_values):
+                columns['h=' + str(h)] = self.traces[j_index, h_index, :, k]
+            df_dict[item] = pd.DataFrame(columns)
+        return df_dict
+
+    def jh_frames(self, errors=False):
+        # {field: DataFrame} of the averages over the whole grid, one 'j=..' column per J value. With 'errors' the
+        # errors of the averages as {'<field>_error': DataFrame}.
+        values, suffix = (self.errors, '_error') if errors else (self.means, '')
+        df_dict = {}
+        for k, item in enumerate(self.fields):
+            columns = {'#h': self.h_values}
+            for j_index, j in enumerate(self.J_values):
+                columns['j=' + str(j)] = values[j_index, :, k]
+            df_dict[item + suffix] = pd.DataFrame(columns)
+        return df_dict
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,141 @@
+# ======================================================================================================================
+# Name:                 Result Cube Module 'result_cube.py'
+# Description:          1. This module stores all iterations of a sweep in one binary (J, h, iteration, field) array.
+#                       2. 'cube.npy' is a memory-mappable numpy array. The iterations of one (J, h) point are one
+#                          contiguous chunk, so points are written while the sweep runs and read without copies.
+#                       3. 'lengths.npy' holds the number of recorded iterations per point (0: not written yet) and
+#                          'metadata.json' the J and h coordinates, the number of iterations and the field names.
+#                       4. 'export_text' regenerates the old text file layout from the cube on demand.
+#                          Run 'python -m Function_Tools.FileWriting_GraphPloting_Module.result_cube' to export.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+#                       3. json ("https://docs.python.org/3/library/json.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import json
+import os
+import numpy as np
+import pandas as pd
+# ======================================================================================================================
+
+# ====== Result Cube ===================================================================================================
+# ------ Defining a class for the memory-mapped result cube ------------------------------------------------------------
+class ResultCube:
+    """
+    Memory-mapped (J, h, iteration, field) array of a sweep. Unwritten entries, and the iterations after an early
+    stop, are NaN. Create a new cube with 'ResultCube.create' and open an existing one with 'ResultCube(path)'.
+    :param path: directory of the cube
+    :param mode: "r" to read (slices are views of the file), "r+" to write points
+    """
+    def __init__(self, path, mode="r"):
+        self.path = path
+        with open(os.path.join(path, 'metadata.json'), 'r') as metadata_file:
+            self.metadata = json.load(metadata_file)
+        self.J = np.asarray(self.metadata['J'])
+        self.h = np.asarray(self.metadata['h'])
+        self.fields = list(self.metadata['fields'])
+        self.data = np.load(os.path.join(path, 'cube.npy'), mmap_mode=mode)
+        self.lengths = np.load(os.path.join(path, 'lengths.npy'), mmap_mode=mode)
+
+    @classmethod
+    def create(cls, path, J_values, h_values, n_iter, fields):
+        if not os.path.exists(path):
+            os.makedirs(path)
+        metadata = {'J': [float(j) for j in J_values], 'h': [float(h) for h in h_values], 'iterations': int(n_iter),
+                    'fields': list(fields), 'layout': ['J', 'h', 'iteration', 'field']}
+        shape = (len(J_values), len(h_values), n_iter, len(fields))
+        data = np.lib.format.open_memmap(os.path.join(path, 'cube.npy'), mode='w+', dtype=np.float64, shape=shape)
+        data[:] = np.nan
+        data.flush()
+        lengths = np.lib.format.open_memmap(os.path.join(path, 'lengths.npy'), mode='w+', dtype=np.int32,
+                                            shape=shape[:2])
+        lengths[:] = 0
+        lengths.flush()
+        del data, lengths
+        with open(os.path.join(path, 'metadata.json'), 'w') as metadata_file:
+            json.dump(metadata, metadata_file, indent=1)
+        return cls(path, mode="r+")
+
+    def write_point(self, j_index, h_index, parsed_data):
+        # 'parsed_data' as returned by 'parse_logger_data'. Rows are placed by their 'iters' value.
+        iters = np.asarray(parsed_data['iters'], dtype=int)
+        self.data[j_index, h_index] = np.nan
+        self.data[j_index, h_index, iters] = np.asarray(parsed_data[self.fields], dtype=np.float64)
+        # A trace that only holds the last iterations (parameters.log_trace = "none") still ends at the right one.
+        self.lengths[j_index, h_index] = iters[-1] + 1 if len(iters) > 0 else 0
+        self.data.flush()
+        self.lengths.flush()
+        return None
+
+    def field(self, name):
+        # (J, h, iteration) view of one field, no copy.
+        return self.data[..., self.fields.index(name)]
+
+    def point(self, j_index, h_index):
+        # Parsed data of one point, laid out like 'parse_logger_data'.
+        n_recorded = int(self.lengths[j_index, h_index])
+        parsed_data_df = pd.DataFrame(np.asarray(self.data[j_index, h_index, :n_recorded]), columns=self.fields)
+        parsed_data_df.insert(0, 'iters', np.arange(n_recorded))
+        return parsed_data_df
+
+    def means(self, n_values):
+        # (J, h, field) mean of the last 'n_values' recorded iterations of every point (NaN for unwritten points).
+        # Iterations where the observable schedule skipped an observable are left out of its mean.
+        means = np.full(self.data.shape[:2] + (len(self.fields),), np.nan)
+        for j_index, h_index in zip(*np.nonzero(np.asarray(self.lengths))):
+            n_recorded = int(self.lengths[j_index, h_index])
+            means[j_index, h_index] = np.nanmean(self.data[j_index, h_index, max(0, n_recorded - n_values):n_recorded],
+                                                 axis=0)
+        return means
+
+    def is_complete(self):
+        return bool(np.all(np.asarray(self.lengths) > 0))
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the result cube of a sweep from the parameters ----------------------------------
+def create_result_cube(J_ex_list, h_ex_list):
+    from parameters import cube_path, iterations
+    from Function_Tools.Observables.observables import obs_list
+    return ResultCube.create(path=cube_path, J_values=J_ex_list, h_values=h_ex_list, n_iter=iterations,
+                             fields=['Energy'] + list(obs_list))
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Text Exporter =================================================================================================
+# ------ Defining a function to regenerate the old text files from the cube --------------------------------------------
+def export_text(path=None, n_values=None):
+    # Writes the per point 'data_(J=..,h=..).txt', the per J '<field>_(J=..).txt' and the J-parsed '<field>.txt' files.
+    # The J-parsed means are plain means of the last n_values iterations ('unconverged_policy' is not applied).
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_parsed_data
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_combined_data_to_file
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_parsed_data_jh
+    from Function_Tools.FileWriting_GraphPloting_Module.result_accumulator import ResultAccumulator
+    if path is None:
+        from parameters import cube_path as path
+    if n_values is None:
+        from parameters import n_values
+    cube = ResultCube(path)
+    accumulator = ResultAccumulator(J_values=cube.J, h_values=cube.h, n_iter=cube.data.shape[2], fields=cube.fields,
+                                    n_values=n_values)
+    for j_index, j in enumerate(cube.J):
+        for h_index, h in enumerate(cube.h):
+            if cube.lengths[j_index, h_index] == 0:
+                continue
+            parsed_data = cube.point(j_index, h_index)
+            accumulator.add_point(j_index=j_index, h_index=h_index, parsed_data=parsed_data)
+            write_parsed_data(parsed_data_df=parsed_data, j=j, h=h)
+        write_combined_data_to_file(data_df=accumulator.combined_frames(j_index=j_index), var=j)
+    write_parsed_data_jh(df_dict=accumulator.jh_frames())
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Exporter ==========================================================================================
+if __name__ == "__main__":
+    export_text()
+# ======================================================================================================================
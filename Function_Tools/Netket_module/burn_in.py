@@ -0,0 +1,129 @@
+# ======================================================================================================================
+# Name:                 Burn-in Module 'burn_in.py'
+# Description:          1. This module contains a callback for the VMC driver that sets the number of samples every
+#                          Markov chain discards before the samples of the next iteration ('n_discard_per_chain').
+#                       2. "fixed": the configured discard on every iteration (NetKet's behaviour).
+#                          "adaptive": the discard follows a drift test on the samples of every iteration. The chains
+#                          persist from one iteration to the next, so once they have thermalized the small parameter
+#                          updates need little or no discard.
+#                       3. Drift test (Geweke): log|psi|^2 of the samples, the target of the chains, is averaged over
+#                          the first quarter and the last half of every chain. The chains are independent, so the mean
+#                          of the differences over the chains divided by its standard error is a t statistic that does
+#                          not depend on the autocorrelation time. Chains that are still relaxing from their start
+#                          configuration drift and give a large statistic.
+#                       4. The test costs a forward pass of the network over the samples, so it only runs on every
+#                          'interval'-th iteration (starting with the first). A drift doubles the discard (at least a
+#                          quarter of the chain length), no drift halves it. The discard is kept until the next test.
+#                          Fresh chains start with the configured discard, chains carried over from the previous point
+#                          or restored from a checkpoint start without one.
+#                       5. The discarded Metropolis sweeps (n_sites steps) per chain of a point are returned with the
+#                          number a fixed discard would have used, so the savings are visible in the point information.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. netket ("https://netket.readthedocs.io/en/latest/index.html")
+#                       3. netket.driver ("https://netket.readthedocs.io/en/latest/api/drivers.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import netket
+
+# The samples of NetKet 3.4 are laid out (chain length, chains, sites). NetKet 3.5 moved the chain axis first.
+chain_axis = 0 if tuple(int(part) for part in netket.__version__.split('.')[:2]) >= (3, 5) else 1
+# ======================================================================================================================
+
+# ====== Chain Diagnostics =============================================================================================
+# ------ Defining a function to arrange per sample values by chain -----------------------------------------------------
+def chains_first(values):
+    # (chains, chain length) array of per sample values, laid out like the samples of the installed NetKet version.
+    values = np.asarray(values)
+    return values if chain_axis == 0 else values.T
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to test Markov chains for drift -----------------------------------------------------------
+def drift_statistic(chains):
+    # t statistic of (mean of the first quarter - mean of the last half) over the chains. NaN if the chains are too
+    # short or too few to tell.
+    n_chains, chain_length = chains.shape
+    if n_chains < 2 or chain_length < 4:
+        return np.nan
+    differences = chains[:, :chain_length // 4].mean(axis=1) - chains[:, chain_length // 2:].mean(axis=1)
+    error = np.std(differences, ddof=1) / np.sqrt(n_chains)
+    if error == 0:
+        return 0.0 if np.mean(differences) == 0 else np.inf
+    return float(np.mean(differences) / error)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Burn-in Callback ==============================================================================================
+# ------ Defining a VMC callback that sets the discarded samples of the next iteration ---------------------------------
+class BurnIn:
+    """
+    Callback for 'VMC.run(callback=...)'. The samples of an iteration are drawn before the callbacks run, so the
+    discard set here applies to the next iteration.
+    :param policy: "fixed" or "adaptive"
+    :param fixed_discard: configured samples discarded per chain and iteration
+    :param initial_discard: discard of the first iteration (only used by "adaptive")
+    :param max_discard: largest discard per chain and iteration
+    :param z_tol: drift statistic above which the chains count as not thermalized
+    :param sweeps_per_sample: Metropolis sweeps between two samples of a chain, n_sweeps / n_sites
+    :param interval: iterations between two drift tests (only used by "adaptive")
+    """
+    def __init__(self, policy, fixed_discard, initial_discard, max_discard, z_tol, sweeps_per_sample, interval=1):
+        if policy not in ("fixed", "adaptive"):
+            raise ValueError("Burn-in policy not recognized")
+        self.policy = policy
+        self.fixed_discard = fixed_discard
+        self.discard = fixed_discard if policy == "fixed" else min(initial_discard, max_discard)
+        self.max_discard = max_discard
+        self.z_tol = z_tol
+        self.sweeps_per_sample = sweeps_per_sample
+        self.interval = interval
+        self.discarded = 0
+        self.iterations = 0
+        self.drifts = 0
+
+    def __call__(self, step, log_data, driver):
+        vstate = driver.state
+        self.discarded += self.discard
+        self.iterations += 1
+        if self.policy == "adaptive" and (self.iterations - 1) % self.interval == 0:
+            samples = vstate.samples
+            log_prob = vstate.sampler.machine_pow * np.real(
+                np.asarray(vstate.log_value(samples.reshape((-1, samples.shape[-1])))))
+            chains = chains_first(log_prob.reshape(samples.shape[:-1]))
+            z = drift_statistic(chains)
+            if abs(z) > self.z_tol:
+                self.drifts += 1
+                self.discard = min(self.max_discard, max(2 * self.discard, chains.shape[1] // 4, 1))
+            elif np.isfinite(z):
+                self.discard //= 2
+            vstate.n_discard_per_chain = self.discard
+        return True
+
+    def info(self):
+        # Discarded Metropolis sweeps per chain, and the number of the configured fixed discard.
+        return {'burn_in_sweeps': self.discarded * self.sweeps_per_sample,
+                'burn_in_sweeps_fixed': self.fixed_discard * self.iterations * self.sweeps_per_sample,
+                'burn_in_drifts': self.drifts}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the burn-in callback of a point from the parameters -----------------------------
+def burn_in(vstate, n_sites, carried_chains=False):
+    # Returns None for variational states without Markov chains (full summation).
+    from parameters import burn_in as policy, burn_in_z, burn_in_max_discard, burn_in_interval
+    if not hasattr(vstate, 'sampler_state'):
+        return None
+    fixed_discard = vstate.n_discard_per_chain
+    max_discard = vstate.chain_length if burn_in_max_discard is None else burn_in_max_discard
+    initial_discard = 0 if carried_chains else fixed_discard
+    callback = BurnIn(policy=policy, fixed_discard=fixed_discard, initial_discard=initial_discard,
+                      max_discard=max_discard, z_tol=burn_in_z, sweeps_per_sample=vstate.sampler.n_sweeps / n_sites,
+                      interval=burn_in_interval)
+    vstate.n_discard_per_chain = callback.discard
+    return callback
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,140 @@
+# ======================================================================================================================
+# Name:                 Checkpoint Module 'checkpoint.py'
+# Description:          1. This module contains a callback for the VMC driver that periodically saves a running point.
+#                       2. A checkpoint holds the variational parameters, the optimizer state, the sampler state and the
+#                          parsed data of the iterations so far, so an interrupted point resumes where it stopped.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+#                       3. flax.serialization ("https://flax.readthedocs.io/en/latest/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import os
+import pandas as pd
+from flax import serialization
+# ======================================================================================================================
+
+# ====== Driver State Functions ========================================================================================
+# NetKet has no public accessor of the optimizer state (up to 3.22 the drivers keep it in '_optimizer_state'). A public
+# 'optimizer_state' is used where a driver has one, the private attribute only where it exists.
+# ------ Defining a function to return the optimizer state of a driver -------------------------------------------------
+def optimizer_state(driver):
+    if hasattr(type(driver), 'optimizer_state'):
+        return driver.optimizer_state
+    if hasattr(driver, '_optimizer_state'):
+        return driver._optimizer_state
+    raise ValueError("The VMC driver of this NetKet version has no optimizer state, checkpoints are not supported.")
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to set the optimizer state of a driver ----------------------------------------------------
+def set_optimizer_state(driver, state):
+    if isinstance(getattr(type(driver), 'optimizer_state', None), property):
+        driver.optimizer_state = state
+    elif hasattr(driver, '_optimizer_state'):
+        driver._optimizer_state = state
+    else:
+        raise ValueError("The VMC driver of this NetKet version has no optimizer state, checkpoints are not supported.")
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the name of the minimized quantity in the log data of a driver ------------------
+def loss_name(driver):
+    # 'VMC' logs the energy as "Energy" in every NetKet version.
+    return getattr(driver, '_loss_name', 'Energy')
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Point Checkpoint ==============================================================================================
+# ------ Defining a VMC callback that saves the state of the driver every few iterations -------------------------------
+class PointCheckpoint:
+    """
+    Callback for 'VMC.run(callback=...)'. Saves 'checkpoint.msgpack' and 'checkpoint_data.txt' to 'path' every 'every'
+    iterations. 'restore(driver)' loads an existing checkpoint into a new driver before the run.
+    :param path: directory of the point in the results store
+    :param obs_list: names of the observables, the columns of the parsed data next to 'iters' and 'Energy'
+    :param every: number of iterations between two checkpoints
+    """
+    def __init__(self, path, obs_list, every):
+        self.path = path
+        self.obs_list = obs_list
+        self.every = every
+        self.start_step = 0
+        self._rows = []
+        self._replayed = False
+
+    def restore(self, driver):
+        # Returns the number of iterations already done, 0 if there is no checkpoint.
+        state_path = os.path.join(self.path, 'checkpoint.msgpack')
+        if not os.path.exists(state_path):
+            return 0
+        # A full summation state has no sampler state, its checkpoint holds None instead.
+        target = {'parameters': driver.state.parameters, 'optimizer_state': optimizer_state(driver),
+                  'sampler_state': getattr(driver.state, 'sampler_state', None), 'step': 0}
+        with open(state_path, 'rb') as state_file:
+            checkpoint = serialization.from_bytes(target, state_file.read())
+        driver.state.parameters = checkpoint['parameters']
+        set_optimizer_state(driver, checkpoint['optimizer_state'])
+        if target['sampler_state'] is not None:
+            driver.state.sampler_state = checkpoint['sampler_state']
+        checkpoint_data = pd.read_csv(os.path.join(self.path, 'checkpoint_data.txt'), sep=r'\s+')
+        self.start_step = int(checkpoint['step'])
+        self._rows = checkpoint_data.to_dict('records')[:self.start_step]
+        return self.start_step
+
+    def __call__(self, step, log_data, driver):
+        # 'step' restarts at 0 in a resumed run, the rows continue from the checkpoint.
+        row = {'iters': self.start_step + step, 'Energy': float(np.real(log_data[loss_name(driver)].mean))}
+        for item in self.obs_list:
+            # NaN for observables skipped by the observable schedule.
+            row[item] = float(np.real(log_data[item].mean)) if item in log_data else np.nan
+        self._rows.append(row)
+        if len(self._rows) % self.every == 0:
+            self.save(driver)
+        return True
+
+    def save(self, driver):
+        from Function_Tools.Sweep_Module.results_store import write_atomic
+        checkpoint = {'parameters': driver.state.parameters, 'optimizer_state': optimizer_state(driver),
+                      'sampler_state': getattr(driver.state, 'sampler_state', None), 'step': len(self._rows)}
+        # The data is written first and cut to 'step' on restore, so the two files always agree after a crash.
+        write_atomic(os.path.join(self.path, 'checkpoint_data.txt'),
+                     self.recorded_data().to_string(header=True, index=False, float_format='{:.17g}'.format))
+        write_atomic(os.path.join(self.path, 'checkpoint.msgpack'), serialization.to_bytes(checkpoint), 'wb')
+        return None
+
+    def replay(self, log):
+        # Records the restored iterations in 'log' (see streaming_log.py), for a checkpoint that already covers the
+        # whole run. They are then part of its parsed data and not prepended again. Their Monte Carlo errors are not
+        # saved and count as unknown.
+        for row in self._rows[:self.start_step]:
+            log.record([row[column] for column in ['iters', 'Energy'] + list(self.obs_list)])
+        self._replayed = True
+        return log
+
+    def recorded_data(self):
+        # Parsed data of all iterations recorded so far, including those before the restart.
+        return pd.DataFrame(self._rows, columns=['iters', 'Energy'] + list(self.obs_list))
+
+    def prepend(self, parsed_data):
+        # Adds the iterations done before the restart to the parsed data of the resumed run.
+        if self.start_step == 0 or self._replayed:
+            return parsed_data
+        parsed_data = parsed_data.copy()
+        parsed_data['iters'] = parsed_data['iters'] + self.start_step
+        resumed_data = pd.DataFrame(self._rows[:self.start_step], columns=parsed_data.columns)
+        return pd.concat([resumed_data, parsed_data], ignore_index=True)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the checkpoint of a point from the parameters -----------------------------------
+def point_checkpoint(path, obs_list):
+    from parameters import checkpoint_every
+    if checkpoint_every is None or path is None:
+        return None
+    return PointCheckpoint(path=path, obs_list=obs_list, every=checkpoint_every)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
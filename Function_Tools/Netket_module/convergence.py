@@ -0,0 +1,119 @@
+# ======================================================================================================================
+# Name:                 Convergence Monitor Module 'convergence.py'
+# Description:          1. This module contains a callback for the VMC driver that stops a run once it has converged.
+#                       2. The criteria use the energy statistics NetKet reports on every iteration.
+#                       3. With a 'final_window' the run goes on for that many iterations after it has converged. The
+#                          observables on the "window" schedule (see observable_schedule.py) are only evaluated there.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. netket.driver ("https://netket.readthedocs.io/en/latest/api/drivers.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+from collections import deque
+# ======================================================================================================================
+
+# ====== Convergence Monitor ===========================================================================================
+# ------ Defining a VMC callback that checks the convergence criteria on every iteration -------------------------------
+class ConvergenceMonitor:
+    """
+    Callback for 'VMC.run(callback=...)'. Returns False, which stops the driver, once all enabled criteria hold
+    over the last 'window' iterations. A criterion is disabled by setting its tolerance to None.
+    :param window: number of iterations the criteria are evaluated over
+    :param min_iterations: the run is never stopped before this many iterations
+    :param rtol: maximum relative change of the mean energy between the last two windows
+    :param variance_tol: maximum mean energy variance per site over the last window
+    :param rhat_tol: maximum split R-hat of the energy over the last window
+    :param tau_tol: maximum energy autocorrelation time over the last window
+    :param n_sites: number of sites, used to normalise the variance
+    :param final_window: number of iterations run after the criteria hold, before the run is stopped
+    """
+    def __init__(self, window, min_iterations, rtol=None, variance_tol=None, rhat_tol=None, tau_tol=None, n_sites=1,
+                 final_window=0):
+        self.window = window
+        self.min_iterations = max(min_iterations, 2 * window)
+        self.rtol = rtol
+        self.variance_tol = variance_tol
+        self.rhat_tol = rhat_tol
+        self.tau_tol = tau_tol
+        self.n_sites = n_sites
+        self.final_window = final_window
+        self._energy = deque(maxlen=2 * window)
+        self._variance = deque(maxlen=window)
+        self._rhat = deque(maxlen=window)
+        self._tau = deque(maxlen=window)
+        self.converged = False
+        self.converged_iteration = None
+        self.stop_iteration = None
+        self.stop_reason = 'max_iterations'
+
+    def __call__(self, step, log_data, driver):
+        stats = log_data[driver._loss_name]
+        self._energy.append(float(np.real(stats.mean)))
+        self._variance.append(float(np.real(stats.variance)))
+        self._rhat.append(float(stats.R_hat))
+        self._tau.append(float(stats.tau_corr))
+        self.stop_iteration = step
+        if self.converged:
+            return step < self.converged_iteration + self.final_window
+        if step + 1 < self.min_iterations:
+            return True
+        reasons = self.check()
+        if reasons is None:
+            return True
+        self.converged = True
+        self.converged_iteration = step
+        self.stop_reason = ', '.join(reasons)
+        return self.final_window > 0
+
+    def check(self):
+        # Returns the list of satisfied criteria when all enabled criteria hold, otherwise None.
+        reasons = []
+        if self.rtol is not None:
+            energy = np.asarray(self._energy)
+            previous, last = np.mean(energy[:self.window]), np.mean(energy[self.window:])
+            if not abs(last - previous) <= self.rtol * abs(last):
+                return None
+            reasons.append('rtol')
+        if self.variance_tol is not None:
+            if not np.mean(self._variance) / self.n_sites <= self.variance_tol:
+                return None
+            reasons.append('variance')
+        # R-hat and tau are NaN when NetKet cannot estimate them (e.g. a single chain); those are not held against a run.
+        if self.rhat_tol is not None:
+            if np.nanmax(np.append(self._rhat, 0.0)) > self.rhat_tol:
+                return None
+            reasons.append('rhat')
+        if self.tau_tol is not None:
+            if np.nanmean(np.append(self._tau, 0.0)) > self.tau_tol:
+                return None
+            reasons.append('tau')
+        if len(reasons) == 0:
+            return None
+        return reasons
+
+    def info(self, n_iter):
+        # Summary of the run for the per point sweep information.
+        iterations_run = n_iter if self.stop_iteration is None else self.stop_iteration + 1
+        return {'iterations_run': iterations_run, 'converged': self.converged, 'stop_iteration': iterations_run - 1,
+                'converged_iteration': self.converged_iteration, 'stop_reason': self.stop_reason}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the convergence monitor from the parameters -------------------------------------
+def convergence_monitor(graph):
+    from parameters import early_stopping
+    if not early_stopping:
+        return None
+    from parameters import convergence_window, min_iterations, convergence_rtol, convergence_variance_tol
+    from parameters import convergence_rhat_tol, convergence_tau_tol, observable_schedule, n_values
+    # The averaging window of the observables on the "window" schedule is run after the point has converged.
+    final_window = n_values if "window" in observable_schedule.values() else 0
+    return ConvergenceMonitor(window=convergence_window, min_iterations=min_iterations, rtol=convergence_rtol,
+                              variance_tol=convergence_variance_tol, rhat_tol=convergence_rhat_tol,
+                              tau_tol=convergence_tau_tol, n_sites=graph.n_nodes, final_window=final_window)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
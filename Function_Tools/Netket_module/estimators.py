@@ -0,0 +1,140 @@
+# ======================================================================================================================
+# Name:                 Estimator Module 'estimators.py'
+# Description:          1. This module contains an online estimator for the end-of-run averages of a point.
+#                       2. Samples are added one iteration at a time: Welford updates of the mean and variance, and a
+#                          blocking analysis (Flyvbjerg-Petersen) whose block levels are also updated online.
+#                       3. The error of the mean is the largest blocking error, so autocorrelation between iterations
+#                          is accounted for. It is never smaller than the Monte Carlo error NetKet reports for the
+#                          single iterations ('error_of_mean').
+#                       4. The effective sample size and the autocorrelation time follow from the error, and
+#                          'required_iterations' turns a target error into a number of averaged iterations.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+# ======================================================================================================================
+
+# ====== Online Estimator ==============================================================================================
+# ------ Defining an online mean, variance and blocking estimator for several quantities -------------------------------
+class OnlineEstimator:
+    """
+    Online statistics of a series of samples of 'n_fields' quantities (e.g. the energy and the observables).
+    Block level l holds the means of 2**l consecutive samples. Every level is a Welford accumulator.
+    :param n_fields: number of quantities per sample
+    :param min_blocks: levels with fewer blocks are not used for the error
+    """
+    def __init__(self, n_fields, min_blocks=4):
+        self.n_fields = n_fields
+        self.min_blocks = min_blocks
+        self._count, self._mean, self._m2 = [], [], []
+        self._pending = []
+        self._mc_variance = np.zeros(n_fields)
+        self._mc_count = np.zeros(n_fields)
+
+    def _add_level(self):
+        for values in [self._mean, self._m2]:
+            values.append(np.zeros(self.n_fields))
+        self._count.append(0)
+        self._pending.append(None)
+        return None
+
+    def update(self, values, errors=None):
+        # 'errors' are the Monte Carlo errors of 'values' (e.g. NetKet 'error_of_mean'), NaN where unknown.
+        values = np.asarray(values, dtype=np.float64)
+        level = 0
+        while values is not None:
+            if level == len(self._count):
+                self._add_level()
+            self._count[level] += 1
+            delta = values - self._mean[level]
+            self._mean[level] += delta / self._count[level]
+            self._m2[level] += delta * (values - self._mean[level])
+            # Two samples of a level make one block of the next level.
+            if self._pending[level] is None:
+                self._pending[level], values = values, None
+            else:
+                self._pending[level], values = None, (self._pending[level] + values) / 2
+            level += 1
+        if errors is not None:
+            errors = np.asarray(errors, dtype=np.float64)
+            known = np.isfinite(errors)
+            self._mc_variance[known] += errors[known] ** 2
+            self._mc_count[known] += 1
+        return None
+
+    @property
+    def count(self):
+        return self._count[0] if self._count else 0
+
+    @property
+    def mean(self):
+        return self._mean[0] if self._count else np.full(self.n_fields, np.nan)
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return np.full(self.n_fields, np.nan)
+        return self._m2[0] / (self.count - 1)
+
+    def blocking_errors(self):
+        # (levels, fields) errors of the mean, for the levels with at least 'min_blocks' blocks. Shorter series only
+        # have the naive error of the single samples.
+        levels = [level for level, n in enumerate(self._count) if n >= max(self.min_blocks, 2)] or [0]
+        counts = np.array([self._count[level] for level in levels], dtype=np.float64)[:, None]
+        return np.sqrt(np.array([self._m2[level] for level in levels]) / (counts - 1) / counts)
+
+    def error(self):
+        # The blocking error grows with the block size until the blocks are longer than the autocorrelation time. The
+        # largest error of the levels with enough blocks is taken: on AR(1) series it covers the mean about as often as
+        # it should, where a plateau search stops too early on short series. Never below the Monte Carlo error of the
+        # iterations.
+        if self.count < 2:
+            return np.full(self.n_fields, np.nan)
+        errors = np.max(self.blocking_errors(), axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mc_error = np.where(self._mc_count == self.count, np.sqrt(self._mc_variance) / self.count, 0)
+        return np.fmax(errors, mc_error)
+
+    def result(self):
+        # Mean, error, effective sample size and integrated autocorrelation time (n / ess = 1 + 2 tau) per field.
+        error = self.error()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ess = np.clip(self.variance / error ** 2, 1, self.count)
+        return {'mean': self.mean, 'error': error, 'ess': ess, 'tau': (self.count / ess - 1) / 2, 'count': self.count}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to estimate the statistics of a finished series -------------------------------------------
+def estimate(values, errors=None, min_blocks=4):
+    # 'values' (samples, fields), 'errors' the Monte Carlo errors of the samples. Same result as the online updates.
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    estimator = OnlineEstimator(n_fields=values.shape[1], min_blocks=min_blocks)
+    for k in range(len(values)):
+        estimator.update(values[k], None if errors is None else errors[k])
+    return estimator.result()
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the number of iterations needed for a target error ------------------------------
+def required_iterations(error, count, target_error):
+    # The error of the mean falls as 1 / sqrt(iterations) once the iterations are longer than the autocorrelation time.
+    return int(np.ceil(count * (error / target_error) ** 2)) if np.isfinite(error) else None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to flatten the statistics of a point for the per point sweep information ------------------
+def statistics_info(statistics, fields, target_error=None):
+    # {'<field>_error', '<field>_ess', '<field>_tau'} and, with a target error, 'n_values_for_target' of the energy.
+    info = {}
+    for k, item in enumerate(fields):
+        info[item + '_error'] = float(statistics['error'][k])
+        info[item + '_ess'] = float(statistics['ess'][k])
+        info[item + '_tau'] = float(statistics['tau'][k])
+    if target_error is not None:
+        info['n_values_for_target'] = required_iterations(statistics['error'][fields.index('Energy')],
+                                                          statistics['count'], target_error)
+    return info
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,161 @@
+# ======================================================================================================================
+# Name:                 Exact Solver Module 'exact_solver.py'
+# Description:          1. This module chooses between Monte Carlo sampling and full summation over the Hilbert space
+#                          for the variational state, from the number of basis states.
+#                       2. It also contains an exact diagonalization reference for the ground state of every (J, h)
+#                          point. H(J, h) = (-J/4) * B + (-h/2) * F, so the sparse bond sum B and field sum F are built
+#                          once and a new point only changes the two coefficients.
+#                       3. Diagonal Hamiltonians (the sz basis Hamiltonian of 'hamiltonian.py') are solved for all h
+#                          values of a J in one vectorized minimum over the basis states. The observables are averaged
+#                          over the degenerate ground states (the zero temperature limit).
+#                       4. Other Hamiltonians are solved with sparse Lanczos ('scipy.sparse.linalg.eigsh'), started
+#                          from the ground state of the previous point.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. scipy.sparse ("https://docs.scipy.org/doc/scipy/reference/sparse.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+# ======================================================================================================================
+
+# ====== Backend Selection =============================================================================================
+# ------ Defining a function to choose the variational state backend ---------------------------------------------------
+def state_backend(hilbert):
+    # "mc": Markov chain sampling ('MCState'). "exact": full summation over all basis states. "auto": "exact" for
+    # Hilbert spaces of at most 'exact_max_states' basis states.
+    from parameters import state_backend as backend, exact_max_states
+    if backend not in ("mc", "exact", "auto"):
+        raise ValueError("State backend not recognized")
+    if backend == "auto":
+        return "exact" if hilbert.is_indexable and hilbert.n_states <= exact_max_states else "mc"
+    return backend
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to choose the reference solver ------------------------------------------------------------
+def reference_solver(hilbert):
+    # "lanczos": exact ground state of every point (see 'ExactReference'). "none": no reference. "auto": "lanczos" for
+    # Hilbert spaces of at most 'reference_max_states' basis states.
+    from parameters import reference_solver as solver, reference_max_states
+    if solver not in ("lanczos", "none", "auto"):
+        raise ValueError("Reference solver not recognized")
+    if solver == "auto":
+        return "lanczos" if hilbert.is_indexable and hilbert.n_states <= reference_max_states else "none"
+    return solver
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Exact Reference Solver ========================================================================================
+# ------ Defining a function to check whether a sparse matrix is diagonal ----------------------------------------------
+def is_diagonal(matrix):
+    matrix = matrix.tocoo()
+    return bool(np.all((matrix.row == matrix.col) | (matrix.data == 0)))
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the exact ground state values of a (J, h) sweep ------------------------------------------------------
+class ExactReference:
+    """
+    Exact ground state energy and observables of H(J, h) for a grid of (J, h) points.
+    :param hamiltonian: 'ParametricHamiltonian' of the sweep, H(J, h) = (-J/4) * B + (-h/2) * F
+    :param observables: 'ParametricObservables' of the sweep
+    :param degeneracy_tol: relative energy window of the degenerate ground states (diagonal Hamiltonians)
+    :param max_block: largest number of (h, basis state) energies held at once (diagonal Hamiltonians)
+    """
+    def __init__(self, hamiltonian, observables, degeneracy_tol=1e-10, max_block=2 ** 24):
+        # J = -4 and h = -2 make the coefficients 1, so both sums are read off the operator of the sweep.
+        self.bond = hamiltonian(J=-4.0, h=0.0).to_sparse().tocsr()
+        self.field = hamiltonian(J=0.0, h=-2.0).to_sparse().tocsr()
+        self.observables = observables
+        self.degeneracy_tol = degeneracy_tol
+        self.max_block = max_block
+        self.diagonal = is_diagonal(self.bond) and is_diagonal(self.field)
+        self._matrices = {}
+
+    def observable_matrices(self, J):
+        # {name: sparse matrix} of the observables at J. Operators that do not depend on J are converted once.
+        matrices = {}
+        for item, op in self.observables(J=J).items():
+            if id(op) not in self._matrices:
+                # The operator is kept with its matrix, so its id is not reused by another operator.
+                self._matrices[id(op)] = (op, op.to_sparse().tocsr())
+            matrices[item] = self._matrices[id(op)][1]
+        return matrices
+
+    def solve(self, J_values, h_values):
+        # Returns {'Energy': (J, h) array, <observable>: (J, h) array, 'degeneracy': (J, h) array}.
+        J_values, h_values = np.asarray(J_values, dtype=np.float64), np.asarray(h_values, dtype=np.float64)
+        results = None
+        v0 = None
+        for j_index, J in enumerate(J_values):
+            matrices = self.observable_matrices(J=J)
+            if results is None:
+                results = {item: np.full((len(J_values), len(h_values)), np.nan)
+                           for item in ['Energy'] + list(matrices.keys()) + ['degeneracy']}
+            if self.diagonal:
+                j_results = self.solve_diagonal(J=J, h_values=h_values, matrices=matrices)
+            else:
+                j_results, v0 = self.solve_lanczos(J=J, h_values=h_values, matrices=matrices, v0=v0)
+            for item, values in j_results.items():
+                results[item][j_index] = values
+        return results
+
+    def solve_diagonal(self, J, h_values, matrices):
+        # E(h) = (-J/4) * b + (-h/2) * f for all basis states at once. The ground states are the basis states within
+        # 'degeneracy_tol' of the minimum, and an observable is the mean of its diagonal elements over them.
+        bond, field = self.bond.diagonal().real, self.field.diagonal().real
+        names = list(matrices.keys())
+        observable_diagonals = np.stack([np.real(matrices[item].diagonal()) for item in names], axis=1)
+        results = {item: np.empty(len(h_values)) for item in ['Energy'] + names + ['degeneracy']}
+        block = max(1, self.max_block // len(bond))
+        for start in range(0, len(h_values), block):
+            h_block = h_values[start:start + block]
+            energies = (-J / 4) * bond[None, :] + (-h_block[:, None] / 2) * field[None, :]
+            ground_energy = energies.min(axis=1)
+            ground = energies <= (ground_energy + self.degeneracy_tol * np.maximum(1, np.abs(ground_energy)))[:, None]
+            degeneracy = ground.sum(axis=1)
+            values = (ground @ observable_diagonals) / degeneracy[:, None]
+            results['Energy'][start:start + block] = ground_energy
+            results['degeneracy'][start:start + block] = degeneracy
+            for k, item in enumerate(names):
+                results[item][start:start + block] = values[:, k]
+        return results
+
+    def solve_lanczos(self, J, h_values, matrices, v0=None):
+        # One 'eigsh' per point on the rescaled sparse sums, started from the previous ground state. A degenerate
+        # ground state is returned as one of its vectors. Returns the results of the J value and the last vector.
+        from scipy.sparse.linalg import eigsh
+        names = list(matrices.keys())
+        results = {item: np.empty(len(h_values)) for item in ['Energy'] + names + ['degeneracy']}
+        rng = np.random.default_rng(0)
+        for h_index, h in enumerate(h_values):
+            H = (-J / 4) * self.bond + (-h / 2) * self.field
+            if v0 is not None:
+                # The previous ground state can be an eigenvector of H that is no longer the lowest one (e.g. when B
+                # and F commute). Lanczos would then stay in its one dimensional Krylov space, so a small random
+                # part is added.
+                v0 = v0 + 1e-3 * rng.normal(size=len(v0)) / np.sqrt(len(v0))
+            energy, vector = eigsh(H, k=1, which='SA', v0=v0)
+            v0 = vector[:, 0]
+            results['Energy'][h_index] = energy[0]
+            results['degeneracy'][h_index] = np.nan
+            for item in names:
+                results[item][h_index] = np.real(np.vdot(v0, matrices[item] @ v0))
+        return results, v0
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to build the J parsed frames of the exact reference ---------------------------------------
+def exact_frames(results, J_values, h_values, fields):
+    # {'<field>_exact': DataFrame} in the layout of the J parsed files, one 'j=..' column per J value.
+    import pandas as pd
+    df_dict = {}
+    for item in fields:
+        columns = {'#h': h_values}
+        for j_index, j in enumerate(J_values):
+            columns['j=' + str(j)] = results[item][j_index]
+        df_dict[item + '_exact'] = pd.DataFrame(columns)
+    return df_dict
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -3,28 +3,241 @@
 # Description:          1.This module contains functions for constructing custom Hamiltonian.
 #                       2. There are prebuilt hamiltonian in 'Netket_module.operator' library. Check following link.
 #                       3. Prebuilt Hamiltonian can be used directly in main simulation module.
+#                       4. 'DiagonalOperator' is an operator type for Hamiltonians that are diagonal in the sz basis.
+#                          Its local energies are computed directly from the samples with a jitted gather over the
+#                          edge index array, instead of the connected elements of 'LocalOperator'.
+#                       5. 'RescaledLocalOperator' rescales the terms of a packed 'LocalOperator', so a new (J, h) is
+#                          not packed again. It relies on the packed arrays of NetKet's numba 'LocalOperator'. Where
+#                          they do not exist, the Hamiltonian is the public sum of the bond and field operators.
 # Library Dependencies: 1. Netket_module.operator ("https://netket.readthedocs.io/en/latest/api/operator.html")
+#                       2. netket.vqs ("https://netket.readthedocs.io/en/latest/api/vqs.html")
 #                       3. os ("https://docs.python.org/3/library/os.html")
+#                       4. jax ("https://jax.readthedocs.io/")
 # Author:               Avishek Singh
 # Date:                 18.05.2022
-# Latest Update:        19.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
 # ====== Importing Libraries ===========================================================================================
 from netket import operator
-from netket.operator import Ising, Heisenberg
+from netket.operator import Ising, Heisenberg, LocalOperator, AbstractOperator
+from netket.vqs import MCState, get_local_kernel, get_local_kernel_arguments
+import jax
+import jax.numpy as jnp
+import numpy as np
 import os
 # ======================================================================================================================
 
 # ====== Defining Hamiltonian Functions ================================================================================
-# ------ Defining prebuilt Hamiltonian -----------------------------------------------------------------------------
+# ------ Defining prebuilt Hamiltonian ---------------------------------------------------------------------------------
 def hamiltonian(hilbert, graph, J, h) -> operator:
     # This Hamiltonian is used for heisenberg model in external magnetic field.
-    from netket.operator.spin import sigmaz
-    ha = (-J/4) * sum([sigmaz(hilbert, i) * sigmaz(hilbert, j) for (i, j) in graph.edges()])
-    ha += (-h/2) * sum([sigmaz(hilbert, i) for i in graph.nodes()])
-    return ha
+    return ParametricHamiltonian(hilbert=hilbert, graph=graph)(J=J, h=h)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the local matrix of a single site operator --------------------------------------
+def local_matrix(single_site_operator):
+    # Depending on the NetKet version the stored matrices are dense arrays or scipy sparse matrices.
+    matrix = single_site_operator.operators[0]
+    if hasattr(matrix, 'toarray'):
+        matrix = matrix.toarray()
+    return np.asarray(matrix)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining an operator type for Hamiltonians that are diagonal in the sz basis ----------------------------------
+class DiagonalOperator(AbstractOperator):
+    """
+    O = bond_coefficient * sum_<ij> z_i z_j + field_coefficient * sum_i z_i, with z_i the value of the diagonal single
+    site matrix 'site_matrix' at the local state of site i. The local value of a sample is its diagonal element.
+    :param hilbert: Hilbert space
+    :param edges: (n_edges, 2) array of the bonds, e.g. 'graph.edges()'
+    :param site_matrix: diagonal single site matrix, e.g. the local matrix of sz
+    :param bond_coefficient: coefficient of the bond sum
+    :param field_coefficient: coefficient of the site sum
+    """
+    def __init__(self, hilbert, edges, site_matrix, bond_coefficient=1.0, field_coefficient=0.0):
+        super().__init__(hilbert)
+        site_matrix = np.asarray(site_matrix)
+        if not np.allclose(site_matrix, np.diag(np.diag(site_matrix))):
+            raise ValueError("The site matrix of a diagonal operator has to be diagonal.")
+        self.edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        self.site_values = np.real(np.diag(site_matrix)).astype(np.float64)
+        self.local_states = np.asarray(hilbert.local_states, dtype=np.float64)
+        self.bond_coefficient = float(bond_coefficient)
+        self.field_coefficient = float(field_coefficient)
+
+    @property
+    def dtype(self):
+        return np.float64
+
+    @property
+    def is_hermitian(self):
+        return True
+
+    # Descriptions used by 'hamiltonian_info'.
+    @property
+    def acting_on(self):
+        return [list(edge) for edge in self.edges] + [[i] for i in range(self.hilbert.size)]
+
+    @property
+    def n_operators(self):
+        return len(self.edges) + self.hilbert.size
+
+    @property
+    def operators(self):
+        return [f"{self.bond_coefficient} * z_i z_j (diagonal {self.site_values})",
+                f"{self.field_coefficient} * z_i (diagonal {self.site_values})"]
+
+    def kernel_arguments(self):
+        # Everything that changes with (J, h) is an array argument, so the jitted kernel is compiled once per lattice.
+        return (jnp.asarray(self.local_states), jnp.asarray(self.site_values), jnp.asarray(self.edges),
+                jnp.asarray([self.bond_coefficient, self.field_coefficient]))
+
+    def diagonal(self, samples):
+        # Diagonal elements of a (n_samples, n_sites) batch, e.g. 'hilbert.all_states()'.
+        return np.asarray(diagonal_local_values(jnp.asarray(samples), self.kernel_arguments()))
+
+    def to_sparse(self):
+        from scipy.sparse import diags
+        return diags(self.diagonal(self.hilbert.all_states()), format='csr')
+
+    def to_dense(self):
+        return np.diag(self.diagonal(self.hilbert.all_states()))
+
+    def __repr__(self):
+        return f"DiagonalOperator(J-term={self.bond_coefficient}, h-term={self.field_coefficient}, " \
+               f"edges={len(self.edges)}, hilbert={self.hilbert})"
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the jitted local values of a diagonal operator -------------------------------------------------------
+@jax.jit
+def diagonal_local_values(samples, arguments):
+    local_states, site_values, edges, coefficients = arguments
+    # Index of the local state of every site in 'local_states', which NetKet does not keep sorted (e.g. [1, -1]).
+    z = site_values[jnp.argmax(samples[..., None] == local_states, axis=-1)]
+    bond = jnp.sum(z[..., edges[:, 0]] * z[..., edges[:, 1]], axis=-1)
+    return coefficients[0] * bond + coefficients[1] * jnp.sum(z, axis=-1)
+
+
+def diagonal_local_kernel(logpsi, pars, samples, arguments):
+    # Kernel for NetKet's expectation values and forces. The local values get the dtype of log(psi), like the local
+    # values of 'LocalOperator'. The shape evaluation does not run the model.
+    dtype = jnp.promote_types(jax.eval_shape(logpsi, pars, samples).dtype, jnp.float64)
+    return diagonal_local_values(samples, arguments).astype(dtype)
+
+
+@get_local_kernel_arguments.dispatch
+def get_local_kernel_arguments(vstate: MCState, op: DiagonalOperator):  # noqa: F811
+    return vstate.samples, op.kernel_arguments()
+
+
+@get_local_kernel.dispatch
+def get_local_kernel(vstate: MCState, op: DiagonalOperator):  # noqa: F811
+    return diagonal_local_kernel
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a LocalOperator whose terms are rescaled without packing it again ------------------------------------
+class RescaledLocalOperator:
+    """
+    NetKet packs a 'LocalOperator' into arrays with one row per term ('acting_on') on its first use, which costs far
+    more than building it. The packed matrix elements are linear in the terms, so the template is packed once and
+    'rescaled(term_coefficients)' returns the template with its i-th term multiplied by 'term_coefficients[i]' and the
+    rescaled packed arrays already set. Terms with a zero coefficient are dropped, as in a product with zero.
+    :param template: LocalOperator, its terms are in the order of 'template.acting_on'
+    """
+    # Packed arrays with one row per term, see 'LocalOperator._setup'.
+    packed_term_arrays = ['_acting_on', '_acting_size', '_diag_mels', '_mels', '_x_prime', '_n_conns', '_local_states',
+                          '_basis']
+
+    @classmethod
+    def supports(cls, template):
+        # The packed arrays are private to NetKet and not the same in every version, e.g. NetKet 3.22 returns a
+        # 'LocalOperatorJax' from a sum. The template is only rescaled if it has all of them.
+        if not isinstance(template, LocalOperator) or not hasattr(template, '_setup'):
+            return False
+        template._setup()
+        return all(hasattr(template, name) for name in cls.packed_term_arrays + ['_operators_dict', 'mel_cutoff'])
+
+    def __init__(self, template):
+        template._setup()
+        self.template = template
+        self.mel_cutoff = template.mel_cutoff
+        # Largest number of off-diagonal connections of every term, summed into 'max_conn_size' like NetKet does.
+        connections = []
+        for matrix in template.operators:
+            nonzero = np.abs(np.asarray(matrix)) > self.mel_cutoff
+            nonzero[np.diag_indices(nonzero.shape[0])] = False
+            connections.append(int(np.max(np.sum(nonzero, axis=1))))
+        self.connections = np.array(connections, dtype=int)
+
+    def rescaled(self, term_coefficients):
+        term_coefficients = np.asarray(term_coefficients)
+        keep = np.abs(term_coefficients) > self.mel_cutoff
+        op = self.template.copy()
+        op._operators_dict = {acting_on: coefficient * matrix for (acting_on, matrix), coefficient, kept
+                              in zip(self.template._operators_dict.items(), term_coefficients, keep) if kept}
+        if np.all(keep):
+            packed = {name: getattr(self.template, name) for name in self.packed_term_arrays}
+        else:
+            packed = {name: getattr(self.template, name)[keep] for name in self.packed_term_arrays}
+        if len(op._operators_dict) == 0:
+            # NetKet can not pack an operator without terms, it is left to NetKet.
+            return op
+        packed['_diag_mels'] = packed['_diag_mels'] * term_coefficients[keep][:, None]
+        packed['_mels'] = packed['_mels'] * term_coefficients[keep][:, None, None]
+        for name, value in packed.items():
+            setattr(op, name, value)
+        op._nonzero_diagonal = bool(np.any(np.abs(packed['_diag_mels']) >= self.mel_cutoff)
+                                    or np.abs(op.constant) >= self.mel_cutoff)
+        op._max_conn_size = int(op._nonzero_diagonal) + int(np.sum(self.connections[keep]))
+        op._initialized = True
+        return op
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the Hamiltonian with the bond and field parts built once per lattice ---------------------------------
+class ParametricHamiltonian:
+    """
+    H(J, h) = (-J/4) * sum_<ij> sz_i sz_j + (-h/2) * sum_i sz_i.
+    With operator = "local" the bond and field terms are built once as one 'LocalOperator', directly from their local
+    matrices, and packed once. A new (J, h) only rescales the packed bond and field terms (see
+    'RescaledLocalOperator'), so it is neither merged nor packed again. If the NetKet version does not support the
+    rescaling, H is (-J/4) * bond + (-h/2) * field, with the bond part built once per J.
+    With operator = "diagonal" every (J, h) is a 'DiagonalOperator' sharing the edge array of the lattice.
+    """
+    def __init__(self, hilbert, graph, operator=None):
+        from netket.operator.spin import sigmaz
+        if operator is None:
+            from parameters import hamiltonian_operator as operator
+        if operator not in ("local", "diagonal"):
+            raise ValueError("Hamiltonian operator not recognized")
+        self.operator = operator
+        self.hilbert = hilbert
+        sz = local_matrix(sigmaz(hilbert, 0))
+        self.sz = sz
+        self.edges = np.array([list(edge) for edge in graph.edges()], dtype=np.int32).reshape(-1, 2)
+        if operator == "local":
+            edges = [list(edge) for edge in graph.edges()]
+            self.bond_operator = LocalOperator(hilbert, operators=[np.kron(sz, sz)] * len(edges), acting_on=edges)
+            self.field_operator = LocalOperator(hilbert, operators=[sz] * graph.n_nodes,
+                                                acting_on=[[i] for i in graph.nodes()])
+            template = self.bond_operator + self.field_operator
+            self.terms = RescaledLocalOperator(template) if RescaledLocalOperator.supports(template) else None
+            if self.terms is not None:
+                # The bonds act on two sites, the field terms on one.
+                self.is_bond_term = np.array([len(acting_on) == 2 for acting_on in self.terms.template.acting_on])
+            self._bond_term = (None, None)
+
+    def __call__(self, J, h):
+        if self.operator == "diagonal":
+            return DiagonalOperator(self.hilbert, edges=self.edges, site_matrix=self.sz, bond_coefficient=-J / 4,
+                                    field_coefficient=-h / 2)
+        if self.terms is not None:
+            return self.terms.rescaled(np.where(self.is_bond_term, -J / 4, -h / 2))
+        # A sweep runs all h values of a J one after the other, so the bond part is kept for the last J.
+        if self._bond_term[0] != J:
+            self._bond_term = (J, (-J / 4) * self.bond_operator)
+        return self._bond_term[1] + (-h / 2) * self.field_operator
 # ----------------------------------------------------------------------------------------------------------------------
 
 # ------ Defining a function to write or print the lattice information to a file ("hamiltonian_info.txt") --------------
@@ -5,7 +5,7 @@
 #                       2. os ("https://docs.python.org/3/library/os.html")
 # Author:               Avishek Singh
 # Date:                 17.05.2022
-# Latest Update:        18.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
@@ -50,12 +50,15 @@ def lattice() -> Graph:
 # ------ Defining a function to write or print the lattice information to a file ("lattice_info.txt") ------------------
 def lattice_info(graph: Graph) -> None:
     from parameters import print_lattice_info, write_lattice_info
+    if print_lattice_info or write_lattice_info:
+        # Computing the automorphisms is expensive on large lattices, so it is done once and only when reported.
+        n_symmetries = len(graph.automorphisms())
     if print_lattice_info:
         # Print lattice information
         print(f"Is lattice Bipartite: {graph.is_bipartite()}")
         print(f"Total sites in lattice: {graph.n_nodes}")
         print(f"Total edges in lattice: {graph.n_edges}")
-        print(f"Total symmetry operations: {len(graph.automorphisms())}")
+        print(f"Total symmetry operations: {n_symmetries}")
         print(f"Edges in Lattice: {graph.edges()}")
 
     if write_lattice_info:
@@ -69,7 +72,7 @@ def lattice_info(graph: Graph) -> None:
             lattice_info_file.write(f"Is lattice Bipartite: {graph.is_bipartite()}\n")
             lattice_info_file.write(f"Total sites in lattice: {graph.n_nodes}\n")
             lattice_info_file.write(f"Total edges in lattice: {graph.n_edges}\n")
-            lattice_info_file.write(f"Total symmetry operations: {len(graph.automorphisms())}\n")
+            lattice_info_file.write(f"Total symmetry operations: {n_symmetries}\n")
             lattice_info_file.write(f"Edges in Lattice: {graph.edges()}\n")
 # ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
@@ -1,6 +1,16 @@
 # ======================================================================================================================
 # Name:                 Artificial Neural Network Construction Module 'neural_network.py'
-# Description:          This module contains functions for constructing Neural Networks.
+# Description:          1. This module contains functions for constructing Neural Networks.
+#                       2. Precision policy ('network_dtype'): the dtype of the weights and of the network computation,
+#                          "float32", "float64", "complex64" or "complex128". The real modes give a real log amplitude,
+#                          a positive wavefunction, which is enough for a stoquastic Hamiltonian like the diagonal one
+#                          of 'hamiltonian.py'.
+#                       3. The single precision modes sum the hidden units of the FFNN models into the log amplitude in
+#                          double precision, so the Metropolis ratios and local energies are computed from float64 (or
+#                          complex128) log amplitudes. The G-CNN keeps its weights in single precision, but its input
+#                          is promoted to double precision, so there it only halves the memory of the weights.
+#                       4. With the default "complex128" the G-CNN is NetKet's default G-CNN (float64 weights and a
+#                          complex output layer), the other network dtypes set the dtype of its weights.
 # Library Dependencies: 1. Netket_module.nn ("https://netket.readthedocs.io/en/latest/api/graph.html")
 #                       2. Netket_module.models ("https://netket.readthedocs.io/en/latest/api/models.html")
 #                       3. jax ("https://jax.readthedocs.io/en/latest/index.html")
@@ -8,7 +18,7 @@
 #                       5. jax.numpy ("https://jax.readthedocs.io/en/latest/jax-101/01-jax-basics.html?highlight=numpy")
 # Author:               Avishek Singh
 # Date:                 19.05.2022
-# Latest Update:        19.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
@@ -17,40 +27,91 @@ import netket.nn as nknn
 import jax.numpy as jnp
 import jax
 import numpy as np
+from typing import Any
+from netket.nn.symmetric_linear import DenseSymmMatrix
+
+# NetKet 3.4 has its own dense layer and names the dtype of the weights of its layers and models 'dtype'. Later versions
+# use the flax dense layer and name it 'param_dtype', there 'dtype' is the dtype of the computation.
+weight_dtype_keyword = 'param_dtype' if 'param_dtype' in DenseSymmMatrix.__dataclass_fields__ else 'dtype'
+if weight_dtype_keyword == 'dtype':
+    Dense = nknn.Dense
+else:
+    from flax.linen import Dense
+# ======================================================================================================================
+
+# ====== Precision Policy ==============================================================================================
+# Network dtype: (dtype of the weights and the computation, dtype the log amplitude is accumulated in)
+precision_policies = {"float32": (np.float32, np.float64), "float64": (np.float64, np.float64),
+                      "complex64": (np.complex64, np.complex128), "complex128": (np.complex128, np.complex128)}
+
+
+# ------ Defining a function to return the dtypes of a network dtype ---------------------------------------------------
+def precision_policy(network_dtype=None):
+    if network_dtype is None:
+        from parameters import network_dtype
+    if network_dtype not in precision_policies:
+        raise ValueError("Network dtype not recognized")
+    return precision_policies[network_dtype]
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to pass the weight dtype to the layers and models -----------------------------------------
+def weight_dtype(dtype):
+    return {weight_dtype_keyword: dtype}
+# ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
 
 # ====== Defining Neural Network Functions =============================================================================
 # ------ Defining a function to create a Neural Network ----------------------------------------------------------------
-def neural_network(graph) -> nknn:
-    from parameters import neural_network_type
-    if neural_network_type == 'DenseFFNN':
+def neural_network(graph, network_type=None, network_dtype=None) -> nknn:
+    # 'network_type' and 'network_dtype' default to 'neural_network_type' and 'network_dtype' of the parameters.
+    if network_type is None:
+        from parameters import neural_network_type as network_type
+    dtype, sum_dtype = precision_policy(network_dtype)
+    if network_type == 'DenseFFNN':
         class FFNN(nknn.Module):
+            dtype: Any = np.complex128
+            sum_dtype: Any = np.complex128
             @nknn.compact
             def __call__(self, x):
-                x = nknn.Dense(features=2 * x.shape[-1], use_bias=True, dtype=np.complex128,
-                               kernel_init=jax.nn.initializers.normal(stddev=0.1),
-                               bias_init=jax.nn.initializers.normal(stddev=0.1))(x)
+                # The spin configurations are cast, so the layer computes in the dtype of its weights.
+                x = jnp.asarray(x, self.dtype)
+                x = Dense(features=2 * x.shape[-1], use_bias=True, **weight_dtype(self.dtype),
+                          kernel_init=jax.nn.initializers.normal(stddev=0.1),
+                          bias_init=jax.nn.initializers.normal(stddev=0.1))(x)
                 x = nknn.log_cosh(x)
-                x = jnp.sum(x, axis=-1)
+                x = jnp.sum(x, axis=-1, dtype=self.sum_dtype)
                 return x
-        return FFNN()
-    elif neural_network_type == 'DenseFFNN_sym':
-        from parameters import alpha
+        return FFNN(dtype=dtype, sum_dtype=sum_dtype)
+    elif network_type == 'DenseFFNN_sym':
+        # The sizes of a network are only in the parameters when it is the network of the sweep, else the defaults.
+        import parameters
+        alpha = getattr(parameters, 'alpha', 4)
         class FFNN_sym(nknn.Module):
             _alpha: int
+            dtype: Any = np.complex128
+            sum_dtype: Any = np.complex128
             @nknn.compact
             def __call__(self, x):
-                x = nknn.Dense(symmetries=graph.translation_group(), features=self._alpha, use_bias=True,
-                               dtype=np.complex128, kernel_init=jax.nn.initializers.normal(stddev=0.1),
-                               bias_init=jax.nn.initializers.normal(stddev=0.1))(x)
+                x = jnp.asarray(x, self.dtype)
+                x = nknn.DenseSymm(symmetries=graph.translation_group(), features=self._alpha, use_bias=True,
+                                   **weight_dtype(self.dtype), kernel_init=jax.nn.initializers.normal(stddev=0.1),
+                                   bias_init=jax.nn.initializers.normal(stddev=0.1))(x)
                 x = nknn.log_cosh(x)
-                x = jnp.sum(x, axis=(-1, -2))
+                x = jnp.sum(x, axis=(-1, -2), dtype=self.sum_dtype)
                 return x
-        return FFNN_sym(_alpha=alpha)
-    elif neural_network_type == 'G-CNN':
-        from parameters import feature_dims, num_layers
+        return FFNN_sym(_alpha=alpha, dtype=dtype, sum_dtype=sum_dtype)
+    elif network_type == 'G-CNN':
+        import parameters
         from netket.models import GCNN
-        return GCNN(symmetries = graph.automorphisms(), layers = num_layers, features = feature_dims)
+        feature_dims = getattr(parameters, 'feature_dims', [8, 8, 8, 8])
+        num_layers = getattr(parameters, 'num_layers', 4)
+        if dtype == np.complex128:
+            # The default policy keeps NetKet's G-CNN: float64 weights and a complex output layer.
+            return GCNN(symmetries=graph.automorphisms(), layers=num_layers, features=tuple(feature_dims))
+        # Real weights give a real log amplitude only without the complex output layer.
+        return GCNN(symmetries=graph.automorphisms(), layers=num_layers, features=tuple(feature_dims),
+                    complex_output=bool(np.issubdtype(dtype, np.complexfloating)), **weight_dtype(dtype))
     else:
         raise ValueError('Neural Network Type not defined.')
+# ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
@@ -1,10 +1,12 @@
 # ======================================================================================================================
 # Name:                 Sampler Construction Module 'sampler.py'
-# Description:          This module contains functions for constructing Monte Carlo Sampler.
+# Description:          1. This module contains functions for constructing Monte Carlo Sampler.
+#                       2. With 'autotune_sampler' the configuration found by the sampler autotuner is used instead of
+#                          the one in 'parameters.py' (see sampler_tuning.py).
 # Library Dependencies: 1. Netket_module.sampler ("https://netket.readthedocs.io/en/latest/api/sampler.html")
 # Author:               Avishek Singh
 # Date:                 19.05.2022
-# Latest Update:        19.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
@@ -14,35 +16,22 @@ from netket.sampler import MetropolisLocal, MetropolisExchange
 # ======================================================================================================================
 
 # ====== Defining Sampler Functions ====================================================================================
+# ------ Defining a function to create a sampler from a sampler configuration ------------------------------------------
+def build_sampler(hilbert, graph, config) -> nk_sampler:
+    # 'config' holds the names of 'sampler_tuning.sampler_parameter_names'. "None" values take the NetKet default.
+    kwargs = {key: config[key] for key in ['n_chains_per_rank', 'machine_pow', 'n_sweeps']
+              if config.get(key) is not None}
+    if config['sampler_type'] == "Local":
+        return MetropolisLocal(hilbert=hilbert, **kwargs)
+    elif config['sampler_type'] == "Exchange":
+        return MetropolisExchange(hilbert=hilbert, graph=graph, d_max=config.get('d_max') or 1, **kwargs)
+    else:
+        raise ValueError("Sampler type not recognized. Please choose either Local or Exchange.")
+# ----------------------------------------------------------------------------------------------------------------------
+
 # ------ Defining a function to create a sampler -----------------------------------------------------------------------
 def sampler(hilbert, graph) -> nk_sampler:
-    from parameters import sampler_type, n_chains_per_rank, machine_pow
-    if sampler_type == "Local":
-        if n_chains_per_rank is None and machine_pow is None:
-            return MetropolisLocal(hilbert=hilbert)
-        elif n_chains_per_rank is not None and machine_pow is not None:
-            return MetropolisLocal(hilbert=hilbert, n_chains_per_rank=n_chains_per_rank, machine_pow=machine_pow)
-        elif n_chains_per_rank is None and machine_pow is not None:
-            return MetropolisLocal(hilbert=hilbert, machine_pow=machine_pow)
-        elif n_chains_per_rank is not None and machine_pow is None:
-            return MetropolisLocal(hilbert=hilbert, n_chains_per_rank=n_chains_per_rank)
-        else:
-            raise ValueError("Please provide either n_chains_per_rank or machine_pow.")
-    elif sampler_type == "exchange":
-        from parameters import d_max
-        if n_chains_per_rank is None and machine_pow is None:
-            return MetropolisExchange(hilbert=hilbert, graph=graph, d_max=d_max)
-        elif n_chains_per_rank is not None and machine_pow is not None:
-            return MetropolisExchange(hilbert=hilbert, graph=graph, d_max=d_max, n_chains_per_rank=n_chains_per_rank,
-                                      machine_pow=machine_pow)
-        elif n_chains_per_rank is None and machine_pow is not None:
-            return MetropolisExchange(hilbert=hilbert, graph=graph, d_max=d_max, machine_pow=machine_pow)
-        elif n_chains_per_rank is not None and machine_pow is None:
-            return MetropolisExchange(hilbert=hilbert, graph=graph, d_max=d_max, n_chains_per_rank=n_chains_per_rank)
-        else:
-            raise ValueError("Please provide either n_chains_per_rank or machine_pow.")
-    else:
-        print("Sampler type not recognized. Please choose either local or exchange.")
-        return
+    from Function_Tools.Netket_module.sampler_tuning import sampler_parameters
+    return build_sampler(hilbert=hilbert, graph=graph, config=sampler_parameters())
 # ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
@@ -0,0 +1,240 @@
+# ======================================================================================================================
+# Name:                 Sampler Autotuning Module 'sampler_tuning.py'
+# Description:          1. This module measures candidate sampler configurations on the model and Hamiltonian of the
+#                          sweep before the sweep starts and keeps the fastest one for all points.
+#                       2. Candidates: every sampler rule that is ergodic on the Hilbert space, the chain counts, the
+#                          sweep sizes ('n_sweeps', Metropolis steps per sample) and the discarded samples per chain of
+#                          the 'autotune_*' parameters, plus the configuration of 'parameters.py'. "Local" flips change
+#                          the total spin and "Exchange" moves conserve it, so "Local" is used on unconstrained and
+#                          "Exchange" on constrained (total_sz) Hilbert spaces.
+#                       3. The network is first trained for 'autotune_warmup_iterations' VMC iterations at the centre
+#                          of the grid. Every candidate then runs 'autotune_repeats' VMC iterations from these
+#                          parameters. The integrated autocorrelation time tau of the local energies along the chains
+#                          gives the effective number of independent samples of an iteration, n / (1 + 2 tau). The
+#                          score is effective samples per second of the whole VMC iteration. NetKet's 'error_of_mean'
+#                          is not used: below 32 chains it assumes independent samples.
+#                       4. The result is saved in 'sampler_autotune.json' next to the per point sweep information, with
+#                          a key of the simulation parameters. The sweep processes read the configuration from there,
+#                          and the tuned configuration is part of the results store hash. A restarted sweep with the
+#                          same parameters reuses the saved result. 'sampler_autotune.txt' holds all measurements.
+# Library Dependencies: 1. netket ("https://netket.readthedocs.io/")
+#                       2. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import hashlib
+import itertools
+import json
+import os
+import time
+import numpy as np
+# ======================================================================================================================
+
+# ====== Sampler Configuration =========================================================================================
+# Parameters of the sampler and of the sampling of the variational state that the autotuner can set.
+sampler_parameter_names = ['sampler_type', 'n_chains_per_rank', 'machine_pow', 'n_sweeps', 'n_discard_per_chain',
+                           'd_max']
+
+
+# ------ Defining a function to return the path of the autotuning result -----------------------------------------------
+def autotune_file():
+    from parameters import point_info_path
+    return os.path.join(point_info_path, 'sampler_autotune.json')
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to hash the parameters the autotuning result depends on -----------------------------------
+def tuning_key():
+    import parameters
+    from Function_Tools.Sweep_Module.results_store import simulation_parameters
+    simulation_dict = simulation_parameters(sampler_autotune=False)
+    for key in sampler_parameter_names:
+        simulation_dict.pop(key, None)
+    for key in ['autotune_rules', 'autotune_chains', 'autotune_sweep_factors', 'autotune_discards',
+                'autotune_warmup_iterations', 'autotune_repeats']:
+        simulation_dict[key] = getattr(parameters, key)
+    tuning_string = json.dumps(simulation_dict, sort_keys=True, default=repr)
+    return hashlib.sha256(tuning_string.encode()).hexdigest()[:16]
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to load the autotuning result of the current parameters -----------------------------------
+def load_autotune():
+    # Returns None if there is no result or if it was measured for different parameters.
+    path = autotune_file()
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as autotune_json:
+        tuned = json.load(autotune_json)
+    return tuned if tuned.get('key') == tuning_key() else None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the sampler configuration of the sweep ------------------------------------------
+def sampler_parameters():
+    # {name: value} of 'sampler_parameter_names'. The values of 'parameters.py', replaced by the autotuned ones.
+    import parameters
+    config = {key: getattr(parameters, key, None) for key in sampler_parameter_names}
+    if parameters.autotune_sampler:
+        tuned = load_autotune()
+        if tuned is not None:
+            config.update(tuned['configuration'])
+    return config
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Sampler Autotuner =============================================================================================
+# ------ Defining a function to list the candidate configurations ------------------------------------------------------
+def candidate_configurations(hilbert):
+    import parameters
+    from parameters import autotune_rules, autotune_chains, autotune_sweep_factors, autotune_discards
+    for rule in autotune_rules:
+        if rule not in ("Local", "Exchange"):
+            raise ValueError("Sampler type not recognized. Please choose either Local or Exchange.")
+    # Only the ergodic rules: single flips leave a constrained Hilbert space, exchanges never change the total spin.
+    rules = [rule for rule in autotune_rules if (rule == "Exchange") == bool(hilbert.constrained)]
+    if not rules:
+        raise ValueError("No autotune rule samples this Hilbert space. Add 'Local' (unconstrained) or 'Exchange' "
+                         "(constrained) to autotune_rules.")
+    candidates = [dict(sampler_parameters(), source='parameters')]
+    for rule, n_chains, factor, n_discard in itertools.product(rules, autotune_chains, autotune_sweep_factors,
+                                                               autotune_discards):
+        candidates.append({'sampler_type': rule, 'n_chains_per_rank': n_chains,
+                           'machine_pow': parameters.machine_pow, 'n_sweeps': max(1, int(round(factor * hilbert.size))),
+                           'n_discard_per_chain': n_discard, 'd_max': getattr(parameters, 'd_max', 1),
+                           'source': 'autotune'})
+    return candidates
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to estimate the autocorrelation time of Markov chains -------------------------------------
+def autocorrelation_time(chains_list, window=5):
+    # 'chains_list' of (chains, chain length) arrays of one quantity. The autocorrelation function is averaged over all
+    # chains and arrays and summed up to the first lag t >= window * (1/2 + tau) (Sokal). The deviations are taken from
+    # the mean of all samples, so chains that have not reached equilibrium count as correlated. n / ess = 1 + 2 tau.
+    deviations = [np.real(chains) - np.mean(np.real(chains)) for chains in chains_list]
+    variance = np.mean([np.mean(x ** 2) for x in deviations])
+    if variance == 0:
+        return 0.0
+    tau = 0.0
+    for lag in range(1, min(x.shape[1] for x in deviations)):
+        tau += np.mean([np.mean(x[:, :-lag] * x[:, lag:]) for x in deviations]) / variance
+        if lag >= window * (0.5 + tau):
+            break
+    return max(tau, 0.0)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the local energies of the samples -----------------------------------------------
+def local_energies(vstate, ha):
+    # Local energies laid out like the samples. 'MCState.local_estimators' only exists since NetKet 3.5, before it they
+    # are computed with the local kernel NetKet's expectation values use, which takes a flat batch of samples.
+    if hasattr(vstate, 'local_estimators'):
+        return np.asarray(vstate.local_estimators(ha))
+    from netket.vqs import get_local_kernel, get_local_kernel_arguments
+    samples, arguments = get_local_kernel_arguments(vstate, ha)
+    kernel = get_local_kernel(vstate, ha)
+
+    def logpsi(parameters, x):
+        return vstate._apply_fun({'params': parameters, **vstate.model_state}, x)
+    values = kernel(logpsi, vstate.parameters, samples.reshape((-1, samples.shape[-1])), arguments)
+    return np.asarray(values).reshape(samples.shape[:-1])
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to measure one sampler configuration ------------------------------------------------------
+def measure_configuration(context, ha, trained_parameters, config, repeats):
+    # VMC iterations with the configuration, started from the trained parameters. The first one compiles.
+    import jax
+    from netket.vqs import MCState
+    from netket.optimizer import SR
+    from netket.driver import VMC
+    from parameters import samples
+    from Function_Tools.Netket_module.sampler import build_sampler
+    from Function_Tools.Netket_module.burn_in import chains_first
+    sampler = build_sampler(hilbert=context.hilbert, graph=context.graph, config=config)
+    vstate = MCState(sampler=sampler, model=context.model, n_samples=samples,
+                     n_discard_per_chain=config['n_discard_per_chain'], seed=0, sampler_seed=0)
+    vstate.parameters = trained_parameters
+    gs = VMC(hamiltonian=ha, optimizer=context.optimizer, variational_state=vstate,
+             preconditioner=SR(diag_shift=0.01))
+    gs.advance(1)
+    jax.block_until_ready(vstate.parameters)
+    elapsed, chains_list = 0.0, []
+    for repeat in range(repeats):
+        start = time.perf_counter()
+        gs.advance(1)
+        jax.block_until_ready(vstate.parameters)
+        elapsed += time.perf_counter() - start
+        # Local energies of the samples of the iteration, one row per chain.
+        chains_list.append(chains_first(local_energies(vstate, ha)))
+    tau = autocorrelation_time(chains_list)
+    effective_samples = vstate.n_samples / (1 + 2 * tau)
+    return {'source': config['source'], 'sampler_type': config['sampler_type'],
+            'n_chains_per_rank': sampler.n_chains_per_rank, 'n_sweeps': sampler.n_sweeps,
+            'n_discard_per_chain': vstate.n_discard_per_chain, 'chain_length': vstate.chain_length,
+            'acceptance': float(getattr(vstate.sampler_state, 'acceptance', np.nan)), 'tau': tau,
+            'ess_per_iteration': effective_samples, 'iteration_ms': 1e3 * elapsed / repeats,
+            'ess_per_s': effective_samples * repeats / elapsed}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to autotune the sampler of a sweep --------------------------------------------------------
+def autotune(J_ex_list, h_ex_list):
+    # Returns the autotuning result, measured only if there is none for the current parameters. Returns None if the
+    # sweep does not use 'MCState' sampling.
+    import pandas as pd
+    import parameters
+    from parameters import point_info_path, autotune_warmup_iterations, autotune_repeats
+    tuned = load_autotune()
+    if tuned is not None:
+        print(f"Sampler autotuning: reusing {autotune_file()}")
+        return tuned
+    from HMEX import SimulationContext
+    from netket.optimizer import SR
+    from netket.driver import VMC
+    from Function_Tools.Sweep_Module.results_store import write_atomic
+    # A context of its own, so the context of the sweep is built with the tuned sampler.
+    context = SimulationContext()
+    if context.state_backend == "exact":
+        print("Sampler autotuning skipped: the sweep does not sample with 'MCState'.")
+        return None
+    start = time.perf_counter()
+    J, h = float(J_ex_list[len(J_ex_list) // 2]), float(h_ex_list[len(h_ex_list) // 2])
+    ha = context.hamiltonian(J=J, h=h)
+
+    # ----- Training the network at the centre of the grid -------------------------------------------------------------
+    vstate = context.variational_state()
+    gs = VMC(hamiltonian=ha, optimizer=context.optimizer, variational_state=vstate,
+             preconditioner=SR(diag_shift=0.01))
+    gs.advance(autotune_warmup_iterations)
+    # ------------------------------------------------------------------------------------------------------------------
+
+    rows = [measure_configuration(context=context, ha=ha, trained_parameters=vstate.parameters, config=config,
+                                  repeats=autotune_repeats)
+            for config in candidate_configurations(context.hilbert)]
+    autotune_df = pd.DataFrame(rows).sort_values('ess_per_s', ascending=False, kind='stable')
+    best = autotune_df.iloc[0]
+    parameters_ess_per_s = float(autotune_df.loc[autotune_df['source'] == 'parameters', 'ess_per_s'].iloc[0])
+    configuration = dict(sampler_parameters())
+    configuration.update({'sampler_type': best['sampler_type'], 'n_chains_per_rank': int(best['n_chains_per_rank']),
+                          'n_sweeps': int(best['n_sweeps']), 'n_discard_per_chain': int(best['n_discard_per_chain'])})
+    if configuration['sampler_type'] == "Exchange":
+        configuration['d_max'] = getattr(parameters, 'd_max', 1)
+    tuned = {'key': tuning_key(), 'J': J, 'h': h, 'configuration': configuration,
+             'ess_per_s': float(best['ess_per_s']), 'parameters_ess_per_s': parameters_ess_per_s,
+             'speedup': float(best['ess_per_s']) / parameters_ess_per_s, 'candidates': len(rows),
+             'tuning_time': time.perf_counter() - start}
+
+    # ----- Writing the autotuning result to file ----------------------------------------------------------------------
+    isExists = os.path.exists(point_info_path)
+    if not isExists:
+        os.makedirs(point_info_path)
+    write_atomic(os.path.join(point_info_path, 'sampler_autotune.txt'),
+                 autotune_df.to_string(header=True, index=False))
+    write_atomic(autotune_file(), json.dumps(tuned, indent=1))
+    # ------------------------------------------------------------------------------------------------------------------
+    print(f"Sampler autotuning: {configuration['sampler_type']}, {configuration['n_chains_per_rank']} chains, "
+          f"n_sweeps = {configuration['n_sweeps']}, n_discard_per_chain = {configuration['n_discard_per_chain']}, "
+          f"{tuned['speedup']:.2f}x the effective samples per second of parameters.py "
+          f"({len(rows)} candidates in {tuned['tuning_time']:.1f} s)")
+    return tuned
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,158 @@
+# ======================================================================================================================
+# Name:                 Streaming Logger Module 'streaming_log.py'
+# Description:          1. This module contains a logger for the VMC driver that replaces 'RuntimeLog' and
+#                          'parse_logger_data'.
+#                       2. Every iteration only the real means of the energy and the observables are kept, as one row of
+#                          floats, instead of the full statistics objects of every iteration.
+#                       3. A ring buffer holds the last 'n_values' rows for the running averages. The full trace is kept
+#                          in a preallocated array ("memory"), spilled to disk in chunks ("disk", constant memory per
+#                          point) or not kept at all ("none").
+#                       4. 'parsed_data()' returns the rows laid out like 'parse_logger_data' without a parse pass.
+#                       5. From 'average_from' on, every row and its Monte Carlo errors ('error_of_mean') update an
+#                          online estimator (see estimators.py). 'statistics()' returns the error bars of the averages.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import os
+import pandas as pd
+from Function_Tools.Netket_module.estimators import OnlineEstimator, estimate
+# ======================================================================================================================
+
+# ====== Streaming Logger ==============================================================================================
+# ------ Defining a logger that keeps the iterations as compact float rows ---------------------------------------------
+class StreamingLog:
+    """
+    Logger for 'VMC.run(out=...)'. A row is [iteration, Energy, observables...].
+    :param obs_list: names of the observables, the columns of the parsed data next to 'iters' and 'Energy'
+    :param n_iter: expected number of iterations, the size of the preallocated trace ("memory")
+    :param n_values: size of the ring buffer of the last iterations
+    :param trace: "memory", "disk" or "none" (only the last 'n_values' iterations are returned)
+    :param spill_file: binary file the trace is appended to in "disk" mode (removed by 'close')
+    :param chunk_size: number of rows written to 'spill_file' at once
+    :param average_from: first iteration of the averaging window, usually 'n_iter - n_values'
+    :param min_blocks: smallest number of blocks used by the blocking analysis of the estimator
+    """
+    def __init__(self, obs_list, n_iter, n_values, trace="memory", spill_file=None, chunk_size=256, average_from=None,
+                 min_blocks=4):
+        if trace not in ("memory", "disk", "none"):
+            raise ValueError("Logger trace mode not recognized")
+        if trace == "disk" and spill_file is None:
+            raise ValueError("The disk trace needs a spill file.")
+        self.columns = ['iters', 'Energy'] + list(obs_list)
+        self.obs_list = list(obs_list)
+        self.trace = trace
+        self.spill_file = spill_file
+        n_columns = len(self.columns)
+        self._ring = np.empty((max(1, n_values), n_columns))
+        self._ring_errors = np.empty((max(1, n_values), n_columns - 1))
+        self._n_rows = 0
+        self.average_from = max(0, n_iter - n_values) if average_from is None else average_from
+        self.min_blocks = min_blocks
+        self.estimator = OnlineEstimator(n_fields=n_columns - 1, min_blocks=min_blocks)
+        if trace == "memory":
+            self._trace = np.empty((max(1, n_iter), n_columns))
+        elif trace == "disk":
+            self._trace = np.empty((max(1, chunk_size), n_columns))
+            self._n_spilled = 0
+            # A stale file of an earlier run at the same point would otherwise be read back.
+            with open(spill_file, 'wb'):
+                pass
+
+    def __call__(self, step, item, variational_state=None):
+        # Observables skipped by the observable schedule (see observable_schedule.py) are recorded as NaN.
+        row = [step, np.real(item['Energy'].mean)]
+        row.extend(np.real(item[name].mean) if name in item else np.nan for name in self.obs_list)
+        errors = [np.real(getattr(item[name], 'error_of_mean', np.nan)) if name in item else np.nan
+                  for name in self.columns[1:]]
+        self.record(row, errors)
+
+    def record(self, row, errors=None):
+        # 'row' is [iteration, Energy, observables...], 'errors' the Monte Carlo errors of all but the iteration.
+        if errors is None:
+            errors = np.full(len(self.columns) - 1, np.nan)
+        self._ring[self._n_rows % len(self._ring)] = row
+        self._ring_errors[self._n_rows % len(self._ring)] = errors
+        if self._n_rows >= self.average_from:
+            self.estimator.update(row[1:], errors)
+        if self.trace == "memory":
+            if self._n_rows == len(self._trace):
+                self._trace = np.concatenate([self._trace, np.empty_like(self._trace)])
+            self._trace[self._n_rows] = row
+        elif self.trace == "disk":
+            self._trace[self._n_rows - self._n_spilled] = row
+            if self._n_rows + 1 - self._n_spilled == len(self._trace):
+                self._spill(self._n_rows + 1)
+        self._n_rows += 1
+
+    def _spill(self, n_rows):
+        with open(self.spill_file, 'ab') as spill_file:
+            self._trace[:n_rows - self._n_spilled].tofile(spill_file)
+        self._n_spilled = n_rows
+        return None
+
+    def flush(self, variational_state=None):
+        if self.trace == "disk" and self._n_rows > self._n_spilled:
+            self._spill(self._n_rows)
+        return None
+
+    def last_rows(self):
+        # The last 'n_values' rows (fewer at the start of a run), oldest first.
+        n_ring = min(self._n_rows, len(self._ring))
+        return np.roll(self._ring, -(self._n_rows % len(self._ring)), axis=0)[len(self._ring) - n_ring:]
+
+    def last_errors(self):
+        # Monte Carlo errors of the last 'n_values' rows, without the iteration column.
+        n_ring = min(self._n_rows, len(self._ring))
+        return np.roll(self._ring_errors, -(self._n_rows % len(self._ring)), axis=0)[len(self._ring) - n_ring:]
+
+    def statistics(self):
+        # Statistics of the last 'n_values' iterations (see estimators.py). If the run stopped early, the window is not
+        # the one the online estimator started on, and the statistics are computed from the ring buffer instead.
+        if self.estimator.count == min(self._n_rows, len(self._ring)):
+            return self.estimator.result()
+        return estimate(self.last_rows()[:, 1:], errors=self.last_errors(), min_blocks=self.min_blocks)
+
+    def running_means(self):
+        # Mean of the energy and every observable over the last 'n_values' iterations.
+        means = np.mean(self.last_rows()[:, 1:], axis=0)
+        return dict(zip(self.columns[1:], means))
+
+    def parsed_data(self):
+        if self.trace == "memory":
+            rows = self._trace[:self._n_rows]
+        elif self.trace == "disk":
+            self.flush()
+            rows = np.fromfile(self.spill_file).reshape(-1, len(self.columns))
+        else:
+            rows = self.last_rows()
+        parsed_data_df = pd.DataFrame(rows, columns=self.columns)
+        parsed_data_df['iters'] = parsed_data_df['iters'].astype(int)
+        return parsed_data_df
+
+    def close(self):
+        # The trace is handed on by 'parsed_data', so the spill file is only a buffer of the run.
+        if self.trace == "disk" and os.path.exists(self.spill_file):
+            os.remove(self.spill_file)
+        return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the logger of a point from the parameters ---------------------------------------
+def streaming_log(obs_list, n_iter, J, h):
+    from parameters import log_trace, log_chunk_size, log_spill_path, n_values, estimator_min_blocks
+    spill_file = None
+    if log_trace == "disk":
+        isExists = os.path.exists(log_spill_path)
+        if not isExists:
+            os.makedirs(log_spill_path)
+        spill_file = os.path.join(log_spill_path, 'trace_(J=' + str(J) + ',h=' + str(h) + ').bin')
+    return StreamingLog(obs_list=obs_list, n_iter=n_iter, n_values=n_values, trace=log_trace, spill_file=spill_file,
+                        chunk_size=log_chunk_size, min_blocks=estimator_min_blocks)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,58 @@
+# ======================================================================================================================
+# Name:                 Observable Schedule Module 'observable_schedule.py'
+# Description:          1. This module contains a callback for the VMC driver that evaluates every observable on its own
+#                          schedule, instead of evaluating all of them on every iteration with 'run(obs=...)'.
+#                       2. Schedule of an observable: 1 (every iteration), k (every k-th iteration) or "window" (only in
+#                          the averaging window, the last 'n_values' iterations of a point).
+#                       3. The averaging window is always evaluated, so the averages and their errors use the same
+#                          iterations as without a schedule. With early stopping the convergence monitor runs the window
+#                          after the point has converged (see convergence.py), or it is the last 'n_values' iterations.
+#                       4. Skipped observables are missing from the log data of the iteration. The loggers record NaN.
+# Library Dependencies: 1. netket.driver ("https://netket.readthedocs.io/en/latest/api/drivers.html")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Observable Schedule ===========================================================================================
+# ------ Defining a VMC callback that evaluates the observables that are due -------------------------------------------
+class ObservableSchedule:
+    """
+    Callback for 'VMC.run(callback=...)'. Has to come before the callbacks and loggers that read the observables.
+    :param obs: {name: operator} of the observables
+    :param schedule: {name: 1, k or "window"}, observables that are not listed are evaluated on every iteration
+    :param window_start: first iteration of the averaging window of a run that is not stopped early
+    :param monitor: convergence monitor of the run, the window also starts after it has converged
+    """
+    def __init__(self, obs, schedule, window_start, monitor=None):
+        for name, every in schedule.items():
+            if not (every == "window" or (isinstance(every, int) and every >= 1)):
+                raise ValueError(f"Observable schedule of '{name}' not recognized")
+        self.obs = obs
+        self.schedule = {name: schedule.get(name, 1) for name in obs}
+        self.window_start = max(0, window_start)
+        self.monitor = monitor
+        self.n_evaluated = dict.fromkeys(obs, 0)
+
+    def is_due(self, name, step):
+        every = self.schedule[name]
+        if step >= self.window_start or (self.monitor is not None and self.monitor.converged):
+            return True
+        return every != "window" and step % every == 0
+
+    def __call__(self, step, log_data, driver):
+        # The samples of the iteration are still those of the energy, the parameters are updated after the callbacks.
+        for name, op in self.obs.items():
+            if self.is_due(name, step):
+                log_data[name] = driver.state.expect(op)
+                self.n_evaluated[name] += 1
+        return True
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the observable schedule of a point from the parameters --------------------------
+def observable_schedule(obs, n_iter, monitor=None):
+    from parameters import observable_schedule as schedule, n_values
+    return ObservableSchedule(obs=obs, schedule=schedule, window_start=n_iter - n_values, monitor=monitor)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -5,13 +5,15 @@
 #                       2. os ("https://docs.python.org/3/library/os.html")
 # Author:               Avishek Singh
 # Date:                 20.05.2022
-# Latest Update:        26.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
 # ====== Importing Libraries ===========================================================================================
 from netket.operator import LocalOperator
 from netket.operator.spin import sigmaz, sigmax, sigmay
+import numpy as np
+from Function_Tools.Netket_module.hamiltonian import local_matrix, DiagonalOperator
 # ======================================================================================================================
 
 # ====== Defining Observable Functions =================================================================================
@@ -19,25 +21,59 @@ obs_list = ['MSX', 'MSY', 'MSZ', 'chi_corrZ']
 # ======================================================================================================================
 # ------ Defining Observable list --------------------------------------------------------------------------------------
 def observables(hilbert, graph, J):
-    obs_dict = {}
-    for items in obs_list:
-        if items == 'MSX':
-            obs_dict[items] = LocalOperator(hilbert, dtype=complex)
-            obs_dict[items] = sum([sigmax(hilbert, i) / 2 for i in graph.nodes()])
-        elif items == 'MSY':
-            obs_dict[items] = LocalOperator(hilbert, dtype=complex)
-            obs_dict[items] = sum([sigmay(hilbert, i) / 2 for i in graph.nodes()])
-        elif items == 'MSZ':
-            obs_dict[items] = LocalOperator(hilbert, dtype=complex)
-            obs_dict[items] = sum([sigmaz(hilbert, i) / 2 for i in graph.nodes()])
-        elif items == 'chi_corrZ':
-            obs_dict[items] = LocalOperator(hilbert, dtype=complex)
-            obs_dict[items] = sum([-J * sigmay(hilbert, i) * sigmay(hilbert, j) for i, j in graph.edges()])
+    return ParametricObservables(hilbert=hilbert, graph=graph)(J=J)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the observables with the J independent parts built once per sweep ------------------------------------
+class ParametricObservables:
+    """
+    MSX, MSY and MSZ do not depend on J or h and are built once. chi_corrZ = -J * sum_<ij> sy_i sy_j is built once
+    for J = 1 and rescaled, and the rescaled operator is cached per distinct J value.
+    With operator = "diagonal" the diagonal observable MSZ is a 'DiagonalOperator', whose local values are computed
+    straight from the samples (see hamiltonian.py). With operator = "local" all observables are 'LocalOperator'.
+    """
+    def __init__(self, hilbert, graph, operator=None):
+        if operator is None:
+            from parameters import hamiltonian_operator as operator
+        if operator not in ("local", "diagonal"):
+            raise ValueError("Observable operator not recognized")
+        nodes = [[i] for i in graph.nodes()]
+        edges = [list(edge) for edge in graph.edges()]
+        self._operators = {}
+        self._chi_corr_cache = {}
+        for items in obs_list:
+            if items == 'MSX':
+                sx = local_matrix(sigmax(hilbert, 0))
+                self._operators[items] = LocalOperator(hilbert, operators=[sx / 2] * len(nodes), acting_on=nodes)
+            elif items == 'MSY':
+                sy = local_matrix(sigmay(hilbert, 0))
+                self._operators[items] = LocalOperator(hilbert, operators=[sy / 2] * len(nodes), acting_on=nodes)
+            elif items == 'MSZ':
+                sz = local_matrix(sigmaz(hilbert, 0))
+                if operator == "diagonal":
+                    self._operators[items] = DiagonalOperator(hilbert, edges=[], site_matrix=sz / 2,
+                                                              bond_coefficient=0.0, field_coefficient=1.0)
+                else:
+                    self._operators[items] = LocalOperator(hilbert, operators=[sz / 2] * len(nodes), acting_on=nodes)
+            elif items == 'chi_corrZ':
+                sy = local_matrix(sigmay(hilbert, 0))
+                self._operators[items] = LocalOperator(hilbert, operators=[np.kron(sy, sy)] * len(edges),
+                                                       acting_on=edges)
+            else:
+                raise ValueError('Observables not defined')
+
+    def __call__(self, J):
+        obs_dict = {}
+        for items in obs_list:
+            if items == 'chi_corrZ':
+                if J not in self._chi_corr_cache:
+                    self._chi_corr_cache[J] = -J * self._operators[items]
+                obs_dict[items] = self._chi_corr_cache[J]
+            else:
+                obs_dict[items] = self._operators[items]
+        if obs_list != list(obs_dict.keys()):
+            raise ValueError(f'Observables not defined')
         else:
-            raise ValueError('Observables not defined')
-    if obs_list != list(obs_dict.keys()):
-        raise ValueError(f'Observables not defined')
-    else:
-        return obs_dict
+            return obs_dict
 # ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
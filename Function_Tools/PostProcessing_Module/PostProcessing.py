@@ -1,12 +1,22 @@
 # ======================================================================================================================
 # Name:                  Post Processing Module 'PostProcessing.py'
-# Description:           This module contains functions to post process the results of the simulation.
+# Description:           1. This module contains functions to post process the results of the simulation.
+#                        2. 'post_process' is the engine: it works on the (J, h, field) array of averages, either from
+#                           the sweep in memory ('ResultAccumulator.means') or read once with 'read_J_parsed'. Per site
+#                           data, magnetic susceptibility and spin angle are computed for all J columns at once, and
+#                           every output file is written exactly once.
+#                        3. 'perSiteData', 'computeMagneticSusceptibility' and 'computeAngle' compute single outputs
+#                           from the files with the same functions.
+#                        4. 'chi.txt' keeps its layout: forward differences |m(h_i+1) - m(h_i)| / (h_i+1 - h_i), one
+#                           row per interval, reported at its left h. 'chi_gradient.txt' holds chi = |dm/dh| at every h
+#                           ('np.gradient', second order also on the non-uniform grids of adaptive sweeps), in the
+#                           layout of the J parsed files.
 # Library Dependencies:  1. numpy ("https://numpy.org/")
 #                        2. os ("https://docs.python.org/3/library/os.html")
 #                        3. pandas ("https://pandas.pydata.org/")
 # Author:                Avishek Singh
 # Date:                  20.05.2022
-# Latest Update:         29.05.2022
+# Latest Update:         18.10.2026
 # Version:               1.0.0
 # ======================================================================================================================
 
@@ -14,24 +24,89 @@
 import numpy as np
 import pandas as pd
 import os
-from jax import grad
 # ======================================================================================================================
 
 # ====== Post Processing Module ========================================================================================
 # ------ Per Site Data Processing --------------------------------------------------------------------------------------
-def perSiteData(directory_path, column_names):
-    from Function_Tools.Netket_module.lattice import lattice
-    gp = lattice()
-    for file in os.listdir(directory_path):
-        if file.endswith(".txt"):
-            filePath = directory_path + file
-            df = pd.read_fwf(filePath)
-            for column in column_names:
-                df[column] = df[column]/gp.n_nodes
-            writePath = directory_path + "PerSite_" + file
-            with open(writePath, 'w') as file_df:
-                dfAsString = df.to_string(header=True, index=False)
-                file_df.write(dfAsString)
+def numberOfSites():
+    # Number of lattice sites from the parameters, without building the NetKet graph (see lattice.py).
+    from parameters import lattice_type
+    if lattice_type == 'hypercube':
+        from parameters import length, dim
+        return length ** dim
+    elif lattice_type == 'custom':
+        from parameters import atomic_positions, dimensions
+        return len(atomic_positions) * int(np.prod(dimensions))
+    else:
+        raise ValueError("Lattice type not recognized")
+
+
+def read_J_parsed(directory_path, errors=False):
+    # Returns h_values, J_columns, fields and the (J, h, field) array of the J parsed files in 'directory_path'. The
+    # outputs of the post processing, the error files and the exact reference files are skipped, so it can run again
+    # on the same directory. With 'errors' the (J, h, field) array of the '<field>_error.txt' files is returned as well
+    # (NaN where missing).
+    fields, frames = [], []
+    for file in sorted(os.listdir(directory_path)):
+        if file.endswith(".txt") and not file.startswith("PerSite_") and file not in ["chi.txt", "chi_gradient.txt", "Angle.txt"] \
+                and not file.endswith(("_error.txt", "_exact.txt")):
+            fields.append(file[:-len(".txt")])
+            frames.append(pd.read_fwf(os.path.join(directory_path, file)))
+    if len(frames) == 0:
+        raise FileNotFoundError("No J parsed files found in the specified path")
+    h_values = frames[0]["#h"].values
+    J_columns = [column for column in frames[0].columns if column != "#h"]
+    values = np.stack([df[J_columns].to_numpy(dtype=np.float64) for df in frames], axis=-1).transpose(1, 0, 2)
+    if errors is not True:
+        return h_values, J_columns, fields, values
+    error_values = np.full(values.shape, np.nan)
+    for k, item in enumerate(fields):
+        error_file = os.path.join(directory_path, item + "_error.txt")
+        if os.path.exists(error_file):
+            error_values[:, :, k] = pd.read_fwf(error_file)[J_columns].to_numpy(dtype=np.float64).T
+    return h_values, J_columns, fields, values, error_values
+
+
+def perSiteValues(values, J_columns, column_names=None):
+    # Divides the columns 'column_names' (default: every 'j=..' column) of a (J, h, ...) array by the number of sites.
+    if column_names is None:
+        column_names = [column for column in J_columns if column.startswith('j=')]
+    selected = np.isin(J_columns, column_names)
+    per_site = np.array(values, dtype=np.float64)
+    per_site[selected] /= numberOfSites()
+    return per_site
+
+
+def perSiteData(directory_path, column_names=None):
+    # 'column_names' defaults to every 'j=..' column.
+    h_values, J_columns, fields, values = read_J_parsed(directory_path)
+    per_site = perSiteValues(values=values, J_columns=J_columns, column_names=column_names)
+    for k, item in enumerate(fields):
+        writeFrame(os.path.join(directory_path, "PerSite_" + item + ".txt"),
+                   hFrame(h_values=h_values, J_columns=J_columns, values=per_site[:, :, k]))
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Frame Helpers -------------------------------------------------------------------------------------------------
+def hFrame(h_values, J_columns, values):
+    # DataFrame in the layout of the J parsed files from a (J, h) array.
+    columns = {"#h": h_values}
+    for j_index, column in enumerate(J_columns):
+        columns[column] = values[j_index]
+    return pd.DataFrame(columns)
+
+
+def readFrame(file_path):
+    # Returns h_values, J_columns and the (J, h) array of a file in the layout of the J parsed files.
+    df = pd.read_fwf(file_path)
+    J_columns = [column for column in df.columns if column != "#h"]
+    return df["#h"].values, J_columns, df[J_columns].to_numpy(dtype=np.float64).T
+
+
+def writeFrame(file_path, df):
+    with open(file_path, 'w') as file_df:
+        dfAsString = df.to_string(header=True, index=False)
+        file_df.write(dfAsString)
     return None
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -56,55 +131,98 @@ def computeMagneticSusceptibility_old():
         raise FileNotFoundError("MSZ.txt not found in the specified path")
     return None
 
+def susceptibilityFrame(h_values, J_columns, m):
+    # Layout of 'chi.txt': forward differences of the per site magnetization 'm' ((J, h) array), one row per h interval
+    # at its left h value. All J are differentiated at once.
+    dh = np.diff(h_values)
+    dm = np.abs(np.diff(m, axis=1))
+    columns = {"#h": h_values[:-1], "dh": dh}
+    for j_index, column in enumerate(J_columns):
+        columns["m-" + column] = m[j_index, :-1]
+        columns["dm-" + column] = dm[j_index]
+        columns["chi-" + column] = dm[j_index] / dh
+    return pd.DataFrame(columns)
+
+
+def susceptibilityGradientFrame(h_values, J_columns, m):
+    # Layout of 'chi_gradient.txt': chi = |dm/dh| at every h value, with 'np.gradient' on the actual h values (second
+    # order central differences in the interior, one sided differences at the two ends). NaN below two h values.
+    if len(h_values) < 2:
+        return hFrame(h_values=h_values, J_columns=J_columns, values=np.full(m.shape, np.nan))
+    return hFrame(h_values=h_values, J_columns=J_columns, values=np.abs(np.gradient(m, h_values, axis=1)))
+
+
 def computeMagneticSusceptibility():
     from parameters import source_path, J_parsed_file_path
     ms_file = os.path.join(source_path, J_parsed_file_path, "PerSite_MSZ.txt")
     if os.path.exists(ms_file):
-        ms_df = pd.read_fwf(ms_file)
-        chi_df = pd.DataFrame()
-        for cols in ms_df.columns:
-            if cols == "#h":
-                chi_df["#h"] = ms_df["#h"][0:len(ms_df["#h"])-1]
-                dh = [ms_df[cols].values[i + 1] - ms_df[cols].values[i] for i in range(len(ms_df[cols].values) - 1)]
-                chi_df["dh"] = dh
-            else:
-                dm = np.abs([ms_df[cols].values[i + 1] - ms_df[cols].values[i] for i in range(len(ms_df[cols].values)-1)])
-                dh = [ms_df["#h"].values[i + 1] - ms_df["#h"].values[i] for i in range(len(ms_df["#h"].values)-1)]
-                chi_df["m-" + cols] = ms_df[cols][0:len(ms_df["#h"]) - 1]
-                chi_df['dm-'+cols] = dm
-                chi_df['chi-' + cols] = [dm[i]/dh[i] for i in range(len(dm))]
-                filePath = os.path.join(source_path, J_parsed_file_path)
-                if not os.path.exists(filePath):
-                    os.mkdir(filePath)
-                filename = os.path.join(filePath, "chi.txt")
-                with open(filename, 'w') as file_df:
-                    dfAsString = chi_df.to_string(header=True, index=False)
-                    file_df.write(dfAsString)
+        h_values, J_columns, m = readFrame(ms_file)
+        writeFrame(os.path.join(source_path, J_parsed_file_path, "chi.txt"),
+                   susceptibilityFrame(h_values=h_values, J_columns=J_columns, m=m))
+        writeFrame(os.path.join(source_path, J_parsed_file_path, "chi_gradient.txt"),
+                   susceptibilityGradientFrame(h_values=h_values, J_columns=J_columns, m=m))
     else:
         raise FileNotFoundError("PerSite_MSZ.txt not found in the specified path")
     return None
 # ----------------------------------------------------------------------------------------------------------------------
 
 # ------ Compute angle between two Spins -------------------------------------------------------------------------------
+def angleValues(m):
+    # Angle between two spins from the per site magnetization, NaN where |m| > 1/2.
+    with np.errstate(invalid='ignore'):
+        return np.arccos(4 * np.abs(m) - 1)
+
+
 def computeAngle():
     from parameters import source_path, J_parsed_file_path
-    path = os.path.join(source_path, J_parsed_file_path)
-    ms_file = os.path.join(path, "PerSite_MSZ.txt")
+    ms_file = os.path.join(source_path, J_parsed_file_path, "PerSite_MSZ.txt")
     if os.path.exists(ms_file):
-        ms_df = pd.read_fwf(ms_file)
-        angle_df = pd.DataFrame()
-        for cols in ms_df.columns:
-            if cols == "#h":
-                angle_df["#h"] = ms_df["#h"]
-            else:
-                angle_df[cols] = np.arccos(4 * np.abs(ms_df[cols]) - 1)
-        filePath = os.path.join(path, "Angle.txt")
-        with open(filePath, 'w') as file_df:
-            dfAsString = angle_df.to_string(header=True, index=False)
-            file_df.write(dfAsString)
+        h_values, J_columns, m = readFrame(ms_file)
+        writeFrame(os.path.join(source_path, J_parsed_file_path, "Angle.txt"),
+                   hFrame(h_values=h_values, J_columns=J_columns, values=angleValues(m)))
     else:
         raise FileNotFoundError("MSZ.txt not found in the specified path")
     return None
 # ----------------------------------------------------------------------------------------------------------------------
-computeMagneticSusceptibility()
+
+# ------ Post processing engine ----------------------------------------------------------------------------------------
+def post_process(h_values, J_columns, fields, values, column_names=None, directory_path=None, write_to_file=True,
+                 errors=None):
+    """
+    Per site data, magnetic susceptibility and spin angle of a whole sweep in one pass.
+    :param h_values: h values of the grid
+    :param J_columns: 'j=..' column names, one per J
+    :param fields: names of the quantities along the last axis of 'values'
+    :param values: (J, h, field) array of the averages, e.g. 'ResultAccumulator.means' or from 'read_J_parsed'
+    :param column_names: columns divided by the number of sites, default every 'j=..' column
+    :param directory_path: output directory, default the J parsed file path
+    :param write_to_file: write 'PerSite_<field>.txt', 'chi.txt', 'chi_gradient.txt' and 'Angle.txt'
+    :param errors: (J, h, field) array of the errors of 'values', written per site as 'PerSite_<field>_error.txt'
+    :return: {file name: DataFrame} of the outputs
+    """
+    per_site = perSiteValues(values=values, J_columns=J_columns, column_names=column_names)
+    df_dict = {}
+    for k, item in enumerate(fields):
+        df_dict["PerSite_" + item + ".txt"] = hFrame(h_values=h_values, J_columns=J_columns, values=per_site[:, :, k])
+    if errors is not None:
+        per_site_errors = perSiteValues(values=errors, J_columns=J_columns, column_names=column_names)
+        for k, item in enumerate(fields):
+            df_dict["PerSite_" + item + "_error.txt"] = hFrame(h_values=h_values, J_columns=J_columns,
+                                                               values=per_site_errors[:, :, k])
+    if "MSZ" in fields:
+        m = per_site[:, :, fields.index("MSZ")]
+        df_dict["chi.txt"] = susceptibilityFrame(h_values=h_values, J_columns=J_columns, m=m)
+        df_dict["chi_gradient.txt"] = susceptibilityGradientFrame(h_values=h_values, J_columns=J_columns, m=m)
+        df_dict["Angle.txt"] = hFrame(h_values=h_values, J_columns=J_columns, values=angleValues(m))
+    if write_to_file is True:
+        if directory_path is None:
+            from parameters import source_path, J_parsed_file_path
+            directory_path = os.path.join(source_path, J_parsed_file_path)
+        isExists = os.path.exists(directory_path)
+        if not isExists:
+            os.makedirs(directory_path)
+        for file, df in df_dict.items():
+            writeFrame(os.path.join(directory_path, file), df)
+    return df_dict
+# ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
@@ -1,12 +1,18 @@
 # ======================================================================================================================
 # Name:                  Data Fitting Module 'fitting_module.py'
-# Description:           This module contains functions to post process the results of the simulation.
+# Description:           1. This module contains functions to post process the results of the simulation.
+#                        2. 'batched_fit' fits a model to every column of a data set at once, with one vectorized
+#                           Levenberg-Marquardt solve for all columns. Columns that end worse than their neighbours are
+#                           fitted again from the parameters of the neighbouring columns (warm start).
+#                        3. Models are written like for 'scipy.optimize.curve_fit', 'f(x, *params)' with numpy
+#                           functions. They are evaluated for all columns at once by broadcasting.
+#                        4. 'fit_mag' writes the parameters and their standard errors, plotting is a separate step.
 # Library Dependencies:  1. numpy ("https://numpy.org/")
 #                        2. os ("https://docs.python.org/3/library/os.html")
 #                        3. pandas ("https://pandas.pydata.org/")
 # Author:                Avishek Singh
 # Date:                  29.05.2022
-# Latest Update:         30.05.2022
+# Latest Update:         18.10.2026
 # Version:               1.0.0
 # ======================================================================================================================
 
@@ -14,55 +20,199 @@
 import numpy as np
 import pandas as pd
 import os
-from scipy.optimize import curve_fit
-import matplotlib.pyplot as plt
 import inspect
 # ======================================================================================================================
 
+# ====== Batched Fitting ===============================================================================================
+# ------ Defining a function to evaluate a model for all columns at once -----------------------------------------------
+def evaluate_model(function, x, param):
+    # 'param' is (columns, parameters), returns the (columns, x) array of model values.
+    return function(x[None, :], *[param[:, k, None] for k in range(param.shape[1])])
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to compute the Jacobians of all columns ---------------------------------------------------
+def model_jacobian(function, x, param, f0):
+    # Forward differences, one model evaluation per parameter for all columns. Returns (columns, x, parameters).
+    step = np.sqrt(np.finfo(np.float64).eps) * np.maximum(np.abs(param), 1)
+    jacobian = np.empty(f0.shape + (param.shape[1],))
+    for k in range(param.shape[1]):
+        shifted = param.copy()
+        shifted[:, k] += step[:, k]
+        jacobian[:, :, k] = (evaluate_model(function, x, shifted) - f0) / step[:, k, None]
+    return jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a batched Levenberg-Marquardt solver -----------------------------------------------------------------
+def levenberg_marquardt(function, x, y, p0, max_iter=200, tolerance=1e-10):
+    # Least squares fit of every row of 'y' (columns, x), NaN values are ignored. Every column keeps its own damping
+    # and stops on its own, finished columns are not evaluated any more. Returns param, cost and converged.
+    valid = np.isfinite(y)
+    y = np.where(valid, y, 0)
+    param = np.array(p0, dtype=np.float64)
+    damping = np.full(len(param), 1e-3)
+    converged = np.zeros(len(param), dtype=bool)
+    done = np.zeros(len(param), dtype=bool)
+
+    def residuals(index, trial):
+        f = evaluate_model(function, x, trial)
+        r = np.where(valid[index], y[index] - f, 0)
+        return f, r, np.where(np.isfinite(r), r, np.inf)
+
+    f, r, r_cost = residuals(slice(None), param)
+    cost = np.sum(r_cost ** 2, axis=1)
+    for iteration in range(max_iter):
+        active = np.flatnonzero(~done)
+        if len(active) == 0:
+            break
+        jacobian = model_jacobian(function, x, param[active], f[active]) * valid[active, :, None]
+        jtj = np.einsum('cnk,cnl->ckl', jacobian, jacobian)
+        jtr = np.einsum('cnk,cn->ck', jacobian, r[active])
+        diagonal = np.einsum('ckk->ck', jtj)
+        lhs = jtj + (damping[active, None] * np.maximum(diagonal, 1e-12))[:, :, None] * np.eye(param.shape[1])
+        try:
+            delta = np.linalg.solve(lhs, jtr[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            delta = np.einsum('ckl,cl->ck', np.linalg.pinv(lhs), jtr)
+        trial = param[active] + delta
+        f_trial, r_trial, r_trial_cost = residuals(active, trial)
+        cost_trial = np.sum(r_trial_cost ** 2, axis=1)
+        better = cost_trial < cost[active]
+        # Converged: the cost no longer changes and the step is small. Stalled: the damping grew without a better step.
+        small = np.abs(cost[active] - cost_trial) <= tolerance * (cost[active] + tolerance)
+        small &= np.all(np.abs(delta) <= np.sqrt(tolerance) * (np.abs(param[active]) + np.sqrt(tolerance)), axis=1)
+        improved = active[better]
+        param[improved], f[improved], r[improved], cost[improved] = (trial[better], f_trial[better],
+                                                                     r_trial[better], cost_trial[better])
+        damping[active] = np.where(better, damping[active] / 10, damping[active] * 10)
+        converged[active] = small | (cost[active] == 0)
+        done[active] = converged[active] | (damping[active] > 1e10)
+    return param, cost, converged
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to fit a model to every column at once ----------------------------------------------------
+def batched_fit(function, x, y, p0=None, warm_start=True, max_iter=200):
+    """
+    Fits 'function' to every column of 'y' in one batched Levenberg-Marquardt solve.
+    :param function: model 'f(x, *params)' with numpy functions, as for 'curve_fit'
+    :param x: (n,) array of the x values, e.g. h
+    :param y: (columns, n) array, one data set per column (e.g. per J), NaN values are ignored
+    :param p0: initial parameters, (parameters,) or (columns, parameters), or a function 'p0(x, y)'. Default ones.
+    :param warm_start: fit columns again from the parameters of their neighbours and keep the better result
+    :param max_iter: maximum number of iterations per column
+    :return: param (columns, parameters), param_cov (columns, parameters, parameters) and info with 'cost' (sum of
+             squared residuals), 'converged' and 'n_points' per column. param_cov is scaled like 'curve_fit'.
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.atleast_2d(np.asarray(y, dtype=np.float64))
+    n_param = len(inspect.getfullargspec(function).args) - 1
+    if callable(p0):
+        p0 = p0(x, y)
+    elif p0 is None:
+        p0 = np.ones(n_param)
+    p0 = np.broadcast_to(np.asarray(p0, dtype=np.float64), (len(y), n_param))
+    param, cost, converged = levenberg_marquardt(function, x, y, p0, max_iter=max_iter)
+    if warm_start and len(y) > 1:
+        # Neighbouring columns (neighbouring J) have similar parameters. Both neighbours are tried for every column in
+        # one batch, the lowest cost wins.
+        columns = np.arange(len(y))
+        neighbours = np.concatenate([np.maximum(columns - 1, 0), np.minimum(columns + 1, len(y) - 1)])
+        param_2, cost_2, converged_2 = levenberg_marquardt(function, x, np.concatenate([y, y]), param[neighbours],
+                                                           max_iter=max_iter)
+        for half in [slice(0, len(y)), slice(len(y), 2 * len(y))]:
+            better = cost_2[half] < cost * (1 - 1e-9)
+            param[better], cost[better], converged[better] = (param_2[half][better], cost_2[half][better],
+                                                              converged_2[half][better])
+    # Covariance from the Jacobian at the solution, scaled by the residual variance like 'curve_fit'.
+    valid = np.isfinite(y)
+    jacobian = model_jacobian(function, x, param, evaluate_model(function, x, param)) * valid[:, :, None]
+    n_points = valid.sum(axis=1)
+    dof = n_points - n_param
+    param_cov = np.linalg.pinv(np.einsum('cnk,cnl->ckl', jacobian, jacobian))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        param_cov *= np.where(dof > 0, cost / dof, np.inf)[:, None, None]
+    return param, param_cov, {'cost': cost, 'converged': converged, 'n_points': n_points}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the tanh magnetization model -------------------------------------------------------------------------
+def tanh_model(x, a, b, c, d):
+    return a * np.tanh(b * x - c) + d
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining an initial guess for the tanh magnetization model ----------------------------------------------------
+def tanh_guess(x, y):
+    # a * tanh(b * x - c) + d: half the range, the centre, and the step at the h where y crosses the centre.
+    y_min, y_max = np.nanmin(y, axis=1), np.nanmax(y, axis=1)
+    a, d = (y_max - y_min) / 2, (y_max + y_min) / 2
+    crossing = x[np.nanargmin(np.abs(np.where(np.isfinite(y), y, np.inf) - d[:, None]), axis=1)]
+    b = np.full(len(y), 4 / max(np.ptp(x), 1e-12))
+    return np.stack([a, b, b * crossing, d], axis=1)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
 # ====== Data Fitting Module ===========================================================================================
 # ------ Function to fit magnetization data ----------------------------------------------------------------------------
-def fit_mag(function, input_datafile, out_file, show_plot=False, save_plot=False):
+def fit_mag(function, input_datafile, out_file, show_plot=False, save_plot=False, p0=None):
+    # Fits all J columns in one call. Writes '<out_file>_param.txt' and the standard errors '<out_file>_param_err.txt'
+    # (one column per J, one row per parameter) and returns both DataFrames.
     if os.path.exists(input_datafile):
         df = pd.read_fwf(input_datafile)
-        df_fit = pd.DataFrame()
         args = inspect.getfullargspec(function).args
-        for col in df.columns:
-            if col == '#h':
-                df_fit[args[0]] = args[1:]
-            if col != '#h':
-                param, param_cov = curve_fit(function, df['#h'], df[col])
-                df_fit[col] = param
-                ans = function(df['#h'], *param)
-                plt.plot(df['#h'], ans, 'r-', label='Fitted curve', linewidth=3)
-                plt.plot(df['#h'], df[col], 'bo', label='Magnetization Data')
-                plt.xlabel('h')
-                plt.ylabel('MSZ')
-                plt.title('Magnetization Data Fitting '+col)
-                plt.legend()
-                if show_plot is True:
-                    plt.show()
-                if save_plot is True:
-                    from parameters import fitted_plot_path, source_path
-                    plot_path = os.path.join(source_path, fitted_plot_path)
-                    if not os.path.exists(plot_path):
-                        os.makedirs(plot_path)
-                    plot_file = plot_path + out_file + '_plot_' + '(' + col + ').pdf'
-                    plt.savefig(plot_file, format='pdf')
-                plt.close()
+        columns = [col for col in df.columns if col != '#h']
+        x = df['#h'].to_numpy(dtype=np.float64)
+        y = df[columns].to_numpy(dtype=np.float64).T
+        param, param_cov, info = batched_fit(function, x, y, p0=p0)
+        if not np.all(info['converged']):
+            print(f"Warning: the fit did not converge for {', '.join(np.array(columns)[~info['converged']])}")
+        param_err = np.sqrt(np.abs(np.einsum('ckk->ck', param_cov)))
+        df_fit, df_err = pd.DataFrame({args[0]: args[1:]}), pd.DataFrame({args[0]: args[1:]})
+        for c, col in enumerate(columns):
+            df_fit[col] = param[c]
+            df_err[col] = param_err[c]
         from parameters import source_path, fitting_param_path
         param_path = os.path.join(source_path, fitting_param_path)
         if not os.path.exists(param_path):
             os.makedirs(param_path)
-        param_file = param_path + out_file + '_param.txt'
-        with open(param_file, 'w') as file:
-            dfAsString = df_fit.to_string(header=True, index=False)
-            file.write(dfAsString)
+        for suffix, df_out in [('_param.txt', df_fit), ('_param_err.txt', df_err)]:
+            with open(param_path + out_file + suffix, 'w') as file:
+                dfAsString = df_out.to_string(header=True, index=False)
+                file.write(dfAsString)
+        if show_plot is True or save_plot is True:
+            plot_fit(function, x, y, columns, param, out_file, show_plot=show_plot, save_plot=save_plot)
     else:
         raise FileNotFoundError('File not found')
+    return df_fit, df_err
 # ----------------------------------------------------------------------------------------------------------------------
-from parameters import source_path, J_parsed_file_path
-def func(x, a, b, c, d):
-    return a * np.tanh(b * x - c) + d
-path = source_path + J_parsed_file_path + 'PerSite_MSZ.txt'
-fit_mag(function=func, input_datafile=path, out_file='MSZ_fit', save_plot=True, show_plot=False)
+
+# ------ Function to plot the fitted magnetization ---------------------------------------------------------------------
+def plot_fit(function, x, y, columns, param, out_file, show_plot=False, save_plot=True):
+    # One plot per column of the data and the fitted curve, 'param' as returned by 'batched_fit'.
+    import matplotlib.pyplot as plt
+    fitted = evaluate_model(function, x, param)
+    for c, col in enumerate(columns):
+        plt.plot(x, fitted[c], 'r-', label='Fitted curve', linewidth=3)
+        plt.plot(x, y[c], 'bo', label='Magnetization Data')
+        plt.xlabel('h')
+        plt.ylabel('MSZ')
+        plt.title('Magnetization Data Fitting '+col)
+        plt.legend()
+        if show_plot is True:
+            plt.show()
+        if save_plot is True:
+            from parameters import fitted_plot_path, source_path
+            plot_path = os.path.join(source_path, fitted_plot_path)
+            if not os.path.exists(plot_path):
+                os.makedirs(plot_path)
+            plot_file = plot_path + out_file + '_plot_' + '(' + col + ').pdf'
+            plt.savefig(plot_file, format='pdf')
+        plt.close()
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Running the Fit ===============================================================================================
+if __name__ == "__main__":
+    from parameters import source_path, J_parsed_file_path
+    def func(x, a, b, c, d):
+        return a * np.tanh(b * x - c) + d
+    path = source_path + J_parsed_file_path + 'PerSite_MSZ.txt'
+    fit_mag(function=func, input_datafile=path, out_file='MSZ_fit', save_plot=True, show_plot=False, p0=tanh_guess)
 # ======================================================================================================================
@@ -0,0 +1,112 @@
+# ======================================================================================================================
+# Name:                 Adaptive h-Grid Module 'adaptive_grid.py'
+# Description:          1. This module refines the h grid of a sweep around the magnetization transition.
+#                       2. The sweep starts on a coarse grid and repeatedly inserts midpoints into the h intervals with
+#                          the largest refinement indicator, until the tolerance or the point budget is reached.
+#                       3. All J values share one h grid, so the results keep the rectangular layout of 'main.py'.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+from Function_Tools.PostProcessing_Module.fitting_module import batched_fit, tanh_model, tanh_guess
+# ======================================================================================================================
+
+# ====== Refinement Indicator Functions ================================================================================
+# ------ Defining a function to score every h interval of one J --------------------------------------------------------
+def interval_scores(h_values, msz, criterion="slope"):
+    # Scores are relative to the full change of MSZ over the grid, so one tolerance fits every J and lattice size.
+    # "slope": |dMSZ/dh| * dh, the change of MSZ across the interval. The plain slope does not shrink when an interval
+    #          is split, so it would never meet a tolerance at a sharp transition.
+    # "tanh_residual": mean |MSZ - tanh fit| ('tanh_model' fitted like 'fit_mag' does) at the two ends of the interval.
+    #                  Falls back to "slope" if the fit does not converge.
+    # Points without a value (NaN) are skipped, an interval gets the score of the interval between the finite points
+    # around it. Intervals outside the finite points score 0.
+    h_values, msz = np.asarray(h_values, dtype=float), np.asarray(msz, dtype=float)
+    finite = np.isfinite(msz)
+    if not np.all(finite):
+        scores = np.zeros(len(h_values) - 1)
+        if np.sum(finite) < 2:
+            return scores
+        finite_scores = interval_scores(h_values[finite], msz[finite], criterion)
+        enclosing = np.searchsorted(h_values[finite], h_values[:-1], side='right') - 1
+        inside = (enclosing >= 0) & (enclosing < len(finite_scores))
+        scores[inside] = finite_scores[enclosing[inside]]
+        return scores
+    msz_range = np.ptp(msz)
+    if msz_range == 0:
+        return np.zeros(len(h_values) - 1)
+    if criterion == "slope":
+        return np.abs(np.diff(msz) / np.diff(h_values)) * np.diff(h_values) / msz_range
+    elif criterion == "tanh_residual":
+        if len(h_values) < 5:
+            return interval_scores(h_values, msz, criterion="slope")
+        param, param_cov, info = batched_fit(tanh_model, h_values, msz, p0=tanh_guess)
+        if not info['converged'][0]:
+            return interval_scores(h_values, msz, criterion="slope")
+        residual = np.abs(msz - tanh_model(h_values, *param[0])) / msz_range
+        return (residual[:-1] + residual[1:]) / 2
+    else:
+        raise ValueError("Adaptive criterion not recognized")
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to average the last values of a trace -----------------------------------------------------
+def window_mean(trace, n_values):
+    # Mean of the last 'n_values' values without the NaN ones, NaN if there are none.
+    window = np.asarray(trace, dtype=float)[-n_values:]
+    return np.nanmean(window) if np.any(np.isfinite(window)) else np.nan
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to choose the new h points ----------------------------------------------------------------
+def refine_h_grid(h_values, msz_list, criterion, tolerance, min_spacing, n_new):
+    # 'msz_list' holds one MSZ curve per J on 'h_values'. An interval is split if its score for any J exceeds the
+    # tolerance and it is wider than 2 * min_spacing. Returns at most 'n_new' midpoints, the largest scores first.
+    h_values = np.asarray(h_values, dtype=float)
+    scores = np.max([interval_scores(h_values, msz, criterion) for msz in msz_list], axis=0)
+    scores[np.diff(h_values) < 2 * min_spacing] = 0
+    candidates = [i for i in np.argsort(scores)[::-1] if scores[i] > tolerance][:n_new]
+    return np.sort((h_values[candidates] + h_values[np.array(candidates, dtype=int) + 1]) / 2)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Adaptive Sweep ================================================================================================
+# ------ Defining a function to run a sweep on an adaptively refined h grid --------------------------------------------
+def adaptive_sweep(J_ex_list, show_progress_bar=True):
+    # Returns the final h grid and the results {(j_index, h_index): (parsed_data, info)} on it, like 'sweep_executor'.
+    from Function_Tools.Sweep_Module.sweep_executor import sweep_executor
+    from parameters import h_ex, adaptive_initial_points, adaptive_max_points, adaptive_points_per_round
+    from parameters import adaptive_criterion, adaptive_tolerance, adaptive_min_spacing, n_values
+    if adaptive_initial_points < 2 or adaptive_max_points < adaptive_initial_points:
+        raise ValueError("adaptive_initial_points must be >= 2 and <= adaptive_max_points.")
+    h_values = np.linspace(min(h_ex), max(h_ex), adaptive_initial_points)
+    new_h_values = h_values
+    results_by_h = {}
+    refinement_round = 0
+    while len(new_h_values) > 0:
+        round_results = sweep_executor(J_ex_list=J_ex_list, h_ex_list=new_h_values,
+                                       show_progress_bar=show_progress_bar)
+        for (j_index, h_index), (parsed_data, info) in round_results.items():
+            info['refinement_round'] = refinement_round
+            results_by_h[(j_index, new_h_values[h_index])] = (parsed_data, info)
+        msz_list = np.array([[window_mean(results_by_h[(j_index, h)][0]['MSZ'], n_values) for h in h_values]
+                             for j_index in range(len(J_ex_list))])
+        if not np.all(np.isfinite(msz_list)):
+            print(f"Warning: MSZ is NaN at {np.sum(~np.isfinite(msz_list))} points, the refinement skips them.")
+        n_new = min(adaptive_points_per_round, adaptive_max_points - len(h_values))
+        new_h_values = refine_h_grid(h_values=h_values, msz_list=msz_list, criterion=adaptive_criterion,
+                                     tolerance=adaptive_tolerance, min_spacing=adaptive_min_spacing, n_new=n_new)
+        h_values = np.sort(np.concatenate([h_values, new_h_values]))
+        refinement_round += 1
+    print(f"Adaptive h grid: {len(h_values)} points after {refinement_round} rounds "
+          f"(smallest spacing {np.min(np.diff(h_values)):.4g})")
+    results = {}
+    for j_index in range(len(J_ex_list)):
+        for h_index, h in enumerate(h_values):
+            results[(j_index, h_index)] = results_by_h[(j_index, h)]
+    return h_values, results
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
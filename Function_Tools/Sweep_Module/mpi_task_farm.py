@@ -0,0 +1,142 @@
+# ======================================================================================================================
+# Name:                 MPI Task Farm Module 'mpi_task_farm.py'
+# Description:          1. This module runs the tasks of a sweep on MPI ranks, e.g. spread over several nodes.
+#                       2. Rank 0 runs 'main.py' as usual and hands out tasks dynamically: a rank gets its next task as
+#                          soon as it returns a result, so slow points near the transition do not hold up the others.
+#                       3. All other ranks only serve tasks and exit when rank 0 is done.
+#                       4. Every rank runs its own independent NetKet simulation, so NetKet itself must not use MPI.
+#                       5. Launch with e.g. 'mpirun -n 5 python main.py' and parameters.sweep_backend = "mpi".
+#                          Rank 0 writes the output files. Only the results store (if used) has to be on a shared path.
+# Library Dependencies: 1. mpi4py ("https://mpi4py.readthedocs.io/en/stable/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import atexit
+import os
+import sys
+import time
+import traceback
+# ======================================================================================================================
+
+# ====== MPI Setup Functions ===========================================================================================
+# Message tags of the task farm
+task_tag, result_tag, stop_tag = 1, 2, 3
+
+
+# ------ Defining a function to keep NetKet from using MPI -------------------------------------------------------------
+def import_netket_without_mpi():
+    # NetKet >= 3.5 reads NETKET_MPI. NetKet 3.4 uses MPI whenever mpi4py imports, and would then split the samples of
+    # one point over all ranks, so mpi4py is hidden while NetKet is imported. Must run before the first NetKet import.
+    if 'netket' in sys.modules:
+        raise RuntimeError("The MPI task farm has to be started before netket is imported.")
+    os.environ["NETKET_MPI"] = "0"
+    os.environ["NETKET_MPI_WARNING"] = "0"
+    hidden = {name: sys.modules.get(name) for name in ['mpi4py', 'mpi4py.MPI', 'mpi4jax']}
+    for name in hidden:
+        sys.modules[name] = None
+    try:
+        import netket  # noqa: F401
+    finally:
+        for name, module in hidden.items():
+            if module is None:
+                del sys.modules[name]
+            else:
+                sys.modules[name] = module
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to start the task farm on every rank ------------------------------------------------------
+def start_mpi_task_farm():
+    # Returns on rank 0. All other ranks serve tasks until rank 0 exits and then leave the program.
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+    if comm.Get_size() < 2:
+        raise ValueError("The MPI task farm needs at least 2 ranks (rank 0 only hands out tasks).")
+    # Collective call, so it runs on every rank before rank 0 returns.
+    node_comm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+    # Rank 0 only hands out tasks and gets no block. It is the first rank of its node, since the ranks of a node are
+    # ordered by their rank in 'comm'.
+    n_farm_roots = node_comm.allreduce(int(comm.Get_rank() == 0))
+    if comm.Get_rank() == 0:
+        import_netket_without_mpi()
+        atexit.register(stop_mpi_workers)
+        return None
+    # The worker ranks on one node share its cores, like the workers of the process pool (see sweep_executor.py).
+    from Function_Tools.Sweep_Module.sweep_executor import cpu_blocks, limit_process_resources
+    from parameters import xla_threads_per_worker, pin_cpu_affinity
+    blocks = cpu_blocks(n_workers=node_comm.Get_size() - n_farm_roots, threads_per_worker=xla_threads_per_worker)
+    limit_process_resources(cpu_block=blocks[node_comm.Get_rank() - n_farm_roots], pin_affinity=pin_cpu_affinity)
+    import_netket_without_mpi()
+    mpi_worker_loop(comm)
+    sys.exit(0)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Task Farm Functions ===========================================================================================
+# ------ Defining the loop every worker rank runs ----------------------------------------------------------------------
+def mpi_worker_loop(comm):
+    from mpi4py import MPI
+    status = MPI.Status()
+    while True:
+        message = comm.recv(source=0, tag=MPI.ANY_TAG, status=status)
+        if status.Get_tag() == stop_tag:
+            break
+        task_function, task = message
+        try:
+            comm.send(('result', task_function(task)), dest=0, tag=result_tag)
+        except Exception:
+            # Rank 0 aborts the job, so a failing point stops the sweep instead of leaving rank 0 waiting.
+            comm.send(('error', traceback.format_exc()), dest=0, tag=result_tag)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to hand out tasks from rank 0 -------------------------------------------------------------
+def mpi_map(task_function, tasks):
+    # Generator on rank 0: yields the result of every task as soon as a worker returns it.
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+    status = MPI.Status()
+    pending = list(tasks)
+    active = 0
+    for worker in range(1, comm.Get_size()):
+        if len(pending) == 0:
+            break
+        comm.send((task_function, pending.pop(0)), dest=worker, tag=task_tag)
+        active += 1
+    while active > 0:
+        # A blocking recv busy-waits in most MPI libraries. Rank 0 only hands out tasks, so it sleeps between polls
+        # and leaves its core to a worker rank.
+        while not comm.Iprobe(source=MPI.ANY_SOURCE, tag=result_tag, status=status):
+            time.sleep(0.05)
+        kind, result = comm.recv(source=status.Get_source(), tag=result_tag, status=status)
+        active -= 1
+        if kind == 'error':
+            # The other ranks may be busy with large results, so the whole job is aborted instead of shut down.
+            sys.stderr.write(f"Task failed on MPI rank {status.Get_source()}:\n{result}")
+            sys.stderr.flush()
+            comm.Abort(1)
+        if len(pending) > 0:
+            comm.send((task_function, pending.pop(0)), dest=status.Get_source(), tag=task_tag)
+            active += 1
+        yield result
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to return the number of worker ranks ------------------------------------------------------
+def mpi_n_workers():
+    from mpi4py import MPI
+    return MPI.COMM_WORLD.Get_size() - 1
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to release the workers when rank 0 exits --------------------------------------------------
+def stop_mpi_workers():
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+    for worker in range(1, comm.Get_size()):
+        comm.send(None, dest=worker, tag=stop_tag)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
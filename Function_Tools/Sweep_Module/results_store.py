@@ -0,0 +1,183 @@
+# ======================================================================================================================
+# Name:                 Results Store Module 'results_store.py'
+# Description:          1. This module saves every completed (J, h) point under a hash of its simulation parameters.
+#                       2. The hash covers 'parameters.py' plus J and h, without the file, plot, post-processing and
+#                          executor settings, so changing those never invalidates a simulation result. Points chained
+#                          by continuation or persistent chains also hash the grid and the split of the grid into tasks.
+#                       3. A restarted sweep loads the completed points and only runs the missing ones.
+#                       4. Every point directory also holds the checkpoint of a point that is still running.
+# Library Dependencies: 1. hashlib ("https://docs.python.org/3/library/hashlib.html")
+#                       2. json ("https://docs.python.org/3/library/json.html")
+#                       3. pandas ("https://pandas.pydata.org/")
+#                       4. flax.serialization ("https://flax.readthedocs.io/en/latest/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import hashlib
+import json
+import os
+import types
+import pandas as pd
+# ======================================================================================================================
+
+# ====== Point Hash Functions ==========================================================================================
+# Parameters that do not change the result of a (J, h) point. Everything else in 'parameters.py' is part of the hash, so
+# a newly added parameter invalidates the stored points until it is listed here. 'n_values', 'estimator_min_blocks',
+# 'target_error' and 'log_trace' stay in the hash: the observable schedule, the stored statistics (including
+# 'n_values_for_target') and the stored rows depend on them.
+non_simulation_parameters = {
+    # File writing, plotting and information files
+    'source_path', 'path_results', 'simulation_file_path', 'var_file_path', 'J_parsed_file_path', 'fitting_param_path',
+    'path_plots', 'parsed_data_plot_path', 'fitted_plot_path', 'J_parsed_plot_path',
+    'write_lattice_info', 'print_lattice_info', 'path_to_lattice_info', 'write_hilbert_info', 'print_hilbert_info',
+    'path_to_hilbert_info', 'write_hamiltonian_info', 'print_hamiltonian_info', 'path_to_hamiltonian_info',
+    # Post-processing
+    'unconverged_policy',
+    # Sweep executor and results store
+    'n_workers', 'xla_threads_per_worker', 'pin_cpu_affinity', 'point_info_path', 'sweep_backend',
+    'results_store', 'store_path', 'checkpoint_every', 'output_backend', 'output_queue_size',
+    'cube_path', 'text_output', 'log_chunk_size', 'log_spill_path',
+    'plot_bundle', 'plot_format', 'plot_dpi', 'plot_rasterize_above', 'plot_workers', 'plot_cache',
+    'hamiltonian_operator', 'reference_solver', 'reference_max_states',
+    # Sampler autotuning, the tuned sampler parameters are part of the hash
+    'autotune_sampler', 'autotune_rules', 'autotune_chains', 'autotune_sweep_factors', 'autotune_discards',
+    'autotune_warmup_iterations', 'autotune_repeats',
+}
+# The grid only matters through J and h, unless the points are chained along the path through the grid.
+grid_parameters = {'h_ex', 'h_ex_increment', 'J_ex', 'J_ex_increment', 'h_grid_mode', 'adaptive_initial_points',
+                   'adaptive_max_points', 'adaptive_points_per_round', 'adaptive_criterion', 'adaptive_tolerance',
+                   'adaptive_min_spacing'}
+# Chained points also depend on where their piece of the path starts, which is set by the number of workers.
+task_parameters = {'n_workers', 'sweep_backend'}
+
+
+# ------ Defining a function to collect the parameters that determine a simulation result ------------------------------
+def simulation_parameters(sampler_autotune=True):
+    # With 'autotune_sampler' the sampler parameters are the autotuned ones the points run with (see sampler_tuning.py).
+    import parameters
+    excluded = set(non_simulation_parameters)
+    chained = parameters.continuation or parameters.persistent_chains
+    if chained:
+        excluded -= task_parameters
+    else:
+        excluded |= grid_parameters
+    simulation_dict = {}
+    for key, value in vars(parameters).items():
+        if key.startswith('_') or key in excluded or isinstance(value, (types.ModuleType, types.FunctionType)):
+            continue
+        simulation_dict[key] = value
+    if chained and parameters.sweep_backend == "mpi":
+        # The MPI task farm splits the path over its worker ranks, not over 'n_workers'.
+        from Function_Tools.Sweep_Module.mpi_task_farm import mpi_n_workers
+        simulation_dict['n_workers'] = mpi_n_workers()
+    if sampler_autotune and parameters.autotune_sampler:
+        from Function_Tools.Netket_module.sampler_tuning import sampler_parameters
+        simulation_dict.update(sampler_parameters())
+    return simulation_dict
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to hash the parameters of a (J, h) point --------------------------------------------------
+def point_key(J, h, simulation_dict=None):
+    if simulation_dict is None:
+        simulation_dict = simulation_parameters()
+    # J and h are rounded, so the same point built by a different grid (e.g. np.linspace vs np.arange) has one key.
+    point_dict = dict(simulation_dict, J=round(float(J), 12), h=round(float(h), 12))
+    point_string = json.dumps(point_dict, sort_keys=True, default=repr)
+    return hashlib.sha256(point_string.encode()).hexdigest()[:16]
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Results Store =================================================================================================
+# ------ Defining a class to save and load completed points ------------------------------------------------------------
+class ResultsStore:
+    """
+    Directory of completed (J, h) points, one sub-directory per point hash:
+    'parameters.json' (the hashed parameters), 'parsed_data.txt', 'final_state.msgpack' (parameters and sampler state
+    of the final variational state) and 'point_info.json'. 'point_info.json' is written last, so a point counts as
+    completed only once all its files are on disk. 'checkpoint.msgpack' and 'checkpoint_data.txt' exist while a point
+    is running (see 'checkpoint.py').
+    :param path: root directory of the store
+    """
+    def __init__(self, path):
+        self.path = path
+        self.simulation_dict = simulation_parameters()
+
+    def point_path(self, J, h, create=False):
+        point_path = os.path.join(self.path, point_key(J, h, self.simulation_dict))
+        if create is True:
+            isExists = os.path.exists(point_path)
+            if not isExists:
+                os.makedirs(point_path)
+        return point_path
+
+    def is_completed(self, J, h):
+        return os.path.exists(os.path.join(self.point_path(J, h), 'point_info.json'))
+
+    def save(self, J, h, parsed_data, info, vstate=None):
+        point_path = self.point_path(J, h, create=True)
+        write_atomic(os.path.join(point_path, 'parameters.json'),
+                     json.dumps(self.simulation_dict, sort_keys=True, indent=1, default=repr))
+        write_atomic(os.path.join(point_path, 'parsed_data.txt'),
+                     parsed_data.to_string(header=True, index=False, float_format='{:.17g}'.format))
+        if vstate is not None:
+            from flax import serialization
+            final_state = {'parameters': vstate.parameters, 'sampler_state': getattr(vstate, 'sampler_state', None)}
+            write_atomic(os.path.join(point_path, 'final_state.msgpack'), serialization.to_bytes(final_state), 'wb')
+        write_atomic(os.path.join(point_path, 'point_info.json'), json.dumps(info, indent=1, default=json_default))
+        for file in ['checkpoint.msgpack', 'checkpoint_data.txt']:
+            if os.path.exists(os.path.join(point_path, file)):
+                os.remove(os.path.join(point_path, file))
+        return None
+
+    def load(self, J, h):
+        # Returns the parsed data and the point information of a completed point.
+        point_path = self.point_path(J, h)
+        parsed_data = pd.read_csv(os.path.join(point_path, 'parsed_data.txt'), sep=r'\s+')
+        with open(os.path.join(point_path, 'point_info.json'), 'r') as info_file:
+            info = json.load(info_file)
+        return parsed_data, info
+
+    def load_final_state(self, J, h, vstate):
+        # Restores the parameters and sampler state of a completed point into 'vstate'. Returns False if not saved.
+        final_state_path = os.path.join(self.point_path(J, h), 'final_state.msgpack')
+        if not os.path.exists(final_state_path):
+            return False
+        from flax import serialization
+        with open(final_state_path, 'rb') as state_file:
+            target = {'parameters': vstate.parameters, 'sampler_state': getattr(vstate, 'sampler_state', None)}
+            final_state = serialization.from_bytes(target, state_file.read())
+        vstate.parameters = final_state['parameters']
+        if target['sampler_state'] is not None:
+            vstate.sampler_state = final_state['sampler_state']
+        return True
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to write a file in one step ---------------------------------------------------------------
+def write_atomic(path, content, mode='w'):
+    # A sweep killed while writing leaves the previous file (or no file) behind, never a truncated one.
+    with open(path + '.tmp', mode) as tmp_file:
+        tmp_file.write(content)
+    os.replace(path + '.tmp', path)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to write numpy scalars to json ------------------------------------------------------------
+def json_default(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    return repr(value)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to create the results store from the parameters -------------------------------------------
+def results_store():
+    from parameters import results_store as use_store
+    if not use_store:
+        return None
+    from parameters import store_path
+    return ResultsStore(path=store_path)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
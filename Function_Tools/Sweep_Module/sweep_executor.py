@@ -0,0 +1,218 @@
+# ======================================================================================================================
+# Name:                 Sweep Executor Module 'sweep_executor.py'
+# Description:          1. This module distributes the independent (J, h) points of a sweep over worker processes.
+#                       2. Every worker gets its own XLA thread budget and block of CPU cores.
+#                       3. Results are returned in grid order, independent of the order in which points finish.
+#                       4. In continuation mode the grid is walked as a snake and every point is warm started. With
+#                          persistent chains the snake only carries the Markov chains from one point to the next.
+#                       5. Points already in the results store are loaded instead of run again.
+#                       6. With sweep_backend = "mpi" the tasks go to the ranks of the MPI task farm instead.
+#                       7. The tasks only compute. Data files and plots are written by the output pipeline.
+# Library Dependencies: 1. numpy ("https://numpy.org/")
+#                       2. concurrent.futures ("https://docs.python.org/3/library/concurrent.futures.html")
+#                       3. multiprocessing ("https://docs.python.org/3/library/multiprocessing.html")
+#                       4. tqdm ("https://tqdm.github.io/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tqdm import tqdm
+from Function_Tools.FileWriting_GraphPloting_Module.output_pipeline import output_pipeline
+# ======================================================================================================================
+
+# ====== Sweep Grid Functions ==========================================================================================
+# ------ Defining a function to build the J and h grids from the parameters --------------------------------------------
+def parameter_grid():
+    from parameters import J_ex, J_ex_increment, h_ex, h_ex_increment
+    h_num = abs(round((min(h_ex) - max(h_ex)) / h_ex_increment)) + 1
+    J_num = abs(round((min(J_ex) - max(J_ex)) / J_ex_increment)) + 1
+    h_ex_list = np.linspace(min(h_ex), max(h_ex), h_num)
+    J_ex_list = np.linspace(min(J_ex), max(J_ex), J_num)
+    return J_ex_list, h_ex_list
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to walk the (J, h) grid as a snake --------------------------------------------------------
+def snake_path(n_J, n_h):
+    # h runs up for even J rows and down for odd J rows, so consecutive points differ by one grid step only.
+    path = []
+    for j_index in range(n_J):
+        h_indices = range(n_h) if j_index % 2 == 0 else reversed(range(n_h))
+        path.extend([(j_index, h_index) for h_index in h_indices])
+    return path
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to split the grid into tasks for the workers ----------------------------------------------
+def sweep_tasks(J_ex_list, h_ex_list, n_workers):
+    # Every task is a list of (j_index, h_index, j, h) that one worker runs in order.
+    from parameters import continuation, persistent_chains
+    if continuation or persistent_chains:
+        # One contiguous piece of the snake per worker, so only the first point of every piece starts cold.
+        path = snake_path(len(J_ex_list), len(h_ex_list))
+        n_tasks = max(1, min(n_workers, len(path)))
+        pieces = [path[len(path) * i // n_tasks: len(path) * (i + 1) // n_tasks] for i in range(n_tasks)]
+    else:
+        pieces = [[(j_index, h_index)] for j_index in range(len(J_ex_list)) for h_index in range(len(h_ex_list))]
+    return [[(j_index, h_index, J_ex_list[j_index], h_ex_list[h_index]) for j_index, h_index in piece]
+            for piece in pieces]
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Worker Setup Functions ========================================================================================
+# ------ Defining a function to split the available cores into one block per worker ------------------------------------
+def cpu_blocks(n_workers, threads_per_worker=None):
+    # The blocks never overlap. A 'threads_per_worker' that does not fit on the cores is shrunk to the cores per worker.
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count()))
+    if n_workers > len(cpus):
+        raise ValueError(f"{n_workers} workers need at least as many cores, only {len(cpus)} are available.")
+    max_threads = len(cpus) // n_workers
+    if threads_per_worker is None:
+        threads_per_worker = max_threads
+    elif threads_per_worker > max_threads:
+        print(f"Warning: {n_workers} workers x {threads_per_worker} threads oversubscribe the {len(cpus)} cores, "
+              f"every worker gets {max_threads} instead.")
+        threads_per_worker = max_threads
+    return [cpus[worker * threads_per_worker:(worker + 1) * threads_per_worker] for worker in range(n_workers)]
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to restrict a process to a block of cores before JAX is imported --------------------------
+def limit_process_resources(cpu_block, pin_affinity=True):
+    # XLA reads its flags only once, when jax is imported. This has to run before the first netket/jax import.
+    # XLA has no flag for the size of its CPU thread pool, it takes one thread per core of the affinity mask. A single
+    # core worker switches the multi-threaded Eigen kernels off, larger blocks are limited by the affinity mask.
+    threads = len(cpu_block)
+    if threads == 1:
+        os.environ["XLA_FLAGS"] = (os.environ.get("XLA_FLAGS", "") + " --xla_cpu_multi_thread_eigen=false").strip()
+    for variable in ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"]:
+        os.environ[variable] = str(threads)
+    from parameters import run_type
+    os.environ["JAX_PLATFORM_NAME"] = run_type
+    if pin_affinity and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_block)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the initializer that runs once in every pool worker --------------------------------------------------
+def worker_initializer(block_queue, pin_affinity):
+    limit_process_resources(cpu_block=block_queue.get(), pin_affinity=pin_affinity)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Sweep Task Functions ==========================================================================================
+# ------ Defining a function to run a chain of (J, h) points -----------------------------------------------------------
+def run_chain(points):
+    from HMEX import hmex, get_context
+    from Function_Tools.Netket_module.checkpoint import point_checkpoint
+    from Function_Tools.Observables.observables import obs_list
+    from Function_Tools.Sweep_Module.results_store import results_store
+    from Function_Tools.Netket_module.estimators import statistics_info
+    from parameters import iterations, continuation, continuation_iterations, continuation_sampler_state
+    from parameters import target_error, persistent_chains
+    store = results_store()
+    carry_chains = persistent_chains or (continuation and continuation_sampler_state)
+    results = []
+    init_parameters, init_sampler_state = None, None
+    for j_index, h_index, j, h in points:
+        warm_start = continuation and init_parameters is not None
+        if store is not None and store.is_completed(J=j, h=h):
+            # Completed in an earlier run of the sweep: only its output files are written again.
+            parsed_data, info = store.load(J=j, h=h)
+            info['loaded_from_store'] = True
+            vstate = None
+            if continuation or carry_chains:
+                vstate = get_context().variational_state()
+                if not store.load_final_state(J=j, h=h, vstate=vstate):
+                    vstate = None
+        else:
+            checkpoint = None
+            if store is not None:
+                checkpoint = point_checkpoint(path=store.point_path(J=j, h=h, create=True), obs_list=obs_list)
+            n_iter = continuation_iterations if warm_start else iterations
+            log, obs_list, vstate, run_info = hmex(J=j, h=h, show_progress_bar=False, init_parameters=init_parameters,
+                                                   init_sampler_state=init_sampler_state, n_iter=n_iter,
+                                                   return_details=True, checkpoint=checkpoint)
+            # The streaming logger already holds the parsed rows and the statistics (see streaming_log.py).
+            parsed_data = log.parsed_data()
+            statistics = log.statistics()
+            log.close()
+            if checkpoint is not None:
+                parsed_data = checkpoint.prepend(parsed_data)
+            info = {'J': j, 'h': h, 'warm_started': warm_start}
+            info.update(run_info)
+            info.update(statistics_info(statistics, fields=['Energy'] + list(obs_list), target_error=target_error))
+            info['iterations_saved'] = iterations - run_info['iterations_run']
+            info['loaded_from_store'] = False
+            if store is not None:
+                store.save(J=j, h=h, parsed_data=parsed_data, info=info, vstate=vstate)
+        # A point loaded without a saved final state breaks the chain: the next point starts cold.
+        if continuation:
+            init_parameters = None if vstate is None else vstate.parameters
+        if carry_chains:
+            init_sampler_state = getattr(vstate, 'sampler_state', None)
+        results.append(((j_index, h_index), parsed_data, info))
+    return results
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Sweep Executor ================================================================================================
+# ------ Defining a function to run all (J, h) points and gather them in grid order ------------------------------------
+def sweep_executor(J_ex_list, h_ex_list, n_workers=None, show_progress_bar=True, cube=None):
+    # Returns a dictionary {(j_index, h_index): (parsed_data, info)} covering the whole grid.
+    # If a 'ResultCube' on the same grid is given, every point is written into it as soon as it is done.
+    from parameters import xla_threads_per_worker, pin_cpu_affinity, run_type, sweep_backend
+    if sweep_backend == "mpi":
+        from Function_Tools.Sweep_Module.mpi_task_farm import mpi_n_workers
+        n_workers = mpi_n_workers()
+    elif sweep_backend != "local":
+        raise ValueError("Sweep backend not recognized")
+    if n_workers is None:
+        from parameters import n_workers
+    if n_workers < 1:
+        raise ValueError("n_workers must be a positive integer.")
+    tasks = sweep_tasks(J_ex_list=J_ex_list, h_ex_list=h_ex_list, n_workers=n_workers)
+    results = {}
+    pbar = tqdm(total=len(J_ex_list) * len(h_ex_list), disable=not show_progress_bar)
+    pbar.set_description(f"Running on {run_type} [{n_workers} workers]")
+    # The tasks only compute. Their data files and plots are written in the background by the output pipeline.
+    pipeline = output_pipeline()
+
+    def gather(task_results):
+        for index, parsed_data, info in task_results:
+            results[index] = (parsed_data, info)
+            cube_point = None if cube is None else (cube.path,) + index
+            pipeline.submit(parsed_data=parsed_data, j=info['J'], h=info['h'], cube_point=cube_point)
+            pbar.update(1)
+    if sweep_backend == "mpi":
+        # The MPI ranks were set up by 'start_mpi_task_farm' in main.py, this process is rank 0.
+        from Function_Tools.Sweep_Module.mpi_task_farm import mpi_map
+        for task_results in mpi_map(task_function=run_chain, tasks=tasks):
+            gather(task_results)
+    elif n_workers == 1:
+        for task in tasks:
+            gather(run_chain(task))
+    else:
+        # 'spawn' gives every worker a fresh interpreter, so the XLA flags are set before jax is imported.
+        context = mp.get_context("spawn")
+        block_queue = context.Queue()
+        for block in cpu_blocks(n_workers=n_workers, threads_per_worker=xla_threads_per_worker):
+            block_queue.put(block)
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context, initializer=worker_initializer,
+                                 initargs=(block_queue, pin_cpu_affinity)) as pool:
+            futures = [pool.submit(run_chain, task) for task in tasks]
+            for future in as_completed(futures):
+                gather(future.result())
+    pbar.close()
+    pipeline.flush()
+    return results
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
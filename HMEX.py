@@ -2,79 +2,207 @@
 # Name:                 Simulation Module Function 'HMEX.py'
 # Description:          1. This module is designed to create final simulation function.
 #                       2. All the components required to run the simulation are called in this module
+#                       3. Everything that does not depend on (J, h) is built once per sweep in 'SimulationContext'.
+#                       4. Small Hilbert spaces use a full summation variational state instead of Markov chain sampling
+#                          (see 'exact_solver.state_backend').
+#                       5. The samples discarded by the Markov chains of every iteration are set by 'burn_in.py'.
 # Library Dependencies: 1. netket.vqs ("https://netket.readthedocs.io/en/latest/api/vqs.html")
 #                       2. netket.optimizer ("https://netket.readthedocs.io/en/latest/api/optimizer.html")
 #                       3. netket.driver ("https://netket.readthedocs.io/en/latest/api/drivers.html")
-#                       4. netket.logging ("https://netket.readthedocs.io/en/latest/api/logging.html")
 # Author:               Avishek Singh
 # Date:                 17.05.2022
-# Latest Update:        22.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
 # ========= Importing and setting up the libraries =====================================================================
 # Importing libraries from netket
 from netket.vqs import MCState
+import netket.vqs as vqs
 from netket.optimizer import SR
 from netket.driver import VMC
-from netket.logging import RuntimeLog
+import time
+
+# Full summation state, named 'ExactState' before NetKet 3.6.
+FullSumState = getattr(vqs, 'FullSumState', None) or vqs.ExactState
 # ======================================================================================================================
 
-# ====== Main Function =================================================================================================
-def hmex(J, h, show_progress_bar: bool = False):
-    # ------ Call Lattice Function -------------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.lattice import lattice, lattice_info
-    graph = lattice()
-    lattice_info(graph)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Hilbert Space Function -------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.hilbert_space import hilbert_space, hilbert_info
-    hilbert = hilbert_space(graph)
-    hilbert_info(hilbert)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Hamiltonian Function ---------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.hamiltonian import hamiltonian, hamiltonian_info
-    ha = hamiltonian(hilbert=hilbert, graph=graph, J=J, h=h)
-    hamiltonian_info(ha)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Neural Network Function ------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.neural_network import neural_network
-    model = neural_network(graph=graph)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Sampling Function ------------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.sampler import sampler
-    sa = sampler(hilbert=hilbert, graph=graph)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Optimizer Function -----------------------------------------------------------------------------------
-    from Function_Tools.Netket_module.optimizer import optimizer
-    opt = optimizer()
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Variational Sate Function ---------------------------------------------------------------------------------
-    from parameters import samples
-    vstate = MCState(sampler=sa, model=model, n_samples=samples)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Observable Function ----------------------------------------------------------------------------------
-    from Function_Tools.Observables.observables import observables
-    obs = observables(hilbert=hilbert, graph=graph, J=J)
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Call Variational Monte Calo Driver ------------------------------------------------------------------------
-    gs = VMC(hamiltonian=ha, optimizer=opt, variational_state=vstate, preconditioner=SR(diag_shift=0.01))
-    # ------------------------------------------------------------------------------------------------------------------
-
-    # ------ Creating Runtime Logger Object and Running Simulation -----------------------------------------------------
-    from parameters import iterations
-    log = RuntimeLog()
-    gs.run(n_iter=iterations, out=log, obs=obs, show_progress=show_progress_bar)
-    # ------------------------------------------------------------------------------------------------------------------
-    return log, list(obs.keys())
+# ====== Simulation Context ============================================================================================
+class SimulationContext:
+    """
+    Builds the lattice, Hilbert space, neural network, sampler, optimizer and the parametric Hamiltonian and
+    observables once and writes their information files once. 'run(J, h)' only rescales the operators and builds the
+    variational state and the driver. Reusing the same model and sampler objects also lets JAX reuse its compiled
+    functions.
+    """
+    def __init__(self):
+        start = time.perf_counter()
+        # ------ Call Lattice Function ---------------------------------------------------------------------------------
+        from Function_Tools.Netket_module.lattice import lattice, lattice_info
+        self.graph = lattice()
+        lattice_info(self.graph)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Hilbert Space Function ---------------------------------------------------------------------------
+        from Function_Tools.Netket_module.hilbert_space import hilbert_space, hilbert_info
+        self.hilbert = hilbert_space(self.graph)
+        hilbert_info(self.hilbert)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Neural Network Function --------------------------------------------------------------------------
+        from Function_Tools.Netket_module.neural_network import neural_network
+        self.model = neural_network(graph=self.graph)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Sampling Function --------------------------------------------------------------------------------
+        from Function_Tools.Netket_module.sampler import sampler
+        from Function_Tools.Netket_module.exact_solver import state_backend
+        self.state_backend = state_backend(self.hilbert)
+        self.sampler = sampler(hilbert=self.hilbert, graph=self.graph)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Optimizer Function -------------------------------------------------------------------------------
+        from Function_Tools.Netket_module.optimizer import optimizer
+        self.optimizer = optimizer()
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Parametric Hamiltonian and Observable Functions --------------------------------------------------
+        from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+        from Function_Tools.Observables.observables import ParametricObservables
+        # The full summation state takes the sparse matrices of the operators, the diagonal operators only have
+        # sampled local values.
+        operator = "local" if self.state_backend == "exact" else None
+        self.hamiltonian = ParametricHamiltonian(hilbert=self.hilbert, graph=self.graph, operator=operator)
+        self.observables = ParametricObservables(hilbert=self.hilbert, graph=self.graph, operator=operator)
+        # --------------------------------------------------------------------------------------------------------------
+        self._hamiltonian_info_written = False
+        self.setup_time = time.perf_counter() - start
+
+    def variational_state(self):
+        # A fresh variational state, also used as the target when loading saved parameters and sampler states. The
+        # full summation state has no sampler state.
+        if self.state_backend == "exact":
+            return FullSumState(hilbert=self.hilbert, model=self.model)
+        from parameters import samples
+        from Function_Tools.Netket_module.sampler_tuning import sampler_parameters
+        return MCState(sampler=self.sampler, model=self.model, n_samples=samples,
+                       n_discard_per_chain=sampler_parameters()['n_discard_per_chain'])
+
+    def run(self, J, h, show_progress_bar: bool = False, init_parameters=None, init_sampler_state=None, n_iter=None,
+            checkpoint=None):
+        # Returns the logger, the observable names, the variational state and the run information of the point.
+        # With a 'checkpoint' (see checkpoint.py) an interrupted run resumes. The logger then holds the new iterations.
+        start = time.perf_counter()
+        # ------ Call Hamiltonian Function -----------------------------------------------------------------------------
+        from Function_Tools.Netket_module.hamiltonian import hamiltonian_info
+        ha = self.hamiltonian(J=J, h=h)
+        if not self._hamiltonian_info_written:
+            # The structure of the Hamiltonian is the same for every point, so its information is written once.
+            hamiltonian_info(ha)
+            self._hamiltonian_info_written = True
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Variational Sate Function -----------------------------------------------------------------------------
+        vstate = self.variational_state()
+        if init_parameters is not None:
+            vstate.parameters = init_parameters
+        if init_sampler_state is not None and hasattr(vstate, 'sampler_state'):
+            vstate.sampler_state = init_sampler_state
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Observable Function ------------------------------------------------------------------------------
+        obs = self.observables(J=J)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Variational Monte Calo Driver --------------------------------------------------------------------
+        gs = VMC(hamiltonian=ha, optimizer=self.optimizer, variational_state=vstate,
+                 preconditioner=SR(diag_shift=0.01))
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Resuming from the Checkpoint of an Interrupted Run ----------------------------------------------------
+        start_step = 0
+        if checkpoint is not None:
+            start_step = checkpoint.restore(gs)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Burn-in Function ---------------------------------------------------------------------------------
+        from Function_Tools.Netket_module.burn_in import burn_in
+        # Chains carried over from the previous point or restored from the checkpoint have already thermalized.
+        burn = burn_in(vstate=vstate, n_sites=self.hilbert.size,
+                       carried_chains=init_sampler_state is not None or start_step > 0)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Call Convergence Monitor Function ---------------------------------------------------------------------
+        from Function_Tools.Netket_module.convergence import convergence_monitor
+        from Function_Tools.Observables.observable_schedule import observable_schedule
+        if n_iter is None:
+            from parameters import iterations as n_iter
+        # A checkpoint saved on the last iteration (or of a longer run) already covers the whole run.
+        n_iter_left = max(0, n_iter - start_step)
+        monitor = convergence_monitor(graph=self.graph)
+        # The observables are evaluated by the schedule, which has to run before the callbacks that read them.
+        schedule = observable_schedule(obs=obs, n_iter=n_iter_left, monitor=monitor)
+        callback = [schedule] + [item for item in [burn, monitor] if item is not None]
+        if checkpoint is not None:
+            callback.append(checkpoint)
+        # --------------------------------------------------------------------------------------------------------------
+
+        # ------ Creating Streaming Logger Object and Running Simulation -----------------------------------------------
+        from Function_Tools.Netket_module.streaming_log import streaming_log
+        setup_time = time.perf_counter() - start
+        if n_iter_left == 0:
+            # Nothing is run again: the logger holds the restored iterations and the state is the one of the checkpoint.
+            log = checkpoint.replay(streaming_log(obs_list=list(obs.keys()), n_iter=start_step, J=J, h=h))
+        else:
+            log = streaming_log(obs_list=list(obs.keys()), n_iter=n_iter_left, J=J, h=h)
+            gs.run(n_iter=n_iter_left, out=log, obs={}, show_progress=show_progress_bar, callback=callback)
+        # --------------------------------------------------------------------------------------------------------------
+        if n_iter_left == 0:
+            # The checkpoint does not record whether the run had converged.
+            run_info = {'iterations_run': 0, 'converged': None, 'stop_iteration': -1, 'converged_iteration': None,
+                        'stop_reason': 'restored_from_checkpoint'}
+        elif monitor is None:
+            run_info = {'iterations_run': n_iter_left, 'converged': None, 'stop_iteration': n_iter_left - 1,
+                        'converged_iteration': None, 'stop_reason': 'fixed_iterations'}
+        else:
+            # The convergence windows restart with a resumed run.
+            run_info = monitor.info(n_iter=n_iter_left)
+        run_info['iterations_run'] += start_step
+        run_info['stop_iteration'] += start_step
+        if run_info['converged_iteration'] is not None:
+            run_info['converged_iteration'] += start_step
+        run_info['resumed_from'] = start_step
+        run_info['observable_evaluations'] = sum(schedule.n_evaluated.values())
+        if burn is not None:
+            run_info.update(burn.info())
+        run_info['setup_time'] = setup_time
+        run_info['run_time'] = time.perf_counter() - start - setup_time
+        return log, list(obs.keys()), vstate, run_info
 # ----------------------------------------------------------------------------------------------------------------------
 
+# ------ Defining a function to return the simulation context of this process ------------------------------------------
+_context = None
+
+
+def get_context():
+    # One context per process: the parameters module does not change during a sweep, so the context never goes stale.
+    global _context
+    if _context is None:
+        _context = SimulationContext()
+    return _context
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ====== Main Function =================================================================================================
+def hmex(J, h, show_progress_bar: bool = False, init_parameters=None, init_sampler_state=None, n_iter=None,
+         return_details: bool = False, checkpoint=None):
+    # 'init_parameters' and 'init_sampler_state' warm start the run from a previous point (see parameters.continuation).
+    log, obs_list, vstate, run_info = get_context().run(J=J, h=h, show_progress_bar=show_progress_bar,
+                                                        init_parameters=init_parameters,
+                                                        init_sampler_state=init_sampler_state, n_iter=n_iter,
+                                                        checkpoint=checkpoint)
+    if return_details is True:
+        return log, obs_list, vstate, run_info
+    return log, obs_list
+# ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
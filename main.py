@@ -3,12 +3,17 @@
 # Description:          1. This module is designed to run simulation.
 #                       2. All the components required to run the simulation are called in this module
 #                       3. Modify This file to run simulation with different 'J' & 'h' or loop over different parameters
+#                       4. Command line interface: 'python main.py [simulate | postprocess | plot | fit]'. Without a
+#                          command the simulation, the post processing and the fit run one after the other.
+#                       5. Heavy libraries (jax, netket, matplotlib, scipy) are only imported by the commands that use
+#                          them, so e.g. 'python main.py postprocess' starts without jax and netket.
 # Library Dependencies: 1. numpy ("https://numpy.org/")
 #                       2. os ("https://docs.python.org/3/library/os.html")
-#                       3. tqdm ("https://tqdm.github.io/")
+#                       3. pandas ("https://pandas.pydata.org/")
+#                       4. argparse ("https://docs.python.org/3/library/argparse.html")
 # Author:               Avishek Singh
 # Date:                 22.05.2022
-# Latest Update:        25.05.2022
+# Latest Update:        18.10.2026
 # Version:              1.0.0
 # ======================================================================================================================
 
@@ -29,124 +34,215 @@ else:
     raise ValueError
 # ----------------------------------------------------------------------------------------------------------------------
 
-# ----- Importing Numpy ------------------------------------------------------------------------------------------------
-import numpy as np
-# ----------------------------------------------------------------------------------------------------------------------
-
-# ----- Importing Pandas DataFrame -------------------------------------------------------------------------------------
-import pandas as pd
-# ----------------------------------------------------------------------------------------------------------------------
-
-# ----- Importing Other Libraries --------------------------------------------------------------------------------------
-from tqdm import tqdm  # To create progress bar over loops
+# ----- Importing Argparse ---------------------------------------------------------------------------------------------
+import argparse
 # ----------------------------------------------------------------------------------------------------------------------
 # ======================================================================================================================
 
-# ======= Main Simulation Module =======================================================================================
-if __name__ == "__main__":
-    # ========== Running Main Simulation Module ========================================================================
+# ======= Command Functions ============================================================================================
+# ------ Defining a function to run the simulation of all (J, h) points ------------------------------------------------
+def simulate():
+    # Returns the 'ResultAccumulator' with the traces and averages of the sweep.
+    import pandas as pd
+    # ----- Starting the MPI task farm ---------------------------------------------------------------------------------
+    from parameters import sweep_backend
+    if sweep_backend == "mpi":
+        # Has to run before netket is imported. Only rank 0 continues past this point, the other ranks serve tasks.
+        from Function_Tools.Sweep_Module.mpi_task_farm import start_mpi_task_farm
+        start_mpi_task_farm()
+    # ------------------------------------------------------------------------------------------------------------------
+
     # ----- Setting up the parameters ----------------------------------------------------------------------------------
-    from parameters import J_ex, J_ex_increment, h_ex, h_ex_increment
-    h_num = abs(round((min(h_ex) - max(h_ex)) / h_ex_increment)) + 1
-    J_num = abs(round((min(J_ex) - max(J_ex)) / J_ex_increment)) + 1
-    h_ex_list = np.linspace(min(h_ex), max(h_ex), h_num)
-    J_ex_list = np.linspace(min(J_ex), max(J_ex), J_num)
+    from Function_Tools.Sweep_Module.sweep_executor import parameter_grid
+    J_ex_list, h_ex_list = parameter_grid()
     # ------------------------------------------------------------------------------------------------------------------
 
-    # ----- Loop over different parameters -----------------------------------------------------------------------------
-    from HMEX import hmex
-    from Function_Tools.Observables.observables import obs_list
-    # ------ Creating dataframe list for J, h, and observables ---------------------------------------------------------
-    df_jh_list = ['Energy']
-    df_jh_list.extend(obs_list)
-    df_jh_dict = {}
-    for item in df_jh_list:
-        df_jh_dict[item] = pd.DataFrame()
+    # ----- Autotuning the sampler -------------------------------------------------------------------------------------
+    from parameters import autotune_sampler
+    if autotune_sampler:
+        # Before the sweep context is built, the sweep processes read the tuned configuration from file.
+        from Function_Tools.Netket_module.sampler_tuning import autotune
+        autotune(J_ex_list=J_ex_list, h_ex_list=h_ex_list)
     # ------------------------------------------------------------------------------------------------------------------
-    for j in (pbar_J := tqdm(J_ex_list, position=0)):
-        pbar_J.set_description(f"Running on {run_type} " + "[J = {0:5.2f}]".format(j))
-        # ------ Creating dataframe list -------------------------------------------------------------------------------
-        df_list = ['Energy']
-        df_list.extend(obs_list)
-        df_dict = {}
-        for item in df_list:
-            df_dict[item] = pd.DataFrame()
-        dict_mean = {}
-        for item in df_list:
-            dict_mean[item] = []
-        # --------------------------------------------------------------------------------------------------------------
-        for h in (pbar_h := tqdm(h_ex_list, position=1, leave=False)):
-            pbar_h.set_description(f"Running on {run_type} " + "[h = {0:5.2f}]".format(h))
-            # ----- Running the simulation -----------------------------------------------------------------------------
-            log, obs_list = hmex(J=j, h=h, show_progress_bar=False)
-            # ----------------------------------------------------------------------------------------------------------
-
-            # ----- Parsing data and writing to a file -----------------------------------------------------------------
-            from Function_Tools.FileWriting_GraphPloting_Module.File_Module import parse_logger_data
-
-            parsed_data = parse_logger_data(logger_object=log, obs_list=obs_list, write_to_file=True,
-                                            j=j, h=h)
-            from parameters import n_values
-            for key, value in dict_mean.items():
-                value.append(np.mean(parsed_data[key][-n_values:]))
-            # ----------------------------------------------------------------------------------------------------------
-
-            # ----- Plotting the data ----------------------------------------------------------------------------------
-            from Function_Tools.FileWriting_GraphPloting_Module.graph_module import parsed_data_plot
-            parsed_data_plot(parsed_data=parsed_data, show_plot=False, save_plot=True, var1=j, var2=h)
-            # ----------------------------------------------------------------------------------------------------------
-
-            # ----- Storing Parsed data to a dataframe for all h values ------------------------------------------------
-            from Function_Tools.FileWriting_GraphPloting_Module.File_Module import combine_parsed_data
-            var_parsed_df = combine_parsed_data(parsed_data=parsed_data, df_dict=df_dict, var=h, var_list=h_ex_list)
-            # ----------------------------------------------------------------------------------------------------------
 
-        # ----- Writing J based parsed data to file --------------------------------------------------------------------
-        from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_combined_data_to_file
-        write_combined_data_to_file(data_df=var_parsed_df, var=j)
-        # --------------------------------------------------------------------------------------------------------------
+    # ----- Running all (J, h) points on the sweep executor ------------------------------------------------------------
+    from parameters import h_grid_mode
+    from Function_Tools.FileWriting_GraphPloting_Module.result_cube import create_result_cube
+    if h_grid_mode == "uniform":
+        # The points go into the result cube while the sweep runs.
+        from Function_Tools.Sweep_Module.sweep_executor import sweep_executor
+        cube = create_result_cube(J_ex_list=J_ex_list, h_ex_list=h_ex_list)
+        results = sweep_executor(J_ex_list=J_ex_list, h_ex_list=h_ex_list, cube=cube)
+    elif h_grid_mode == "adaptive":
+        # The adaptive sweep replaces the uniform h grid by the refined one, so the cube is written once it is known.
+        from Function_Tools.Sweep_Module.adaptive_grid import adaptive_sweep
+        h_ex_list, results = adaptive_sweep(J_ex_list=J_ex_list)
+        cube = create_result_cube(J_ex_list=J_ex_list, h_ex_list=h_ex_list)
+        for (j_index, h_index), (parsed_data, info) in results.items():
+            cube.write_point(j_index=j_index, h_index=h_index, parsed_data=parsed_data)
+    else:
+        raise ValueError("h grid mode not recognized")
+    # ------------------------------------------------------------------------------------------------------------------
 
-        # ----- Storing J based parsed data to a dataframe for all J values --------------------------------------------
-        for key, df_jh in df_jh_dict.items():
-            if j == J_ex_list[0]:
-                df_jh['#h'] = h_ex_list
-            df_jh['j=' + str(j)] = dict_mean[key]
+    # ----- Gathering the results in grid order ------------------------------------------------------------------------
+    from Function_Tools.Observables.observables import obs_list
+    from Function_Tools.FileWriting_GraphPloting_Module.result_accumulator import ResultAccumulator
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_combined_data_to_file
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_parsed_data_jh
+    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_point_info
+    from parameters import iterations, n_values, unconverged_policy, text_output
+    accumulator = ResultAccumulator(J_values=J_ex_list, h_values=h_ex_list, n_iter=iterations,
+                                    fields=['Energy'] + list(obs_list), n_values=n_values)
+    point_info_list = []
+    for j_index, j in enumerate(J_ex_list):
+        for h_index, h in enumerate(h_ex_list):
+            parsed_data, info = results[(j_index, h_index)]
+            point_info_list.append(info)
+            average = not (info['converged'] is False and unconverged_policy == "nan")
+            accumulator.add_point(j_index=j_index, h_index=h_index, parsed_data=parsed_data, average=average, info=info)
+
+        # ----- Writing J based parsed data to file --------------------------------------------------------------------
+        if text_output == "all":
+            write_combined_data_to_file(data_df=accumulator.combined_frames(j_index=j_index), var=j)
         # --------------------------------------------------------------------------------------------------------------
 
-    # ----- Writing J based parsed data to file ------------------------------------------------------------------------
-    from Function_Tools.FileWriting_GraphPloting_Module.File_Module import write_parsed_data_jh
-    write_parsed_data_jh(df_dict=df_jh_dict)
+    # ----- Writing J based parsed data and its errors to file ---------------------------------------------------------
+    write_parsed_data_jh(df_dict=accumulator.jh_frames())
+    write_parsed_data_jh(df_dict=accumulator.jh_frames(errors=True))
     # ------------------------------------------------------------------------------------------------------------------
-    # ==================================================================================================================
 
-    # ====== Post Processing ===========================================================================================
-    # ------ Writing persite J & h parsed data -------------------------------------------------------------------------
-    from Function_Tools.PostProcessing_Module.PostProcessing import perSiteData
-    from parameters import source_path, J_parsed_file_path
-    path = os.path.join(source_path, J_parsed_file_path)
-    column_list = []
-    for items in J_ex_list:
-        column_list.append('j=' + str(items))
-    perSiteData(path, column_list)
+    # ----- Writing the exact reference of all points to file ----------------------------------------------------------
+    # Only the lattice, the Hilbert space and the operators are built: the reference needs no network or sampler.
+    from parameters import reference_solver as solver
+    from Function_Tools.Netket_module.exact_solver import reference_solver
+    from Function_Tools.Netket_module.lattice import lattice
+    from Function_Tools.Netket_module.hilbert_space import hilbert_space
+    graph = lattice() if solver != "none" else None
+    hilbert = hilbert_space(graph) if solver != "none" else None
+    if solver != "none" and reference_solver(hilbert) == "lanczos":
+        from Function_Tools.Netket_module.exact_solver import ExactReference, exact_frames
+        from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+        from Function_Tools.Observables.observables import ParametricObservables
+        reference = ExactReference(hamiltonian=ParametricHamiltonian(hilbert=hilbert, graph=graph),
+                                   observables=ParametricObservables(hilbert=hilbert, graph=graph))
+        exact = reference.solve(J_values=J_ex_list, h_values=h_ex_list)
+        write_parsed_data_jh(df_dict=exact_frames(exact, J_values=J_ex_list, h_values=h_ex_list,
+                                                  fields=accumulator.fields))
+        for k, info in enumerate(point_info_list):
+            j_index, h_index = divmod(k, len(h_ex_list))
+            energy = float(accumulator.means[j_index, h_index, 0])
+            energy_exact = float(exact['Energy'][j_index, h_index])
+            info['Energy_exact'] = energy_exact
+            # VMC energies are variational, so the relative error is >= 0 up to the statistical error.
+            info['Energy_rel_error'] = (energy - energy_exact) / abs(energy_exact) if energy_exact else float('nan')
     # ------------------------------------------------------------------------------------------------------------------
 
-    # ------ Computing Magnetic Susceptibility -------------------------------------------------------------------------
-    from Function_Tools.PostProcessing_Module.PostProcessing import computeMagneticSusceptibility
-    computeMagneticSusceptibility()
+    # ----- Plotting the bundled traces --------------------------------------------------------------------------------
+    from parameters import plot_bundle
+    if plot_bundle != "none":
+        from Function_Tools.FileWriting_GraphPloting_Module.plot_renderer import render_trace_plots
+        render_trace_plots(cube_path=cube.path)
     # ------------------------------------------------------------------------------------------------------------------
 
-    # ------ Computing angle between spins -----------------------------------------------------------------------------
-    from Function_Tools.PostProcessing_Module.PostProcessing import computeAngle
-    computeAngle()
+    # ----- Writing per point sweep information to file ----------------------------------------------------------------
+    point_info_df = pd.DataFrame(point_info_list)
+    write_point_info(point_info_df=point_info_df)
+    print(f"Iterations saved: {point_info_df['iterations_saved'].sum()} of "
+          f"{point_info_df['iterations_run'].sum() + point_info_df['iterations_saved'].sum()}")
+    if 'Energy_rel_error' in point_info_df:
+        print(f"Largest relative energy error against the exact reference: "
+              f"{point_info_df['Energy_rel_error'].max():.3g} (see point_info.txt and the '_exact' J parsed files)")
+    from parameters import target_error
+    if target_error is not None:
+        print(f"Averaged iterations for an energy error of {target_error}: up to "
+              f"{point_info_df['n_values_for_target'].max()} (now n_values = {n_values}, see point_info.txt)")
+    unconverged_df = point_info_df[point_info_df['converged'] == False]  # noqa: E712 ('converged' may hold None)
+    if len(unconverged_df) > 0:
+        print(f"Warning: {len(unconverged_df)} points did not converge (see point_info.txt):")
+        print(unconverged_df[['J', 'h']].to_string(index=False))
     # ------------------------------------------------------------------------------------------------------------------
+    return accumulator
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to post process the J parsed files --------------------------------------------------------
+def postprocess(accumulator=None):
+    # Per site data, magnetic susceptibility and spin angle in one pass. With the 'ResultAccumulator' of 'simulate' the
+    # averages are taken from memory, otherwise the J parsed files are read once.
+    import numpy as np
+    from Function_Tools.PostProcessing_Module.PostProcessing import post_process, read_J_parsed
+    from parameters import source_path, J_parsed_file_path
+    path = os.path.join(source_path, J_parsed_file_path)
+    if accumulator is not None:
+        J_columns = ['j=' + str(items) for items in accumulator.J_values]
+        post_process(h_values=np.asarray(accumulator.h_values), J_columns=J_columns, fields=accumulator.fields,
+                     values=accumulator.means, directory_path=path, errors=accumulator.errors)
+    else:
+        h_values, J_columns, fields, values, errors = read_J_parsed(path, errors=True)
+        post_process(h_values=h_values, J_columns=J_columns, fields=fields, values=values, directory_path=path,
+                     errors=errors)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining a function to plot the J parsed files ----------------------------------------------------------------
+def plot(show_plot=False, traces=False):
+    # The J parsed plots, and with 'traces' also the trace plots of every point from the result cube.
+    from parameters import source_path, J_parsed_file_path, J_parsed_plot_path
+    inp_path = os.path.join(source_path, J_parsed_file_path)
+    out_path = os.path.join(source_path, J_parsed_plot_path)
+    if show_plot is True:
+        # Showing plots needs the pyplot state machine, so this runs serially on the interactive backend.
+        from Function_Tools.FileWriting_GraphPloting_Module.graph_module import plot_J_based_parsed_data
+        plot_J_based_parsed_data(input_file_path=inp_path, out_file_path=out_path, show_plot=True, save_plot=True)
+    else:
+        from Function_Tools.FileWriting_GraphPloting_Module.plot_renderer import render_J_parsed_plots
+        render_J_parsed_plots(input_file_path=inp_path, out_file_path=out_path)
+    if traces is True:
+        from Function_Tools.FileWriting_GraphPloting_Module.plot_renderer import render_trace_plots
+        render_trace_plots()
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
 
-    # ------ Fit Magnetization -----------------------------------------------------------------------------------------
+# ------ Defining a function to fit the magnetization ------------------------------------------------------------------
+def fit(show_plot=False):
+    from Function_Tools.PostProcessing_Module.fitting_module import fit_mag, tanh_model, tanh_guess
     from parameters import source_path, J_parsed_file_path
-    from Function_Tools.PostProcessing_Module.fitting_module import fit_mag
-    def func(x, a, b, c, d):
-        return a * np.tanh(b * x - c) + d
     path = source_path + J_parsed_file_path + 'PerSite_MSZ.txt'
-    fit_mag(function=func, input_datafile=path, out_file='MSZ_fit', save_plot=True, show_plot=True)
-    # ------------------------------------------------------------------------------------------------------------------
-    # ==================================================================================================================
+    fit_mag(function=tanh_model, input_datafile=path, out_file='MSZ_fit', save_plot=True, show_plot=show_plot,
+            p0=tanh_guess)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Defining the command line interface ---------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Heisenberg model in an external magnetic field with NetKet. "
+                                                 "Without a command: simulate, postprocess and fit.")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('simulate', help="run the (J, h) sweep and write the J parsed files")
+    subparsers.add_parser('postprocess', help="per site data, magnetic susceptibility and spin angle")
+    for command, help_text in [('plot', "plot the J parsed files"), ('fit', "fit the per site magnetization")]:
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument('--show-plot', action='store_true', help="also show the plots on screen")
+        if command == 'plot':
+            subparser.add_argument('--traces', action='store_true',
+                                   help="also plot the traces of every point from the result cube")
+    args = parser.parse_args(argv)
+    if args.command == 'simulate':
+        simulate()
+    elif args.command == 'postprocess':
+        postprocess()
+    elif args.command == 'plot':
+        plot(show_plot=args.show_plot, traces=args.traces)
+    elif args.command == 'fit':
+        fit(show_plot=args.show_plot)
+    else:
+        accumulator = simulate()
+        postprocess(accumulator=accumulator)
+        fit(show_plot=True)
+    return None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
+
+# ======= Main Simulation Module =======================================================================================
+if __name__ == "__main__":
+    main()
 # ======================================================================================================================
@@ -84,10 +84,12 @@ J_ex_increment = 0.5     # Increment over J_ex range
 write_hamiltonian_info = True  # Write hamiltonian information to file "hamiltonian_Info.txt"
 print_hamiltonian_info = False  # Print hamiltonian information to screen
 path_to_hamiltonian_info = path_results + "QSfiles/"  # Path to hamiltonian information file
+hamiltonian_operator = "local"     # "local": NetKet LocalOperator. "diagonal": local energies and MSZ from the samples
 # ----------------------------------------------------------------------------------------------------------------------
 
 # ----- Neural Network Parameters --------------------------------------------------------------------------------------
 neural_network_type = "DenseFFNN"  # Type of Neural Network: "DenseFFNN" or "DenseFFNN_sym" or "G-CNN"
+network_dtype = "complex128"       # "complex128", "complex64" or the opt-in "float64", "float32" (real weights, psi>0)
 if neural_network_type == "DenseFFNN":
     pass
 elif neural_network_type == "DenseFFNN_sym":
@@ -103,6 +105,8 @@ else:
 sampler_type = "Local"    # Type of Sampler: "Local" or "Exchange"
 n_chains_per_rank = None  # Number of independent chains on every MPI rank. If "None", takes default value (=16).
 machine_pow = None        # The power to which the machine should be exponentiated. If "None", takes default value (=2).
+n_sweeps = None           # Metropolis steps between two samples of a chain. If "None", takes default value (=sites).
+n_discard_per_chain = None  # Samples discarded at the start of every chain. If "None", takes default (=chain length/10)
 if sampler_type == "Local":
     pass
 elif sampler_type == "Exchange":
@@ -111,6 +115,24 @@ else:
     raise ValueError("Sampler type not recognized")
 # ----------------------------------------------------------------------------------------------------------------------
 
+# ------ Sampler Autotuning Parameters ---------------------------------------------------------------------------------
+autotune_sampler = False                 # Measure the candidates below before the sweep and sample with the fastest one
+autotune_rules = ["Local", "Exchange"]   # Sampler types to try, only the ones that are ergodic on the Hilbert space
+autotune_chains = [8, 16, 32, 64]        # Chains per MPI rank to try
+autotune_sweep_factors = [0.5, 1, 2, 4]  # n_sweeps to try, in units of the number of sites
+autotune_discards = [0, 5]               # n_discard_per_chain to try
+autotune_warmup_iterations = 50          # VMC iterations at the centre of the grid before the candidates are measured
+autotune_repeats = 5                     # Measured VMC iterations per candidate
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Markov Chain Burn-in Parameters -------------------------------------------------------------------------------
+persistent_chains = False   # Carry the Markov chains from one point to the next of a worker, also without continuation
+burn_in = "fixed"           # "fixed": n_discard_per_chain samples every iteration. "adaptive": set by a drift test
+burn_in_interval = 5        # Iterations between two drift tests of "adaptive", each is a forward pass over the samples
+burn_in_z = 3.0             # The chains count as thermalized while the drift statistic of log|psi|^2 is below this
+burn_in_max_discard = None  # Most samples discarded per chain and iteration. If "None", the chain length.
+# ----------------------------------------------------------------------------------------------------------------------
+
 # ------ Optimizer Parameters ------------------------------------------------------------------------------------------
 optimizer_type = "Sgd"  # Type of Optimizer: "Sgd" or "AdaGrad" or "Adam"
 learning_rate = 0.01     # Learning rate
@@ -132,6 +154,92 @@ iterations = 300
 samples = 512
 # ----------------------------------------------------------------------------------------------------------------------
 
+# ------ Exact Backend Parameters --------------------------------------------------------------------------------------
+state_backend = "auto"         # "mc": Markov chain sampling. "exact": full summation over all basis states. "auto"
+exact_max_states = 2 ** 10     # "auto" sums exactly up to this many basis states (full summation + SR is slower above)
+reference_solver = "none"      # Exact ground state of every point as reference: "lanczos", "none" or "auto"
+reference_max_states = 2 ** 20  # "auto" computes the reference up to this many basis states
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Observable Schedule Parameters --------------------------------------------------------------------------------
+# When every observable is evaluated: 1 (every iteration), k (every k-th iteration) or "window" (only in the averaging
+# window, the last n_values iterations, which is always evaluated). Skipped iterations are NaN. With early stopping, a
+# "window" observable makes a converged point run n_values more iterations, its averaging window.
+observable_schedule = {'MSX': 1, 'MSY': 1, 'MSZ': 1, 'chi_corrZ': 1}
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Convergence (Early Stopping) Parameters -----------------------------------------------------------------------
+early_stopping = False           # Stop a point once it has converged. 'iterations' is then the maximum per point.
+convergence_window = 40          # Iterations the criteria are evaluated over. Keep it >= n_values.
+min_iterations = 80              # A point is never stopped before this iteration (at least 2 * convergence_window)
+convergence_rtol = 1e-3          # Max relative change of the mean energy between two consecutive windows. "None": off
+convergence_variance_tol = None  # Max mean energy variance per site over the window. If "None", not used.
+convergence_rhat_tol = 1.1       # Max split R-hat of the energy over the window. If "None", not used.
+convergence_tau_tol = None       # Max mean energy autocorrelation time over the window. If "None", not used.
+unconverged_policy = "flag"      # Unconverged points: "flag" (average and mark them) or "nan" (write NaN averages)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Streaming Logger Parameters -----------------------------------------------------------------------------------
+log_trace = "memory"      # Trace of a point: "memory" (float array), "disk" (spilled in chunks), "none" (last n_values)
+log_chunk_size = 256      # Iterations buffered in memory before they are spilled to disk ("disk" only)
+log_spill_path = path_results + "trace_files/"  # Define location here to buffer the spilled traces of running points
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Estimator Parameters ------------------------------------------------------------------------------------------
+estimator_min_blocks = 4  # Blocking analysis of the averages: smallest number of blocks a block level may have
+target_error = None       # Target error of the mean energy. Reports 'n_values_for_target' per point. "None": off
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Sweep Executor Parameters -------------------------------------------------------------------------------------
+n_workers = 1                  # Number of worker processes for the (J, h) sweep. Set 1 to run the points serially.
+xla_threads_per_worker = None  # XLA threads of every worker. If "None", the available cores are split over the workers.
+pin_cpu_affinity = True        # Pin every worker to its own block of CPU cores (Linux only).
+point_info_path = path_results + "sweep_files/"  # Define location here to save the per point sweep information
+sweep_backend = "local"        # "local": process pool of n_workers. "mpi": MPI task farm (run main.py with mpirun)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Continuation (Warm Start) Parameters --------------------------------------------------------------------------
+continuation = False             # Start every point from the converged parameters of the previous point on the path
+continuation_iterations = 100    # Iterations for warm started points. The first point of a path runs 'iterations'.
+continuation_sampler_state = True  # Also carry the sampler state (Markov chains) from one point to the next
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Adaptive h-Grid Parameters ------------------------------------------------------------------------------------
+h_grid_mode = "uniform"          # "uniform": h_ex and h_ex_increment. "adaptive": refine h around the MSZ transition
+adaptive_initial_points = 11     # Points of the coarse starting grid over the h_ex range
+adaptive_max_points = 101        # Budget: maximum number of h points of the refined grid
+adaptive_points_per_round = 8    # Maximum number of h points added per refinement round
+adaptive_criterion = "slope"     # Refinement indicator: "slope" (|dMSZ/dh| * dh) or "tanh_residual" (MSZ fit residual)
+adaptive_tolerance = 0.02        # Stop refining intervals whose indicator is below this fraction of the MSZ range
+adaptive_min_spacing = 0.005     # Never make the h spacing smaller than this
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Output Pipeline Parameters ------------------------------------------------------------------------------------
+output_backend = "sync"      # Write data files and plots in a background "process" or "thread". "sync": write inline
+output_queue_size = 16       # Points that may wait for the writer before the sweep blocks
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Result Cube Parameters ----------------------------------------------------------------------------------------
+cube_path = path_results + "result_cube/"  # Define location here to save the binary (J, h, iteration, field) cube
+text_output = "all"       # "all": the per point, per J and J-parsed text files. "summary": only the J-parsed files.
+#                          The full text layout can be regenerated from the cube with 'result_cube.export_text'.
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Plot Renderer Parameters --------------------------------------------------------------------------------------
+plot_bundle = "none"        # Trace plots: "none" (a file per observable and point), "J" or "observable" (multi-page)
+plot_format = "pdf"         # "pdf" or "png" (rasterized, for long traces). Bundles need "pdf".
+plot_dpi = 100              # Resolution of PNG plots and of rasterized traces
+plot_rasterize_above = 5000  # Traces with more points are rasterized inside PDF plots
+plot_workers = 1            # Number of processes rendering the plots after the sweep
+plot_cache = True           # Render only plots whose data or options changed (hashes in '.plot_manifest' per folder)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Results Store and Checkpoint Parameters -----------------------------------------------------------------------
+results_store = False     # Save every completed point under a hash of its parameters. A restarted sweep skips them.
+store_path = path_results + "results_store/"  # Define location here to save the results store
+checkpoint_every = 25     # Save a running point every n iterations to resume it (results store only). "None": off
+# ----------------------------------------------------------------------------------------------------------------------
+
 # ----- Miscellaneous --------------------------------------------------------------------------------------------------
 n_values = 20
 # ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+# ======================================================================================================================
+# Name:                 Adaptive h-Grid Tests 'test_adaptive_grid.py'
+# Description:          1. Tests of the refinement rule of 'adaptive_grid.py' on a synthetic magnetization step.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+from Function_Tools.Sweep_Module.adaptive_grid import interval_scores, refine_h_grid, window_mean
+# ======================================================================================================================
+
+# ====== Refinement Tests ==============================================================================================
+h_values = np.linspace(0.0, 6.0, 7)
+
+
+def magnetization(h, h_c=2.2):
+    return 0.5 * np.tanh(3 * (h - h_c)) + 0.5
+
+
+def test_refines_around_the_transition():
+    new_h = refine_h_grid(h_values, [magnetization(h_values)], "slope", tolerance=0.05, min_spacing=0.005, n_new=2)
+    np.testing.assert_allclose(new_h, [1.5, 2.5])
+
+
+def test_tanh_residual_accepts_a_tanh_step():
+    h_fine = np.linspace(0.0, 6.0, 13)
+    assert np.max(interval_scores(h_fine, magnetization(h_fine), criterion="tanh_residual")) < 1e-3
+    # A kink is not a tanh, the intervals around it score higher than the flat ends.
+    scores = interval_scores(h_fine, np.clip((h_fine - 1.5) / 1.5, 0, 1), criterion="tanh_residual")
+    assert np.argmax(scores) in range(2, 7)
+    assert scores[-1] < np.max(scores)
+
+
+def test_flat_curve_and_min_spacing_stop_the_refinement():
+    assert len(refine_h_grid(h_values, [np.ones(7)], "slope", tolerance=0.05, min_spacing=0.005, n_new=4)) == 0
+    # Every interval is 1 wide, none is split with a minimum spacing above 0.5.
+    assert len(refine_h_grid(h_values, [magnetization(h_values)], "slope", tolerance=0.05, min_spacing=0.6,
+                             n_new=4)) == 0
+
+
+def test_any_J_triggers_a_split():
+    msz_list = [np.ones(7), magnetization(h_values, h_c=4.1)]
+    new_h = refine_h_grid(h_values, msz_list, "slope", tolerance=0.05, min_spacing=0.005, n_new=1)
+    np.testing.assert_allclose(new_h, [4.5])
+
+
+def test_nan_points_are_skipped():
+    msz = magnetization(h_values)
+    msz[2] = np.nan
+    scores = interval_scores(h_values, msz)
+    assert np.all(np.isfinite(scores))
+    # The intervals on both sides of the NaN point share the score of the interval from h = 1 to h = 3.
+    assert scores[1] == scores[2] > 0.5
+    assert np.all(interval_scores(h_values, np.full(7, np.nan)) == 0)
+    new_h = refine_h_grid(h_values, [msz], "slope", tolerance=0.05, min_spacing=0.005, n_new=1)
+    assert len(new_h) == 1 and 1.0 < new_h[0] < 3.0
+
+
+def test_window_mean_skips_nan():
+    assert window_mean([5.0, 1.0, np.nan, 3.0], n_values=3) == 2.0
+    assert np.isnan(window_mean([1.0, np.nan, np.nan], n_values=2))
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,106 @@
+# ======================================================================================================================
+# Name:                 Burn-in Tests 'test_burn_in.py'
+# Description:          1. Tests of the drift test of 'burn_in.py' on synthetic stationary and relaxing Markov chains,
+#                          of the sample layout and of the discard the adaptive callback sets.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. netket ("https://www.netket.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+from types import SimpleNamespace
+import numpy as np
+import pytest
+import netket as nk
+from Function_Tools.Netket_module import burn_in
+from Function_Tools.Netket_module.burn_in import BurnIn, chains_first, drift_statistic
+# ======================================================================================================================
+
+# ====== Burn-in Tests =================================================================================================
+# ------ Drift Statistic Tests -----------------------------------------------------------------------------------------
+def synthetic_chains(n_chains=16, chain_length=256, phi=0.8, relaxation=0.0, seed=0):
+    # (chains, chain length) AR(1) chains around 0, plus 'relaxation' * exp(-t / 20) for chains that start away from
+    # their stationary distribution.
+    rng = np.random.default_rng(seed)
+    chains = np.empty((n_chains, chain_length))
+    chains[:, 0] = rng.normal(size=n_chains) / np.sqrt(1 - phi ** 2)
+    for t in range(1, chain_length):
+        chains[:, t] = phi * chains[:, t - 1] + rng.normal(size=n_chains)
+    return chains + relaxation * np.exp(-np.arange(chain_length) / 20)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stationary_chains_do_not_drift(seed):
+    assert abs(drift_statistic(synthetic_chains(seed=seed))) < 4
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_relaxing_chains_drift(seed):
+    assert drift_statistic(synthetic_chains(relaxation=10.0, seed=seed)) > 4
+    # Chains relaxing from below drift the other way.
+    assert drift_statistic(synthetic_chains(relaxation=-10.0, seed=seed)) < -4
+
+
+def test_short_and_constant_chains():
+    assert np.isnan(drift_statistic(np.zeros((1, 100))))
+    assert np.isnan(drift_statistic(np.zeros((8, 3))))
+    assert drift_statistic(np.zeros((8, 100))) == 0.0
+    assert drift_statistic(np.tile(np.linspace(1, 0, 100), (8, 1))) == np.inf
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Sample Layout Tests -------------------------------------------------------------------------------------------
+def test_chain_axis_matches_the_samples():
+    hilbert = nk.hilbert.Spin(s=0.5, N=4)
+    sampler = nk.sampler.MetropolisLocal(hilbert, n_chains=4)
+    vstate = nk.vqs.MCState(sampler, nk.models.RBM(alpha=1), n_samples=32)
+    assert vstate.samples.shape[burn_in.chain_axis] == 4
+    assert vstate.samples.shape[1 - burn_in.chain_axis] == 8
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_chains_first(axis, monkeypatch):
+    monkeypatch.setattr(burn_in, 'chain_axis', axis)
+    chains = np.arange(12).reshape(3, 4)
+    np.testing.assert_array_equal(chains_first(chains if axis == 0 else chains.T), chains)
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ------ Burn-in Callback Tests ----------------------------------------------------------------------------------------
+def fake_driver(chains):
+    # Stand-in for the VMC driver whose log|psi|^2 of the samples are 'chains', in the sample layout of NetKet.
+    samples = chains_first(chains)[..., None]
+    sampler = SimpleNamespace(machine_pow=1)
+    return SimpleNamespace(state=SimpleNamespace(samples=samples, sampler=sampler, n_discard_per_chain=None,
+                                                 log_value=lambda flat_samples: flat_samples[:, 0]))
+
+
+def test_adaptive_discard_follows_the_drift():
+    callback = BurnIn(policy="adaptive", fixed_discard=16, initial_discard=16, max_discard=200, z_tol=4,
+                      sweeps_per_sample=1)
+    driver = fake_driver(synthetic_chains(relaxation=10.0))
+    callback(0, {}, driver)
+    assert callback.discard == driver.state.n_discard_per_chain == 64
+    callback(1, {}, driver)
+    assert callback.discard == 128
+    callback(2, {}, driver)
+    assert callback.discard == 200
+    driver = fake_driver(synthetic_chains())
+    callback(3, {}, driver)
+    assert callback.discard == driver.state.n_discard_per_chain == 100
+    assert callback.info() == {'burn_in_sweeps': 16 + 64 + 128 + 200, 'burn_in_sweeps_fixed': 4 * 16,
+                               'burn_in_drifts': 3}
+
+
+def test_fixed_discard_is_kept():
+    callback = BurnIn(policy="fixed", fixed_discard=16, initial_discard=0, max_discard=200, z_tol=4,
+                      sweeps_per_sample=0.5)
+    driver = fake_driver(synthetic_chains(relaxation=10.0))
+    for step in range(3):
+        callback(step, {}, driver)
+    assert callback.discard == 16 and driver.state.n_discard_per_chain is None
+    assert callback.info()['burn_in_sweeps'] == callback.info()['burn_in_sweeps_fixed'] == 24
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
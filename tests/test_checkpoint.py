@@ -0,0 +1,74 @@
+# ======================================================================================================================
+# Name:                 Checkpoint Tests 'test_checkpoint.py'
+# Description:          1. Resume tests of 'checkpoint.py'. A point is run on a 3x3 lattice with the full summation
+#                          state, then run again from its checkpoint, as after a crash before it was stored.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. netket ("https://www.netket.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+import netket.nn as nknn
+# ======================================================================================================================
+
+# ====== Resume Tests ==================================================================================================
+# The networks of 'neural_network.py' are 'netket.nn.Module' subclasses, which later NetKet versions no longer have.
+if not hasattr(nknn, 'Module'):
+    pytest.skip("the installed NetKet has no 'netket.nn.Module'", allow_module_level=True)
+
+test_parameters = {'length': 3, 'iterations': 6, 'n_values': 3, 'state_backend': "exact", 'early_stopping': False,
+                   'autotune_sampler': False, 'burn_in': "fixed", 'write_lattice_info': False,
+                   'write_hilbert_info': False, 'write_hamiltonian_info': False}
+
+
+@pytest.fixture
+def context(monkeypatch):
+    import parameters
+    for name, value in test_parameters.items():
+        monkeypatch.setattr(parameters, name, value)
+    from HMEX import SimulationContext
+    return SimulationContext()
+
+
+def test_resume_from_checkpoint_of_last_iteration(context, tmp_path):
+    from Function_Tools.Netket_module.checkpoint import PointCheckpoint
+    obs_list = list(context.observables(J=1.0).keys())
+    # Saved after the 3rd and the 6th, the last, iteration.
+    first = PointCheckpoint(path=str(tmp_path), obs_list=obs_list, every=3)
+    log, _, _, _ = context.run(J=1.0, h=0.5, checkpoint=first)
+    log.close()
+    resumed = PointCheckpoint(path=str(tmp_path), obs_list=obs_list, every=3)
+    log, _, vstate, run_info = context.run(J=1.0, h=0.5, checkpoint=resumed)
+    parsed_data = resumed.prepend(log.parsed_data())
+    log.close()
+    assert run_info['resumed_from'] == 6
+    assert run_info['iterations_run'] == 6
+    assert list(parsed_data['iters']) == list(range(6))
+    np.testing.assert_allclose(parsed_data['Energy'], first.recorded_data()['Energy'])
+    assert np.isfinite(log.statistics()['mean'][0])
+    assert vstate.parameters is not None
+
+
+def test_resume_from_checkpoint_within_run(context, tmp_path):
+    from Function_Tools.Netket_module.checkpoint import PointCheckpoint
+    obs_list = list(context.observables(J=1.0).keys())
+    # Interrupted after 4 iterations, the last checkpoint is the one of the 3rd iteration.
+    first = PointCheckpoint(path=str(tmp_path), obs_list=obs_list, every=3)
+    log, _, _, _ = context.run(J=1.0, h=0.5, n_iter=4, checkpoint=first)
+    log.close()
+    resumed = PointCheckpoint(path=str(tmp_path), obs_list=obs_list, every=3)
+    log, _, _, run_info = context.run(J=1.0, h=0.5, checkpoint=resumed)
+    parsed_data = resumed.prepend(log.parsed_data())
+    log.close()
+    assert run_info['resumed_from'] == 3
+    assert run_info['iterations_run'] == 6
+    assert list(parsed_data['iters']) == list(range(6))
+    np.testing.assert_allclose(parsed_data['Energy'][:3], first.recorded_data()['Energy'][:3])
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
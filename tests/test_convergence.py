@@ -0,0 +1,68 @@
+# ======================================================================================================================
+# Name:                 Convergence Monitor Tests 'test_convergence.py'
+# Description:          1. Tests of the stopping rule of 'convergence.py' on synthetic energy traces, fed to the
+#                          callback with a stand-in for the VMC driver.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+from types import SimpleNamespace
+import numpy as np
+from Function_Tools.Netket_module.convergence import ConvergenceMonitor
+# ======================================================================================================================
+
+# ====== Convergence Monitor Tests =====================================================================================
+driver = SimpleNamespace(_loss_name='Energy')
+
+
+def run_monitor(monitor, energies, r_hat=1.0, tau=0.5):
+    # Feeds the energies to the monitor as the driver would. Returns the step at which it stopped the run, or None.
+    for step, energy in enumerate(energies):
+        stats = SimpleNamespace(mean=energy, variance=0.01, R_hat=r_hat, tau_corr=tau)
+        if not monitor(step, {'Energy': stats}, driver):
+            return step
+    return None
+
+
+def test_stops_a_flat_trace_at_min_iterations():
+    monitor = ConvergenceMonitor(window=5, min_iterations=10, rtol=1e-3, variance_tol=1.0, rhat_tol=1.1, tau_tol=5)
+    assert run_monitor(monitor, np.full(30, -10.0)) == 9
+    assert monitor.converged_iteration == 9
+    assert monitor.stop_reason == 'rtol, variance, rhat, tau'
+    assert monitor.info(n_iter=30)['iterations_run'] == 10
+
+
+def test_runs_a_drifting_trace_to_the_maximum():
+    monitor = ConvergenceMonitor(window=5, min_iterations=10, rtol=1e-3)
+    assert run_monitor(monitor, -10.0 - np.arange(30.0)) is None
+    info = monitor.info(n_iter=30)
+    assert not info['converged']
+    assert info['stop_reason'] == 'max_iterations'
+    assert info['iterations_run'] == 30
+
+
+def test_min_iterations_is_at_least_two_windows():
+    monitor = ConvergenceMonitor(window=8, min_iterations=4, rtol=1e-3)
+    assert run_monitor(monitor, np.full(30, -10.0)) == 15
+
+
+def test_final_window_runs_after_convergence():
+    monitor = ConvergenceMonitor(window=5, min_iterations=10, rtol=1e-3, final_window=3)
+    assert run_monitor(monitor, np.full(30, -10.0)) == 12
+    assert monitor.converged_iteration == 9
+    assert monitor.info(n_iter=30)['iterations_run'] == 13
+
+
+def test_rhat_and_tau_criteria():
+    # NaN (not estimated) is not held against the run, a large R-hat is.
+    monitor = ConvergenceMonitor(window=5, min_iterations=10, rhat_tol=1.1, tau_tol=5)
+    assert run_monitor(monitor, np.full(30, -10.0), r_hat=np.nan, tau=np.nan) == 9
+    monitor = ConvergenceMonitor(window=5, min_iterations=10, rhat_tol=1.1)
+    assert run_monitor(monitor, np.full(30, -10.0), r_hat=1.5) is None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
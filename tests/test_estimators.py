@@ -0,0 +1,72 @@
+# ======================================================================================================================
+# Name:                 Estimator Tests 'test_estimators.py'
+# Description:          1. Tests of the online estimator of 'estimators.py': the Welford mean and variance against
+#                          numpy and the blocking error of an autocorrelated AR(1) series against its true error.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+from Function_Tools.Netket_module.estimators import OnlineEstimator, estimate, required_iterations
+# ======================================================================================================================
+
+# ====== Online Estimator Tests ========================================================================================
+def ar1_series(n, phi, seed=0):
+    # x_k = phi x_(k-1) + noise, started in the stationary distribution.
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(size=n)
+    x = np.empty(n)
+    x[0] = noise[0] / np.sqrt(1 - phi ** 2)
+    for k in range(1, n):
+        x[k] = phi * x[k - 1] + noise[k]
+    return x
+
+
+def test_welford_matches_numpy():
+    values = np.random.default_rng(1).normal(loc=[-3.0, 0.5], scale=[2.0, 0.1], size=(137, 2))
+    estimator = OnlineEstimator(n_fields=2)
+    for sample in values:
+        estimator.update(sample)
+    assert estimator.count == 137
+    np.testing.assert_allclose(estimator.mean, values.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(estimator.variance, values.var(axis=0, ddof=1), rtol=1e-12)
+
+
+def test_uncorrelated_series_has_the_naive_error():
+    values = np.random.default_rng(2).normal(size=(4096, 1))
+    statistics = estimate(values)
+    naive_error = values.std(ddof=1) / np.sqrt(len(values))
+    # The largest error of the block levels is on the safe side of the naive error, but not far from it.
+    assert naive_error <= statistics['error'][0] < 1.5 * naive_error
+    assert statistics['tau'][0] < 1
+
+
+def test_blocking_error_of_an_ar1_series():
+    phi, n = 0.9, 2 ** 14
+    values = ar1_series(n, phi)
+    statistics = estimate(values[:, None])
+    # Error of the mean of an AR(1) series: sqrt(variance / n * (1 + phi) / (1 - phi)), tau = phi / (1 - phi).
+    true_error = np.sqrt(1 / (1 - phi ** 2) / n * (1 + phi) / (1 - phi))
+    assert statistics['error'][0] == pytest.approx(true_error, rel=0.3)
+    assert statistics['tau'][0] == pytest.approx(phi / (1 - phi), rel=0.5)
+    # The naive error of the single samples is about sqrt(19) times too small.
+    assert values.std(ddof=1) / np.sqrt(n) < true_error / 3
+
+
+def test_monte_carlo_error_is_a_lower_bound():
+    values = np.zeros((64, 1))
+    statistics = estimate(values, errors=np.full((64, 1), 0.8))
+    assert statistics['error'][0] == pytest.approx(0.8 / np.sqrt(64))
+
+
+def test_required_iterations():
+    assert required_iterations(error=0.02, count=100, target_error=0.01) == 400
+    assert required_iterations(error=np.nan, count=100, target_error=0.01) is None
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
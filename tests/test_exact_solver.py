@@ -0,0 +1,59 @@
+# ======================================================================================================================
+# Name:                 Exact Solver Tests 'test_exact_solver.py'
+# Description:          1. Tests of the exact reference of 'exact_solver.py' on a 2x2 lattice: the diagonal and the
+#                          Lanczos solver against 'scipy.sparse.linalg.eigsh' of the summed Hamiltonian.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. scipy ("https://scipy.org/")
+#                       4. netket ("https://www.netket.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+import netket as nk
+from scipy.sparse.linalg import eigsh
+from netket.operator.spin import sigmaz
+from Function_Tools.Netket_module.exact_solver import ExactReference
+from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian
+from Function_Tools.Observables.observables import ParametricObservables
+# ======================================================================================================================
+
+# ====== Exact Reference Tests =========================================================================================
+graph = nk.graph.Square(2, pbc=True)
+hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+J_values, h_values = [-1.0, 1.0], [0.5, 1.0, 3.0]
+
+
+def eigsh_ground_state(J, h):
+    # Lowest eigenvalue, its vector and whether the next eigenvalue is degenerate with it.
+    bond = sum(sigmaz(hilbert, i) * sigmaz(hilbert, j) for i, j in graph.edges())
+    field = sum(sigmaz(hilbert, i) for i in graph.nodes())
+    energies, vectors = eigsh(((-J / 4) * bond + (-h / 2) * field).to_sparse(), k=2, which='SA')
+    return energies[0], vectors[:, 0], np.isclose(energies[0], energies[1])
+
+
+@pytest.mark.parametrize("solver", ["diagonal", "lanczos"])
+def test_reference_matches_eigsh(solver):
+    observables = ParametricObservables(hilbert=hilbert, graph=graph, operator="local")
+    reference = ExactReference(hamiltonian=ParametricHamiltonian(hilbert=hilbert, graph=graph, operator="local"),
+                               observables=observables)
+    assert reference.diagonal
+    reference.diagonal = solver == "diagonal"
+    results = reference.solve(J_values=J_values, h_values=h_values)
+    for j_index, J in enumerate(J_values):
+        msz = observables(J=J)['MSZ'].to_sparse()
+        for h_index, h in enumerate(h_values):
+            energy, vector, degenerate = eigsh_ground_state(J, h)
+            assert results['Energy'][j_index, h_index] == pytest.approx(energy, abs=1e-8)
+            if solver == "diagonal":
+                assert (results['degeneracy'][j_index, h_index] > 1) == degenerate
+            # A degenerate ground state (the Neel states of J < 0 in a weak field) has no unique observables.
+            if not degenerate:
+                assert results['MSZ'][j_index, h_index] == pytest.approx(np.vdot(vector, msz @ vector).real, abs=1e-6)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
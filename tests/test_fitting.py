@@ -0,0 +1,54 @@
+# ======================================================================================================================
+# Name:                 Fitting Tests 'test_fitting.py'
+# Description:          1. Tests of the batched Levenberg-Marquardt fit of 'fitting_module.py' against the known
+#                          parameters of synthetic tanh curves and against 'scipy.optimize.curve_fit'.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. scipy ("https://scipy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+from scipy.optimize import curve_fit
+from Function_Tools.PostProcessing_Module.fitting_module import batched_fit, tanh_model, tanh_guess
+# ======================================================================================================================
+
+# ====== Batched Fit Tests =============================================================================================
+h_values = np.linspace(0, 6, 61)
+# One column per J, the step moves and sharpens from column to column.
+true_param = np.array([[0.25, 1.0, 1.0, 0.25], [0.25, 2.0, 5.0, 0.25], [0.2, 4.0, 16.0, 0.3]])
+
+
+def curves(noise=0.0, seed=0):
+    msz = tanh_model(h_values[None, :], *[true_param[:, k, None] for k in range(4)])
+    return msz + noise * np.random.default_rng(seed).normal(size=msz.shape)
+
+
+def test_recovers_the_parameters_of_every_column():
+    param, param_cov, info = batched_fit(tanh_model, h_values, curves(), p0=tanh_guess)
+    assert np.all(info['converged'])
+    np.testing.assert_allclose(param, true_param, rtol=1e-6, atol=1e-8)
+    assert list(info['n_points']) == [61, 61, 61]
+
+
+def test_matches_curve_fit_on_noisy_data():
+    msz = curves(noise=0.005)
+    param, param_cov, info = batched_fit(tanh_model, h_values, msz, p0=tanh_guess)
+    for c in range(len(msz)):
+        param_ref, cov_ref = curve_fit(tanh_model, h_values, msz[c], p0=tanh_guess(h_values, msz[c:c + 1])[0])
+        np.testing.assert_allclose(param[c], param_ref, rtol=1e-4)
+        np.testing.assert_allclose(np.sqrt(np.diag(param_cov[c])), np.sqrt(np.diag(cov_ref)), rtol=1e-2)
+
+
+def test_nan_values_are_ignored():
+    msz = curves()
+    msz[1, ::3] = np.nan
+    param, param_cov, info = batched_fit(tanh_model, h_values, msz, p0=tanh_guess)
+    assert info['n_points'][1] == 40
+    np.testing.assert_allclose(param[1], true_param[1], rtol=1e-6, atol=1e-8)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
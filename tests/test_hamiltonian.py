@@ -0,0 +1,53 @@
+# ======================================================================================================================
+# Name:                 Hamiltonian Tests 'test_hamiltonian.py'
+# Description:          1. Tests that 'ParametricHamiltonian' gives the same matrix as the Hamiltonian summed from the
+#                          NetKet spin operators, on the rescaled packed operator, on the public sum and on the
+#                          diagonal operator.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. netket ("https://www.netket.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+import netket as nk
+from netket.operator.spin import sigmaz
+from Function_Tools.Netket_module.hamiltonian import ParametricHamiltonian, RescaledLocalOperator
+# ======================================================================================================================
+
+# ====== Hamiltonian Tests =============================================================================================
+graph = nk.graph.Square(3, pbc=True)
+hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+points = [(-1.0, 0.5), (-1.0, 0.0), (0.0, 1.0), (2.0, 1.5)]
+
+
+def summed_hamiltonian(J, h):
+    bond = sum(sigmaz(hilbert, i) * sigmaz(hilbert, j) for i, j in graph.edges())
+    field = sum(sigmaz(hilbert, i) for i in graph.nodes())
+    return (-J / 4) * bond + (-h / 2) * field
+
+
+@pytest.mark.parametrize("rescaled", [True, False])
+def test_local_hamiltonian_matches_sum(rescaled, monkeypatch):
+    if not rescaled:
+        monkeypatch.setattr(RescaledLocalOperator, "supports", classmethod(lambda cls, template: False))
+    parametric = ParametricHamiltonian(hilbert=hilbert, graph=graph, operator="local")
+    if rescaled and parametric.terms is None:
+        pytest.skip("The installed NetKet does not support rescaling the packed operator.")
+    for J, h in points:
+        np.testing.assert_allclose(parametric(J=J, h=h).to_dense(), summed_hamiltonian(J, h).to_dense(), atol=1e-12)
+
+
+def test_diagonal_hamiltonian_matches_sum():
+    parametric = ParametricHamiltonian(hilbert=hilbert, graph=graph, operator="diagonal")
+    for J, h in points:
+        summed = summed_hamiltonian(J, h).to_dense()
+        np.testing.assert_allclose(summed, np.diag(np.diag(summed)), atol=1e-12)
+        np.testing.assert_allclose(parametric(J=J, h=h).to_dense(), summed, atol=1e-12)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,57 @@
+# ======================================================================================================================
+# Name:                 Neural Network Tests 'test_neural_network.py'
+# Description:          1. Tests of the weights and the output of the G-CNN of 'neural_network.py' for the network
+#                          dtypes.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. jax ("https://jax.readthedocs.io/en/latest/index.html")
+#                       4. netket ("https://www.netket.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pytest
+import jax
+import netket as nk
+from netket.models import GCNN
+from Function_Tools.Netket_module.neural_network import neural_network
+# ======================================================================================================================
+
+# ====== G-CNN Tests ===================================================================================================
+graph = nk.graph.Square(2, pbc=True)
+hilbert = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+
+
+def weights_and_output(model):
+    samples = hilbert.all_states()
+    variables = model.init(jax.random.PRNGKey(0), samples)
+    dtypes = {leaf.dtype for leaf in jax.tree_util.tree_leaves(variables['params'])}
+    return dtypes, model.apply(variables, samples).dtype
+
+
+@pytest.fixture(autouse=True)
+def small_gcnn(monkeypatch):
+    import parameters
+    monkeypatch.setattr(parameters, 'feature_dims', [2, 2], raising=False)
+    monkeypatch.setattr(parameters, 'num_layers', 2, raising=False)
+
+
+def test_default_dtype_is_the_netket_gcnn():
+    model = neural_network(graph, network_type='G-CNN', network_dtype="complex128")
+    default = GCNN(symmetries=graph.automorphisms(), layers=2, features=(2, 2))
+    assert weights_and_output(model) == weights_and_output(default)
+    assert weights_and_output(model) == ({np.dtype(np.float64)}, np.dtype(np.complex128))
+
+
+@pytest.mark.parametrize("network_dtype, complex_output", [("float64", False), ("float32", False), ("complex64", True)])
+def test_explicit_dtype_sets_the_weights(network_dtype, complex_output):
+    dtypes, output_dtype = weights_and_output(neural_network(graph, network_type='G-CNN', network_dtype=network_dtype))
+    assert dtypes == {np.dtype(network_dtype)}
+    # Real weights give a real log amplitude.
+    assert np.issubdtype(output_dtype, np.complexfloating) == complex_output
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,72 @@
+# ======================================================================================================================
+# Name:                 Observable Schedule Tests 'test_observable_schedule.py'
+# Description:          1. Tests of the iterations on which 'observable_schedule.py' evaluates an observable, with and
+#                          without a converged monitor, fed to the callback with a stand-in for the VMC driver.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+from types import SimpleNamespace
+import pytest
+from Function_Tools.Observables.observable_schedule import ObservableSchedule, observable_schedule
+# ======================================================================================================================
+
+# ====== Observable Schedule Tests =====================================================================================
+driver = SimpleNamespace(state=SimpleNamespace(expect=lambda op: op))
+
+
+def evaluated_steps(schedule, n_iter, monitor=None, converged_at=None):
+    # {name: [steps on which the observable was in the log data]}. The monitor converges at step 'converged_at'.
+    steps = {name: [] for name in schedule.obs}
+    for step in range(n_iter):
+        if monitor is not None:
+            monitor.converged = converged_at is not None and step > converged_at
+        log_data = {}
+        assert schedule(step, log_data, driver)
+        for name in log_data:
+            steps[name].append(step)
+    return steps
+
+
+def test_every_k_and_window():
+    obs = {'MSZ': 'MSZ', 'MSX': 'MSX', 'chi_corrZ': 'chi_corrZ', 'MSY': 'MSY'}
+    schedule = ObservableSchedule(obs=obs, schedule={'MSX': 3, 'chi_corrZ': "window", 'MSY': 1}, window_start=8)
+    steps = evaluated_steps(schedule, n_iter=10)
+    # Not listed means every iteration, and the averaging window (steps 8 and 9) is always evaluated.
+    assert steps['MSZ'] == steps['MSY'] == list(range(10))
+    assert steps['MSX'] == [0, 3, 6, 8, 9]
+    assert steps['chi_corrZ'] == [8, 9]
+    assert schedule.n_evaluated == {'MSZ': 10, 'MSX': 5, 'chi_corrZ': 2, 'MSY': 10}
+
+
+def test_converged_monitor_opens_the_window():
+    monitor = SimpleNamespace(converged=False)
+    schedule = ObservableSchedule(obs={'chi_corrZ': 'chi_corrZ'}, schedule={'chi_corrZ': "window"}, window_start=20,
+                                  monitor=monitor)
+    assert evaluated_steps(schedule, n_iter=10, monitor=monitor, converged_at=4)['chi_corrZ'] == [5, 6, 7, 8, 9]
+    # A run that does not converge only has the last iterations.
+    schedule = ObservableSchedule(obs={'chi_corrZ': 'chi_corrZ'}, schedule={'chi_corrZ': "window"}, window_start=7,
+                                  monitor=monitor)
+    assert evaluated_steps(schedule, n_iter=10, monitor=monitor)['chi_corrZ'] == [7, 8, 9]
+
+
+def test_window_start_from_the_parameters(monkeypatch):
+    import parameters
+    monkeypatch.setattr(parameters, 'observable_schedule', {'MSX': "window"})
+    monkeypatch.setattr(parameters, 'n_values', 4)
+    schedule = observable_schedule(obs={'MSX': 'MSX'}, n_iter=10)
+    assert evaluated_steps(schedule, n_iter=10)['MSX'] == [6, 7, 8, 9]
+    # More averaged values than iterations evaluates every iteration.
+    assert observable_schedule(obs={'MSX': 'MSX'}, n_iter=2).window_start == 0
+
+
+@pytest.mark.parametrize("every", [0, -2, 1.5, "last"])
+def test_unknown_schedule_raises(every):
+    with pytest.raises(ValueError, match="Observable schedule of 'MSX' not recognized"):
+        ObservableSchedule(obs={'MSX': 'MSX'}, schedule={'MSX': every}, window_start=0)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,42 @@
+# ======================================================================================================================
+# Name:                 Output Pipeline Tests 'test_output_pipeline.py'
+# Description:          1. Tests that the background writer of 'output_pipeline.py' reports its errors and that a
+#                          writer that died raises an error instead of blocking the sweep.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import pytest
+from Function_Tools.FileWriting_GraphPloting_Module.output_pipeline import OutputPipeline
+# ======================================================================================================================
+
+# ====== Output Pipeline Tests =========================================================================================
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_flush_raises_writer_error(backend, tmp_path, monkeypatch):
+    # The output paths of the parameters are relative, the writer creates its directories under 'tmp_path'.
+    monkeypatch.chdir(tmp_path)
+    pipeline = OutputPipeline(backend=backend, max_queue_size=1, poll_interval=0.1)
+    # Not a data frame, so writing the point fails in the writer.
+    pipeline.submit(parsed_data=None, j=1.0, h=0.5)
+    with pytest.raises(RuntimeError, match="1 point outputs failed"):
+        pipeline.flush()
+    pipeline.close()
+    assert not pipeline._worker.is_alive()
+
+
+def test_dead_writer_does_not_block():
+    pipeline = OutputPipeline(backend="process", max_queue_size=1, poll_interval=0.1)
+    pipeline._worker.terminate()
+    pipeline._worker.join()
+    pipeline.submit(parsed_data=None, j=1.0, h=0.5)
+    # The queue is full and nobody takes the point.
+    with pytest.raises(RuntimeError, match="output writer stopped"):
+        pipeline.submit(parsed_data=None, j=1.0, h=0.5)
+    with pytest.raises(RuntimeError, match="output writer stopped"):
+        pipeline.close()
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
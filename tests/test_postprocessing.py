@@ -0,0 +1,42 @@
+# ======================================================================================================================
+# Name:                 Post Processing Tests 'test_postprocessing.py'
+# Description:          1. Tests of the magnetic susceptibility files of 'PostProcessing.py'.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+from Function_Tools.PostProcessing_Module.PostProcessing import susceptibilityFrame, susceptibilityGradientFrame
+# ======================================================================================================================
+
+# ====== Susceptibility Tests ==========================================================================================
+# A non-uniform grid, as from an adaptive sweep.
+h_values = np.array([0.0, 0.5, 0.75, 1.0, 2.0])
+J_columns = ['j=-1.0', 'j=1.0']
+m = np.stack([h_values ** 2, -3 * h_values])
+
+
+def test_chi_keeps_the_forward_difference_layout():
+    chi_df = susceptibilityFrame(h_values=h_values, J_columns=J_columns, m=m)
+    assert list(chi_df.columns) == ['#h', 'dh', 'm-j=-1.0', 'dm-j=-1.0', 'chi-j=-1.0', 'm-j=1.0', 'dm-j=1.0',
+                                    'chi-j=1.0']
+    assert len(chi_df) == len(h_values) - 1
+    np.testing.assert_allclose(chi_df['#h'], h_values[:-1])
+    np.testing.assert_allclose(chi_df['chi-j=-1.0'], h_values[1:] + h_values[:-1])
+    np.testing.assert_allclose(chi_df['dm-j=1.0'], 3 * np.diff(h_values))
+
+
+def test_chi_gradient_at_every_h():
+    chi_df = susceptibilityGradientFrame(h_values=h_values, J_columns=J_columns, m=m)
+    assert list(chi_df.columns) == ['#h'] + J_columns
+    assert len(chi_df) == len(h_values)
+    # Second order central differences are exact for m = h^2 in the interior, also on a non-uniform grid.
+    np.testing.assert_allclose(chi_df['j=-1.0'][1:-1], 2 * h_values[1:-1])
+    np.testing.assert_allclose(chi_df['j=1.0'], 3.0)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
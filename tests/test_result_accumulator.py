@@ -0,0 +1,62 @@
+# ======================================================================================================================
+# Name:                 Result Accumulator Tests 'test_result_accumulator.py'
+# Description:          1. Tests that 'ResultAccumulator' places the points of a sweep, averages their last iterations
+#                          and exports them in the layouts of the per J and J-parsed files.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+from Function_Tools.FileWriting_GraphPloting_Module.result_accumulator import ResultAccumulator
+# ======================================================================================================================
+
+# ====== Result Accumulator Tests ======================================================================================
+def parsed_data(n_iter, offset=0.0):
+    iters = np.arange(n_iter)
+    return pd.DataFrame({'iters': iters, 'Energy': -1.0 - 0.1 * iters + offset, 'MSZ': 0.5 + 0.01 * iters})
+
+
+def accumulator():
+    return ResultAccumulator(J_values=[-1.0, 1.0], h_values=[0.0, 0.5], n_iter=6, fields=['Energy', 'MSZ'],
+                             n_values=3)
+
+
+def test_points_and_means():
+    results = accumulator()
+    data = parsed_data(6)
+    # An iteration skipped by the observable schedule.
+    data.loc[4, 'MSZ'] = np.nan
+    results.add_point(j_index=1, h_index=0, parsed_data=data, info={'Energy_error': 0.02, 'MSZ_error': 0.003})
+    results.add_point(j_index=0, h_index=1, parsed_data=parsed_data(4, offset=1.0), average=False)
+    np.testing.assert_allclose(results.means[1, 0], [np.mean(-1.0 - 0.1 * np.arange(3, 6)), 0.5 + 0.01 * 4])
+    np.testing.assert_allclose(results.errors[1, 0], [0.02, 0.003])
+    assert np.all(np.isnan(results.means[0, 1])) and np.all(np.isnan(results.errors[0, 1]))
+    pd.testing.assert_frame_equal(results.point_frame(1, 0), data, check_dtype=False)
+    pd.testing.assert_frame_equal(results.point_frame(0, 1), parsed_data(4, offset=1.0), check_dtype=False)
+
+
+def test_export_layouts():
+    results = accumulator()
+    results.add_point(j_index=0, h_index=0, parsed_data=parsed_data(6), info={'Energy_error': 0.02})
+    results.add_point(j_index=0, h_index=1, parsed_data=parsed_data(4))
+    combined = results.combined_frames(j_index=0)
+    assert list(combined['Energy'].columns) == ['#iters', 'h=0.0', 'h=0.5']
+    assert len(combined['Energy']) == 6
+    assert np.all(np.isnan(combined['MSZ']['h=0.5'][4:]))
+    jh = results.jh_frames()
+    assert list(jh['MSZ'].columns) == ['#h', 'j=-1.0', 'j=1.0']
+    np.testing.assert_allclose(jh['Energy']['j=-1.0'], [np.mean(-1.0 - 0.1 * np.arange(3, 6)),
+                                                        np.mean(-1.0 - 0.1 * np.arange(1, 4))])
+    assert np.all(np.isnan(jh['Energy']['j=1.0']))
+    errors = results.jh_frames(errors=True)
+    assert list(errors.keys()) == ['Energy_error', 'MSZ_error']
+    assert errors['Energy_error']['j=-1.0'][0] == 0.02
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
@@ -0,0 +1,68 @@
+# ======================================================================================================================
+# Name:                 Result Cube Tests 'test_result_cube.py'
+# Description:          1. Tests that points written into the memory-mapped cube of 'result_cube.py' read back the same,
+#                          also after the cube is opened again, and the means of the last iterations.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+#                       2. numpy ("https://numpy.org/")
+#                       3. pandas ("https://pandas.pydata.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import numpy as np
+import pandas as pd
+from Function_Tools.FileWriting_GraphPloting_Module.result_cube import ResultCube
+# ======================================================================================================================
+
+# ====== Result Cube Tests =============================================================================================
+fields = ['Energy', 'MSZ']
+
+
+def parsed_data(iters, offset=0.0):
+    iters = np.asarray(iters)
+    return pd.DataFrame({'iters': iters, 'Energy': -1.0 - 0.1 * iters + offset, 'MSZ': 0.5 + 0.01 * iters})
+
+
+def test_points_read_back_after_reopening(tmp_path):
+    cube = ResultCube.create(path=str(tmp_path), J_values=[-1.0, 1.0], h_values=[0.0, 0.5, 1.0], n_iter=6,
+                             fields=fields)
+    cube.write_point(j_index=1, h_index=2, parsed_data=parsed_data(range(6)))
+    # An early stopped point, its last iterations stay NaN.
+    cube.write_point(j_index=0, h_index=0, parsed_data=parsed_data(range(4), offset=3.0))
+    del cube
+    cube = ResultCube(str(tmp_path))
+    np.testing.assert_allclose(cube.J, [-1.0, 1.0])
+    np.testing.assert_allclose(cube.h, [0.0, 0.5, 1.0])
+    pd.testing.assert_frame_equal(cube.point(1, 2), parsed_data(range(6)), check_dtype=False)
+    pd.testing.assert_frame_equal(cube.point(0, 0), parsed_data(range(4), offset=3.0), check_dtype=False)
+    assert np.all(np.isnan(cube.field('Energy')[0, 0, 4:]))
+    assert np.all(np.isnan(cube.data[0, 1]))
+    assert list(np.asarray(cube.lengths).ravel()) == [4, 0, 0, 0, 0, 6]
+    assert not cube.is_complete()
+
+
+def test_means_of_the_last_iterations(tmp_path):
+    cube = ResultCube.create(path=str(tmp_path), J_values=[-1.0], h_values=[0.0, 0.5], n_iter=6, fields=fields)
+    data = parsed_data(range(6))
+    # An iteration skipped by the observable schedule.
+    data.loc[5, 'MSZ'] = np.nan
+    cube.write_point(j_index=0, h_index=0, parsed_data=data)
+    cube.write_point(j_index=0, h_index=1, parsed_data=parsed_data(range(4)))
+    means = cube.means(n_values=3)
+    np.testing.assert_allclose(means[0, 0], [np.mean(-1.0 - 0.1 * np.arange(3, 6)), 0.5 + 0.01 * 3.5])
+    np.testing.assert_allclose(means[0, 1], [np.mean(-1.0 - 0.1 * np.arange(1, 4)), 0.5 + 0.01 * 2])
+    assert cube.is_complete()
+
+
+def test_trace_of_the_last_iterations_keeps_its_length(tmp_path):
+    # A point that only logged its last iterations ends at the right iteration.
+    cube = ResultCube.create(path=str(tmp_path), J_values=[-1.0], h_values=[0.0], n_iter=6, fields=fields)
+    cube.write_point(j_index=0, h_index=0, parsed_data=parsed_data(range(3, 6)))
+    assert cube.lengths[0, 0] == 6
+    assert np.all(np.isnan(cube.point(0, 0)['Energy'][:3]))
+    np.testing.assert_allclose(cube.means(n_values=3)[0, 0, 0], np.mean(-1.0 - 0.1 * np.arange(3, 6)))
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
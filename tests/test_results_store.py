@@ -0,0 +1,47 @@
+# ======================================================================================================================
+# Name:                 Results Store Tests 'test_results_store.py'
+# Description:          1. Tests which parameters change the hash of a stored point in 'results_store.py'.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import pytest
+from Function_Tools.Sweep_Module.results_store import point_key
+# ======================================================================================================================
+
+# ====== Point Hash Tests ==============================================================================================
+@pytest.fixture
+def parameters(monkeypatch):
+    import parameters
+    for name, value in {'continuation': False, 'persistent_chains': False, 'autotune_sampler': False,
+                        'sweep_backend': "local", 'n_workers': 1}.items():
+        monkeypatch.setattr(parameters, name, value)
+    return parameters
+
+
+def key_changes(parameters, monkeypatch, name, value):
+    before = point_key(J=-1.0, h=0.5)
+    monkeypatch.setattr(parameters, name, value)
+    return point_key(J=-1.0, h=0.5) != before
+
+
+def test_target_error_is_hashed(parameters, monkeypatch):
+    assert key_changes(parameters, monkeypatch, 'target_error', 1e-4)
+
+
+@pytest.mark.parametrize("name, value", [('n_workers', 4), ('h_ex_increment', 0.01), ('sweep_backend', "mpi")])
+def test_independent_points_ignore_grid_and_workers(parameters, monkeypatch, name, value):
+    assert not key_changes(parameters, monkeypatch, name, value)
+
+
+@pytest.mark.parametrize("chaining", ['continuation', 'persistent_chains'])
+@pytest.mark.parametrize("name, value", [('n_workers', 4), ('h_ex_increment', 0.01)])
+def test_chained_points_hash_grid_and_workers(parameters, monkeypatch, chaining, name, value):
+    monkeypatch.setattr(parameters, chaining, True)
+    assert key_changes(parameters, monkeypatch, name, value)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================
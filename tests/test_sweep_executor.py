@@ -0,0 +1,53 @@
+# ======================================================================================================================
+# Name:                 Sweep Executor Tests 'test_sweep_executor.py'
+# Description:          1. Smoke tests of the worker setup of 'sweep_executor.py'. Every test imports jax in a child
+#                          process, since XLA reads the flags of the worker only once, when jax is imported.
+#                       2. Tests that the core blocks of the workers never overlap.
+# Library Dependencies: 1. pytest ("https://docs.pytest.org/")
+# Author:               Avishek Singh
+# Date:                 18.10.2026
+# Latest Update:        18.10.2026
+# Version:              1.0.0
+# ======================================================================================================================
+
+# ====== Importing Libraries ===========================================================================================
+import os
+import subprocess
+import sys
+import pytest
+# ======================================================================================================================
+
+# ====== Worker Setup Tests ============================================================================================
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+child_script = """
+import os
+from Function_Tools.Sweep_Module.sweep_executor import cpu_blocks, limit_process_resources
+limit_process_resources(cpu_block=cpu_blocks(n_workers=1, threads_per_worker={threads})[0], pin_affinity=True)
+assert all(flag.startswith('--') for flag in os.environ.get('XLA_FLAGS', '').split()), os.environ['XLA_FLAGS']
+import jax.numpy as jnp
+print(float(jnp.sum(jnp.arange(4.0))))
+"""
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+def test_worker_flags_import_jax(threads):
+    environment = dict(os.environ, PYTHONPATH=project_root)
+    environment.pop("XLA_FLAGS", None)
+    result = subprocess.run([sys.executable, "-c", child_script.format(threads=threads)], cwd=project_root,
+                            env=environment, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "6.0"
+
+
+def test_cpu_blocks_do_not_overlap(monkeypatch, capsys):
+    from Function_Tools.Sweep_Module.sweep_executor import cpu_blocks
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(4)), raising=False)
+    assert cpu_blocks(n_workers=2) == [[0, 1], [2, 3]]
+    assert cpu_blocks(n_workers=3) == [[0], [1], [2]]
+    # 3 workers x 2 threads do not fit on 4 cores, every worker gets 1.
+    assert cpu_blocks(n_workers=3, threads_per_worker=2) == [[0], [1], [2]]
+    assert "oversubscribe" in capsys.readouterr().out
+    with pytest.raises(ValueError, match="5 workers"):
+        cpu_blocks(n_workers=5)
+# ----------------------------------------------------------------------------------------------------------------------
+# ======================================================================================================================